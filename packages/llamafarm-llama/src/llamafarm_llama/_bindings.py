@@ -962,6 +962,33 @@ def ensure_backend():
         _backend_initialized = True
 
 
+# NUMA strategy currently applied to this process (None = not initialized)
+_numa_strategy = None
+
+
+def ensure_numa(strategy: int):
+    """Apply a NUMA strategy once per process.
+
+    llama.cpp reads the NUMA topology a single time, so only the first
+    strategy requested takes effect; later calls with a different one are
+    ignored with a warning.
+
+    Args:
+        strategy: ggml_numa_strategy value (1 = distribute, 2 = isolate,
+            3 = numactl, 4 = mirror).
+    """
+    global _numa_strategy
+    ensure_backend()
+    if _numa_strategy is None:
+        get_lib().llama_numa_init(strategy)
+        _numa_strategy = strategy
+        logger.info(f"llama.cpp NUMA strategy set to {strategy}")
+    elif _numa_strategy != strategy:
+        logger.warning(
+            f"NUMA strategy already set to {_numa_strategy}, ignoring {strategy}"
+        )
+
+
 def set_llama_log_level(level: int):
     """Set the log level for llama.cpp output.
 
@@ -17,7 +17,7 @@ from typing import (
     Union,
 )
 
-from ._bindings import ensure_backend, ffi, get_lib, get_mtmd_lib
+from ._bindings import ensure_backend, ensure_numa, ffi, get_lib, get_mtmd_lib
 from .types import (
     ChatCompletionChunk,
     ChatCompletionResponse,
@@ -51,6 +51,21 @@ class Llama:
     GGML_TYPE_Q5_1 = 7
     GGML_TYPE_Q8_0 = 8   # 8-bit quantization - balanced
 
+    # ggml_numa_strategy values for spreading CPU inference across NUMA nodes
+    NUMA_STRATEGY_MAP = {
+        "distribute": 1,  # Spread threads and pages evenly across nodes
+        "isolate": 2,     # Keep everything on the node the process started on
+        "numactl": 3,     # Follow the CPU map set by numactl
+        "mirror": 4,
+    }
+
+    # llama_split_mode values for spreading a model across multiple GPUs
+    SPLIT_MODE_MAP = {
+        "none": 0,   # Single GPU (main_gpu)
+        "layer": 1,  # Split whole layers and KV cache across GPUs (default)
+        "row": 2,    # Split rows of each layer across GPUs
+    }
+
     # Map string names to enum values
     GGML_TYPE_MAP = {
         "f32": GGML_TYPE_F32,
@@ -74,14 +89,17 @@ class Llama:
         n_gpu_layers: int = 0,
         main_gpu: int = 0,
         tensor_split: Optional[List[float]] = None,
+        split_mode: Optional[str] = None,  # Multi-GPU split ("none", "layer", "row")
         vocab_only: bool = False,
         use_mmap: bool = True,
         use_mlock: bool = False,
+        numa: Optional[str] = None,  # NUMA strategy (e.g., "distribute")
         seed: int = -1,
         rope_freq_base: float = 0.0,
         rope_freq_scale: float = 0.0,
         embedding: bool = False,
         flash_attn: bool = True,  # Enable by default for faster inference
+        offload_kqv: bool = True,  # Keep the KV cache on the GPU
         cache_type_k: Optional[str] = None,  # KV cache key quantization (e.g., "q4_0", "q8_0", "f16")
         cache_type_v: Optional[str] = None,  # KV cache value quantization (e.g., "q4_0", "q8_0", "f16")
         verbose: bool = True,
@@ -102,14 +120,22 @@ class Llama:
             n_gpu_layers: Number of layers to offload to GPU. -1 = all.
             main_gpu: Main GPU to use.
             tensor_split: How to split tensors across GPUs.
+            split_mode: How to split the model across GPUs. Options: "none",
+                        "layer" (llama.cpp default), "row". "row" is usually
+                        fastest on two GPUs joined by NVLink.
             vocab_only: Only load vocabulary.
             use_mmap: Use memory mapping.
             use_mlock: Lock model in memory.
+            numa: NUMA strategy for CPU inference on multi-socket hosts. Options:
+                  "distribute", "isolate", "numactl", "mirror". Applied once per
+                  process, before the first model is loaded.
             seed: Random seed. -1 = random.
             rope_freq_base: RoPE frequency base.
             rope_freq_scale: RoPE frequency scale.
             embedding: Enable embedding mode.
             flash_attn: Use flash attention for faster inference.
+            offload_kqv: Keep the KV cache and attention on the GPU. Decode is
+                         memory-bandwidth bound, so disable only to save VRAM.
             cache_type_k: KV cache key quantization type. Options: "f32", "f16" (default),
                           "q8_0", "q4_0". Lower precision = less memory but slightly
                           reduced quality. "q4_0" can reduce KV cache memory by ~4x.
@@ -123,6 +149,13 @@ class Llama:
         """
         # Ensure backend is initialized
         ensure_backend()
+        if numa:
+            if numa not in self.NUMA_STRATEGY_MAP:
+                raise ValueError(
+                    f"Invalid numa strategy '{numa}'. "
+                    f"Valid options: {list(self.NUMA_STRATEGY_MAP.keys())}"
+                )
+            ensure_numa(self.NUMA_STRATEGY_MAP[numa])
 
         self._lib = get_lib()
         self._verbose = verbose
@@ -151,6 +184,13 @@ class Llama:
             n_gpu_layers = 999  # Offload all layers to GPU
         model_params.n_gpu_layers = n_gpu_layers
         model_params.main_gpu = main_gpu
+        if split_mode is not None:
+            if split_mode not in self.SPLIT_MODE_MAP:
+                raise ValueError(
+                    f"Invalid split_mode '{split_mode}'. "
+                    f"Valid options: {list(self.SPLIT_MODE_MAP.keys())}"
+                )
+            model_params.split_mode = self.SPLIT_MODE_MAP[split_mode]
         model_params.vocab_only = vocab_only
         model_params.use_mmap = use_mmap
         model_params.use_mlock = use_mlock
@@ -189,7 +229,7 @@ class Llama:
         # Use auto (-1) by default to let llama.cpp decide based on hardware
         ctx_params.flash_attn_type = 1 if flash_attn else -1
         # Offload KV cache to GPU (critical for performance)
-        ctx_params.offload_kqv = True
+        ctx_params.offload_kqv = offload_kqv
         # Offload operations to GPU
         ctx_params.op_offload = True
 
@@ -306,7 +346,12 @@ class Llama:
 
             # Sample one token to warm up the sampler path
             self._create_sampler(temperature=0.7, top_p=0.95, top_k=40)
-            self._sample_token()
+            token = self._sample_token()
+
+            # Decode it as a single-token batch. Generation steps use different
+            # (matrix-vector) kernels than prompt processing, so without this the
+            # first real request still pays for compiling them.
+            self._decode_batch([token])
 
             # Clear state for real inference
             self._lib.llama_memory_clear(self._memory, True)
@@ -660,6 +705,7 @@ class Llama:
             generated_tokens = []
             generated_text = ""
             finish_reason = "length"
+            stop_window = max(map(len, stop), default=0) if stop else 0
 
             for _ in range(max_tokens):
                 token = self._sample_token()
@@ -673,10 +719,11 @@ class Llama:
                 text = self.detokenize([token])
                 generated_text += text
 
-                # Check stop sequences
+                # Check stop sequences (only the tail can hold a new match)
                 if stop:
+                    tail = generated_text[-(stop_window + len(text)):]
                     for s in stop:
-                        if s in generated_text:
+                        if s in tail:
                             finish_reason = "stop"
                             break
                     if finish_reason == "stop":
@@ -765,6 +812,7 @@ class Llama:
             # Stream generation
             completion_id = f"chatcmpl-{uuid.uuid4().hex[:8]}"
             generated_text = ""
+            stop_window = max(map(len, stop), default=0) if stop else 0
 
             for i in range(max_tokens):
                 token = self._sample_token()
@@ -792,8 +840,9 @@ class Llama:
                 # Check stop sequences
                 should_stop = False
                 if stop:
+                    tail = generated_text[-(stop_window + len(text)):]
                     for s in stop:
-                        if s in generated_text:
+                        if s in tail:
                             should_stop = True
                             break
 
@@ -1022,6 +1071,39 @@ class Llama:
 
             return ffi.buffer(self._detok_char_buf, n_chars)[:]
 
+    def _token_piece_bytes(self, token: int) -> bytes:
+        """
+        Convert a single token to the raw bytes it contributes mid-sequence.
+
+        Unlike ``_detokenize_bytes([token])``, the leading space is never
+        stripped, so pieces of consecutive tokens concatenate to the same bytes
+        as detokenizing them together. Used to build up generated text one
+        token at a time.
+
+        Args:
+            token: Token ID.
+
+        Returns:
+            Raw bytes for the token's piece.
+        """
+        with self._detok_lock:
+            n_chars = self._lib.llama_token_to_piece(
+                self._vocab,
+                token,
+                self._detok_char_buf,
+                self._detok_char_buf_size,
+                0,  # lstrip
+                False,  # special
+            )
+            if n_chars < 0:
+                buf = ffi.new(f"char[{-n_chars}]")
+                n_chars = self._lib.llama_token_to_piece(
+                    self._vocab, token, buf, -n_chars, 0, False
+                )
+                return ffi.buffer(buf, n_chars)[:]
+
+            return ffi.buffer(self._detok_char_buf, n_chars)[:]
+
     @staticmethod
     def _decode_utf8_streaming(data: bytes) -> tuple[str, bytes]:
         """
@@ -1395,6 +1477,11 @@ class Llama:
         finish_reason = "length"
         t_first_token = None
 
+        # Stop sequences are matched against a short byte tail of the output, so
+        # each step detokenizes one token instead of everything generated so far
+        stop_window = max((len(s.encode("utf-8")) for s in stop), default=0) if stop else 0
+        tail_bytes = b""
+
         for i in range(max_tokens):
             # Apply logits processor if provided
             if logits_processor is not None:
@@ -1427,18 +1514,25 @@ class Llama:
 
             # Decode the new token for stop sequence check
             if stop:
-                text = self.detokenize(generated_tokens)
-                for s in stop:
-                    if s in text:
-                        finish_reason = "stop"
-                        # Trim to stop sequence
-                        text = text[: text.index(s)]
-                        generated_tokens = self.tokenize(
-                            text, add_special=False, parse_special=False
-                        )
+                piece = (
+                    self._detokenize_bytes([token]) if i == 0
+                    else self._token_piece_bytes(token)
+                )
+                tail_bytes = (tail_bytes + piece)[-(stop_window + len(piece)):]
+                tail_text = tail_bytes.decode("utf-8", errors="ignore")
+                if any(s in tail_text for s in stop):
+                    text = self.detokenize(generated_tokens)
+                    for s in stop:
+                        if s in text:
+                            finish_reason = "stop"
+                            # Trim to stop sequence
+                            text = text[: text.index(s)]
+                            generated_tokens = self.tokenize(
+                                text, add_special=False, parse_special=False
+                            )
+                            break
+                    if finish_reason == "stop":
                         break
-                if finish_reason == "stop":
-                    break
 
             # Decode single token for next iteration
             if not self._decode_batch([token]):
@@ -1489,10 +1583,11 @@ class Llama:
         created = int(time.time())
         generated_tokens = []
         accumulated_text = ""
-        # Track bytes we've already processed to compute deltas
-        prev_bytes_len = 0
         # Buffer for incomplete UTF-8 byte sequences (e.g., partial emojis)
         pending_bytes = b""
+        # A new stop match must end inside the latest delta, so only a tail
+        # this much longer than the delta needs to be searched
+        stop_window = max(map(len, stop), default=0) if stop else 0
 
         for i in range(max_tokens):
             # Apply logits processor if provided
@@ -1548,26 +1643,27 @@ class Llama:
                 }
                 break
 
-            # Decode to get the new text, handling incomplete UTF-8 sequences
-            # (e.g., emojis that span multiple tokens)
-            all_bytes = self._detokenize_bytes(generated_tokens)
-            # New bytes = all bytes minus what we've already processed
-            # prev_bytes_len tracks how many bytes we've already decoded into accumulated_text
-            new_bytes = all_bytes[prev_bytes_len:]
+            # Decode only the new token's bytes, handling incomplete UTF-8
+            # sequences (e.g., emojis that span multiple tokens). The first token
+            # goes through the full detokenizer so its leading space is handled
+            # the same way as detokenizing the whole output.
+            if i == 0:
+                new_bytes = self._detokenize_bytes([token])
+            else:
+                new_bytes = self._token_piece_bytes(token)
             combined_bytes = pending_bytes + new_bytes
 
             # Decode only complete UTF-8 sequences, buffer incomplete ones
             decoded_text, pending_bytes = self._decode_utf8_streaming(combined_bytes)
             delta = decoded_text
             accumulated_text += decoded_text
-            # Update how many bytes we've fully processed (not counting pending)
-            prev_bytes_len = len(all_bytes) - len(pending_bytes)
 
             # Check stop sequences
             finish_reason = None
             if stop:
+                tail = accumulated_text[-(stop_window + len(decoded_text)):]
                 for s in stop:
-                    if s in accumulated_text:
+                    if s in tail:
                         finish_reason = "stop"
                         delta = delta[: delta.index(s)] if s in delta else ""
                         break
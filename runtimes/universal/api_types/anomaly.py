@@ -466,6 +466,10 @@ class PolarsBufferFeaturesRequest(BaseModel):
         default=None,
         description="Return only last N rows (optional)",
     )
+    format: Literal["rows", "columns"] = Field(
+        default="rows",
+        description="Response layout: list of row dicts, or a dict of column lists",
+    )
 
 
 class PolarsBufferStats(BaseModel):
@@ -488,7 +492,8 @@ class PolarsBufferDataResponse(BaseModel):
     buffer_id: str
     rows: int
     columns: list[str]
-    data: list[dict]
+    format: Literal["rows", "columns"] = "rows"
+    data: list[dict] | dict[str, list]
 
 
 class PolarsBuffersListResponse(BaseModel):
@@ -62,7 +62,7 @@ from typing import Any, Literal
 
 import numpy as np
 
-from .base import BaseModel
+from .base import BaseModel, tracks_requests
 from .pyod_backend import (
     AnomalyBackendType,
     create_detector,
@@ -265,6 +265,7 @@ class AnomalyModel(BaseModel):
         from sklearn.preprocessing import RobustScaler
         self._scaler = RobustScaler()
 
+    @tracks_requests
     async def fit(
         self,
         data: list[list[float]] | np.ndarray,
@@ -368,6 +369,7 @@ class AnomalyModel(BaseModel):
             },
         )
 
+    @tracks_requests
     async def score(
         self,
         data: list[list[float]] | np.ndarray,
@@ -445,6 +447,7 @@ class AnomalyModel(BaseModel):
             normalized = np.clip(normalized, -700, 700)  # Prevent overflow
             return 1 / (1 + np.exp(-normalized))
 
+    @tracks_requests
     async def detect(
         self,
         data: list[list[float]] | np.ndarray,
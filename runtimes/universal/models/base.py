@@ -4,6 +4,8 @@ Base model class for all HuggingFace models (transformers & diffusers).
 
 from __future__ import annotations
 
+import functools
+import inspect
 import logging
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
@@ -15,6 +17,37 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def tracks_requests(method):
+    """Count each call of an inference method as a request in flight.
+
+    The server's memory budget does not evict a model while it has requests
+    in flight. Async generator methods stay in flight until the stream ends
+    or is closed.
+    """
+    if inspect.isasyncgenfunction(method):
+
+        @functools.wraps(method)
+        async def stream_wrapper(self, *args, **kwargs):
+            self._requests_in_flight += 1
+            try:
+                async for item in method(self, *args, **kwargs):
+                    yield item
+            finally:
+                self._requests_in_flight -= 1
+
+        return stream_wrapper
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        self._requests_in_flight += 1
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            self._requests_in_flight -= 1
+
+    return wrapper
+
+
 class BaseModel(ABC):
     """Base class for all model types (transformers, diffusers, etc.)."""
 
@@ -29,6 +62,12 @@ class BaseModel(ABC):
         self.pipe: Any | None = None  # For diffusion models
         self.model_type = "unknown"
         self.supports_streaming = False
+        self._requests_in_flight = 0
+
+    @property
+    def in_use(self) -> bool:
+        """Whether any inference call on this model is still running."""
+        return self._requests_in_flight > 0
 
     @abstractmethod
     async def load(self) -> None:
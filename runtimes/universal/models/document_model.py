@@ -20,7 +20,7 @@ if TYPE_CHECKING:
 
 from PIL import Image
 
-from .base import BaseModel
+from .base import BaseModel, tracks_requests
 
 logger = logging.getLogger(__name__)
 
@@ -192,6 +192,7 @@ class DocumentModel(BaseModel):
 
         return Image.open(io.BytesIO(img_bytes)).convert("RGB")
 
+    @tracks_requests
     async def extract(
         self,
         images: list[str | bytes],
@@ -516,6 +517,7 @@ class DocumentModel(BaseModel):
             confidence=sum(f.confidence for f in fields) / len(fields) if fields else 0,
         )
 
+    @tracks_requests
     async def answer_question(
         self, images: list[str | bytes], questions: list[str]
     ) -> list[DocumentResult]:
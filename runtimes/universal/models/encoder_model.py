@@ -17,7 +17,7 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     from transformers import AutoConfig, PreTrainedTokenizerBase
 
-from .base import BaseModel
+from .base import BaseModel, tracks_requests
 
 logger = logging.getLogger(__name__)
 
@@ -225,6 +225,7 @@ class EncoderModel(BaseModel):
             input_mask_expanded.sum(1), min=1e-9
         )
 
+    @tracks_requests
     async def embed(
         self, texts: list[str], normalize: bool = True
     ) -> list[list[float]]:
@@ -270,6 +271,7 @@ class EncoderModel(BaseModel):
 
         return embeddings.cpu().tolist()
 
+    @tracks_requests
     async def classify(self, texts: list[str]) -> list[dict[str, Any]]:
         """
         Classify input texts.
@@ -324,6 +326,7 @@ class EncoderModel(BaseModel):
 
         return results
 
+    @tracks_requests
     async def extract_entities(self, texts: list[str]) -> list[list[NEREntity]]:
         """
         Extract named entities from texts.
@@ -441,6 +444,7 @@ class EncoderModel(BaseModel):
 
         return results
 
+    @tracks_requests
     async def rerank(
         self, query: str, documents: list[str], top_k: int | None = None
     ) -> list[dict[str, Any]]:
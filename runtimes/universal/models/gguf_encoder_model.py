@@ -15,7 +15,7 @@ from typing import TYPE_CHECKING
 
 from utils.model_format import get_gguf_file_path
 
-from .base import BaseModel
+from .base import BaseModel, tracks_requests
 
 if TYPE_CHECKING:
     from llamafarm_llama import Llama
@@ -60,6 +60,7 @@ class GGUFEncoderModel(BaseModel):
         self.supports_streaming = False
         self.llama: Llama | None = None
         self.preferred_quantization = preferred_quantization
+        self.gguf_path: str | None = None  # Resolved .gguf file, set by load()
         self._executor = ThreadPoolExecutor(max_workers=1)
 
     async def load(self) -> None:
@@ -92,6 +93,7 @@ class GGUFEncoderModel(BaseModel):
             gguf_path = gguf_path.replace("\\", "/")
 
         logger.info(f"GGUF file located at: {gguf_path}")
+        self.gguf_path = gguf_path
 
         # Configure GPU layers for llama.cpp (uses its own GPU detection, not PyTorch's)
         from utils.device import get_gguf_gpu_layers
@@ -126,6 +128,7 @@ class GGUFEncoderModel(BaseModel):
             f"with {n_gpu_layers} GPU layers"
         )
 
+    @tracks_requests
     async def embed(
         self, texts: list[str], normalize: bool = True
     ) -> list[list[float]]:
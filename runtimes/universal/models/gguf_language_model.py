@@ -8,77 +8,185 @@ GGUF quantized models, enabling faster inference and lower memory usage.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import gc
 import logging
 import os
 import sys
-from collections.abc import AsyncGenerator
-from concurrent.futures import ThreadPoolExecutor
-from functools import lru_cache
-from typing import TYPE_CHECKING
+import threading
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from functools import lru_cache, partial
+from queue import Empty, SimpleQueue
+from typing import TYPE_CHECKING, Any
 
-from utils.context_calculator import get_default_context_size
+from utils.context_calculator import get_available_memory, get_default_context_size
 from utils.context_manager import ContextBudget, ContextManager, ContextUsage
+from utils.device import is_unified_memory_gpu
 from utils.model_format import get_gguf_file_path
 from utils.token_counter import TokenCounter
 
-from .base import BaseModel
+from .base import BaseModel, tracks_requests
 
 if TYPE_CHECKING:
     from llamafarm_llama import Llama
 
 logger = logging.getLogger(__name__)
 
+# Default GGUF quantization per device when none is requested. Q4_K_M is the
+# sweet spot for CPU (and Metal, whose kernels are tuned for 4-bit K-quants);
+# CUDA dequantizes Q5_K_M at near the same speed for a measurable quality gain.
+# If the repository lacks the preferred file, select_gguf_file falls back to
+# its standard preference order.
+_DEFAULT_QUANTIZATION_BY_DEVICE = {
+    "cpu": "Q4_K_M",
+    "mps": "Q4_K_M",
+    "cuda": "Q5_K_M",
+}
+
+# Prompt prefixes used by format_messages() for each supported chat role
+_ROLE_PREFIXES = {
+    "system": "System: ",
+    "user": "User: ",
+    "assistant": "Assistant: ",
+}
+
 
 @lru_cache(maxsize=1)
-def _is_unified_memory_gpu() -> bool:
-    """Detect NVIDIA Jetson/Tegra unified memory GPU platforms.
+def _is_multi_numa_host() -> bool:
+    """Detect large multi-socket CPU hosts where NUMA placement matters.
+
+    Returns:
+        True if the host has more than 16 CPUs and at least two NUMA nodes.
+    """
+    return (os.cpu_count() or 0) > 16 and os.path.exists(
+        "/sys/devices/system/node/node1"
+    )
+
+
+def _resolve_future(
+    fut: asyncio.Future, result: Any, error: BaseException | None
+) -> None:
+    """Complete an asyncio future from the event loop thread (if still pending)."""
+    if fut.done():
+        return
+    if error is not None:
+        fut.set_exception(error)
+    else:
+        fut.set_result(result)
+
+
+class _InferenceWorker:
+    """Dedicated thread that runs blocking llama.cpp calls one at a time.
+
+    llama.cpp contexts are single-threaded from Python, so a one-worker pool is
+    all we need. Jobs are plain ``(callable, loop, future)`` tuples on a
+    SimpleQueue and results are posted straight to an asyncio future, avoiding
+    the concurrent.futures.Future that ``loop.run_in_executor`` allocates and
+    chains for every call.
+    """
 
-    Jetson devices have unified memory where CPU and GPU share RAM. On these systems,
-    running inference through ThreadPoolExecutor can cause performance issues due to
-    thread context switching overhead. Running synchronously avoids this overhead and
-    provides stability benefits by keeping CUDA operations in predictable thread contexts.
+    def __init__(self, name: str = "gguf-inference"):
+        self._jobs: SimpleQueue[
+            tuple[Callable[[], Any], asyncio.AbstractEventLoop, asyncio.Future] | None
+        ] = SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
 
-    Supported platforms:
-        - NVIDIA Jetson Orin (Nano, NX, AGX)
-        - NVIDIA Jetson Xavier (NX, AGX)
-        - NVIDIA Jetson TX2, Nano
+    def _run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            fn, loop, fut = job
+            result, error = None, None
+            try:
+                result = fn()
+            except BaseException as e:
+                error = e
+            # RuntimeError means the event loop already closed; nobody is waiting
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(_resolve_future, fut, result, error)
+
+    def is_alive(self) -> bool:
+        """Whether the worker thread is still accepting jobs."""
+        return self._thread.is_alive()
+
+    def submit(self, fn: Callable[[], Any]) -> asyncio.Future:
+        """Queue ``fn`` on the worker thread and return an awaitable for its result."""
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._jobs.put((fn, loop, fut))
+        return fut
 
-    Environment variable override:
-        LLAMAFARM_SYNC_INFERENCE=1  # Force synchronous inference
-        LLAMAFARM_SYNC_INFERENCE=0  # Force asynchronous inference (ThreadPoolExecutor)
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        """Stop the worker thread after the job currently running (if any).
 
-    Returns:
-        True if synchronous inference should be used (Jetson/Tegra or override)
+        Args:
+            wait: Block until the thread has exited.
+            cancel_pending: Cancel queued jobs that have not started yet
+                            instead of running them first.
+        """
+        if cancel_pending:
+            while True:
+                try:
+                    job = self._jobs.get_nowait()
+                except Empty:
+                    break
+                if job is not None:
+                    _, loop, fut = job
+                    with contextlib.suppress(RuntimeError):
+                        loop.call_soon_threadsafe(fut.cancel)
+        self._jobs.put(None)
+        if wait and self._thread is not threading.current_thread():
+            self._thread.join()
+
+
+class _StreamChannel:
+    """Bounded hand-off of streamed text from an inference thread to the event loop.
+
+    The producer hands items over with ``call_soon_threadsafe(put_nowait)`` rather
+    than an event-loop round-trip per token, but blocks once ``maxsize`` chunks
+    are waiting, so a slow consumer throttles generation instead of letting
+    buffered text grow without bound. Closing the channel (consumer gone) wakes
+    the producer and makes further puts return False so it can stop generating.
     """
-    # Check for environment variable override first
-    override = os.environ.get("LLAMAFARM_SYNC_INFERENCE", "").lower()
-    if override in ("1", "true", "yes"):
-        logger.info("Sync inference ENABLED via LLAMAFARM_SYNC_INFERENCE=1")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int = 64):
+        self.queue: asyncio.Queue[str | Exception | None] = asyncio.Queue()
+        self._loop = loop
+        self._maxsize = maxsize
+        self._slots = threading.Semaphore(maxsize) if maxsize > 0 else None
+        self._closed = False
+
+    def put(self, text: str) -> bool:
+        """Queue text from the producer thread, blocking while the queue is full.
+
+        Returns:
+            False if the consumer has gone away and generation should stop.
+        """
+        if self._closed:
+            return False
+        if self._slots is not None:
+            self._slots.acquire()
+            if self._closed:
+                return False
+        self._loop.call_soon_threadsafe(self.queue.put_nowait, text)
         return True
-    if override in ("0", "false", "no"):
-        logger.info("Sync inference DISABLED via LLAMAFARM_SYNC_INFERENCE=0")
-        return False
-
-    # Auto-detect: NVIDIA Tegra/Jetson (unified memory iGPU)
-    try:
-        if os.path.exists("/proc/device-tree/compatible"):
-            with open("/proc/device-tree/compatible", "rb") as f:
-                compatible = f.read().decode("utf-8", errors="ignore").lower()
-                if "tegra" in compatible or "jetson" in compatible:
-                    logger.info("NVIDIA Jetson/Tegra detected (sync inference enabled)")
-                    return True
-        # Fallback: check kernel version string
-        if os.path.exists("/proc/version"):
-            with open("/proc/version") as f:
-                if "tegra" in f.read().lower():
-                    logger.info("NVIDIA Tegra kernel detected (sync inference enabled)")
-                    return True
-    except Exception:
-        pass
-
-    # Apple Silicon and other platforms use async inference (ThreadPoolExecutor)
-    # which was the original behavior before Jetson optimizations
-    return False
+
+    def put_final(self, item: Exception | None) -> None:
+        """Queue an error or the None end-of-stream sentinel (never blocks)."""
+        self._loop.call_soon_threadsafe(self.queue.put_nowait, item)
+
+    def consumed(self, n: int = 1) -> None:
+        """Free ``n`` slots after the consumer has taken text off the queue."""
+        if self._slots is not None:
+            self._slots.release(n)
+
+    def close(self) -> None:
+        """Stop accepting text and wake a producer blocked on a full queue."""
+        self._closed = True
+        if self._slots is not None:
+            self._slots.release(self._maxsize)
 
 
 class GGUFLanguageModel(BaseModel):
@@ -113,6 +221,16 @@ class GGUFLanguageModel(BaseModel):
         preferred_quantization: str | None = None,
         mmproj_path: str | None = None,
         auto_detect_mmproj: bool = True,
+        stream_coalesce_ms: float = 5.0,
+        min_p: float = 0.05,
+        top_k: int = 40,
+        pool_size: int = 1,
+        numa: str | None = None,
+        main_gpu: int = 0,
+        tensor_split: list[float] | None = None,
+        split_mode: str | None = None,
+        offload_kqv: bool = True,
+        stream_queue_size: int = 64,
     ):
         """Initialize GGUF language model.
 
@@ -142,13 +260,44 @@ class GGUFLanguageModel(BaseModel):
             cache_type_v: Optional KV cache value quantization type. Same options as cache_type_k.
                           Setting both to "q4_0" provides maximum memory savings.
             preferred_quantization: Optional quantization preference (e.g., "Q4_K_M", "Q8_0").
-                                    If None, defaults to Q4_K_M. Only downloads the specified
+                                    If None, picks a device default: Q4_K_M on CPU and MPS,
+                                    Q5_K_M on CUDA. Only downloads the specified
                                     quantization to save disk space.
             mmproj_path: Optional path to multimodal projector file for audio/vision models.
                          If None and auto_detect_mmproj is True, will try to find mmproj
                          file in the same repository.
             auto_detect_mmproj: If True (default), automatically detect and download mmproj
                                 files for multimodal models like Qwen2.5-Omni.
+            stream_coalesce_ms: Window in milliseconds for joining tokens that arrive
+                                together into a single streamed chunk. Defaults to 5ms,
+                                below what SSE clients can render. Set to 0 to yield
+                                every token individually.
+            min_p: Default min-p cutoff for the native llama.cpp sampler chain. Drops
+                   tokens below ``min_p`` times the top token's probability before
+                   sampling, entirely in C++. Can be overridden per request.
+            top_k: Top-k cutoff for the native sampler chain (0 disables it).
+            pool_size: Number of llama.cpp contexts to load for serving concurrent
+                       requests (default 1). Each context has its own KV cache and
+                       worker thread, so requests overlap instead of queueing on a
+                       single context. Contexts share weight pages only when
+                       use_mmap=True; otherwise each one holds a full copy.
+            numa: Optional llama.cpp NUMA strategy ("distribute", "isolate",
+                  "numactl", "mirror"). If None, "distribute" is used on CPU hosts
+                  with more than 16 cores and multiple NUMA nodes.
+            main_gpu: GPU index for the KV cache and intermediate results (and the
+                      whole model when split_mode="none"). Ignored on CPU.
+            tensor_split: Optional per-GPU proportions for splitting the model, e.g.
+                          [1.0, 1.0] to shard evenly across two GPUs when llama.cpp's
+                          default (free-memory based) split is unbalanced.
+            split_mode: Optional multi-GPU split: "layer" (llama.cpp default, best
+                        for most setups), "row" (usually fastest on two GPUs joined
+                        by NVLink) or "none" (main_gpu only).
+            offload_kqv: Keep the KV cache on the GPU (default True). Decode is
+                         memory-bandwidth bound, so disable only to save VRAM.
+            stream_queue_size: Maximum streamed chunks buffered ahead of the client
+                               (default 64). Generation pauses while the buffer is
+                               full, so slow clients cannot grow it without bound.
+                               Set to 0 for an unbounded buffer.
         """
         super().__init__(model_id, device, token=token)
         self.model_type = "language"
@@ -156,6 +305,7 @@ class GGUFLanguageModel(BaseModel):
         self.llama: Llama | None = None
         self.requested_n_ctx = self.n_ctx = n_ctx  # Store requested value
         self.actual_n_ctx: int | None = None  # Will be computed during load()
+        self.gguf_path: str | None = None  # Resolved .gguf file, set by load()
         self.requested_n_batch = n_batch  # Store requested value (None = default 2048)
         self.requested_n_gpu_layers = (
             n_gpu_layers  # Store requested value (None = auto)
@@ -164,12 +314,32 @@ class GGUFLanguageModel(BaseModel):
         self.requested_flash_attn = flash_attn  # Store requested value (None = default True)
         self.requested_use_mmap = use_mmap  # Store requested value (None = default False)
         self.requested_use_mlock = use_mlock  # Store requested value (None = default False)
+        self.requested_numa = numa  # Store requested value (None = auto)
+        self.main_gpu = main_gpu  # Multi-GPU placement (GPU devices only)
+        self.tensor_split = tensor_split
+        self.split_mode = split_mode
+        self.offload_kqv = offload_kqv
         self.requested_cache_type_k = cache_type_k  # Store requested value (None = default f16)
         self.requested_cache_type_v = cache_type_v  # Store requested value (None = default f16)
-        self.preferred_quantization = preferred_quantization
+        self.preferred_quantization = (
+            preferred_quantization
+            if preferred_quantization is not None
+            else _DEFAULT_QUANTIZATION_BY_DEVICE.get(device, "Q4_K_M")
+        )
         self.requested_mmproj_path = mmproj_path  # Explicit mmproj path
         self.auto_detect_mmproj = auto_detect_mmproj  # Auto-detect mmproj files
-        self._executor = ThreadPoolExecutor(max_workers=1)
+        self.stream_coalesce_ms = stream_coalesce_ms  # Token batching window (0 = off)
+        self.stream_queue_size = stream_queue_size  # Streaming back-pressure (0 = off)
+        self.min_p = min_p  # Native min-p sampler cutoff
+        self.top_k = top_k  # Native top-k sampler cutoff
+        self._worker = _InferenceWorker()
+
+        # Context pool (populated during load() when pool_size > 1)
+        self.pool_size = max(1, pool_size)
+        self._pool: list[tuple[Llama, _InferenceWorker]] = []
+        self._idle_contexts: asyncio.Queue[tuple[Llama, _InferenceWorker]] | None = (
+            None
+        )
 
         # Context management (initialized during load())
         self._token_counter: TokenCounter | None = None
@@ -213,6 +383,24 @@ class GGUFLanguageModel(BaseModel):
         # Unable to determine available memory
         return None
 
+    def _detect_mmproj_path(self) -> str | None:
+        """Detect or use explicit mmproj path for multimodal models.
+
+        Returns:
+            Path to the multimodal projector file, or None if there is none.
+        """
+        mmproj_path = self.requested_mmproj_path
+        if mmproj_path is None and self.auto_detect_mmproj:
+            try:
+                from llamafarm_common import get_mmproj_file_path
+
+                mmproj_path = get_mmproj_file_path(self.model_id, self.token)
+                if mmproj_path:
+                    logger.info(f"Auto-detected mmproj file: {mmproj_path}")
+            except Exception as e:
+                logger.debug(f"mmproj auto-detection failed: {e}")
+        return mmproj_path
+
     async def load(self) -> None:
         """Load the GGUF model using llama-cpp.
 
@@ -231,11 +419,18 @@ class GGUFLanguageModel(BaseModel):
         logger.info(f"Loading GGUF model: {self.model_id}")
 
         # Get path to .gguf file in HF cache
-        # This will intelligently select and download only the preferred quantization
-        gguf_path = get_gguf_file_path(
-            self.model_id,
-            self.token,
-            preferred_quantization=self.preferred_quantization,
+        # This will intelligently select and download only the preferred quantization.
+        # The lookup is independent of the device memory probe and the mmproj
+        # lookup, so all three run concurrently off the event loop.
+        gguf_path, available_memory, mmproj_path = await asyncio.gather(
+            asyncio.to_thread(
+                get_gguf_file_path,
+                self.model_id,
+                self.token,
+                preferred_quantization=self.preferred_quantization,
+            ),
+            asyncio.to_thread(get_available_memory, self.device),
+            asyncio.to_thread(self._detect_mmproj_path),
         )
 
         # On Windows, convert backslashes to forward slashes for llama.cpp compatibility
@@ -246,7 +441,7 @@ class GGUFLanguageModel(BaseModel):
         logger.info(f"GGUF file located at: {gguf_path}")
 
         # Store path for later use (e.g., Jinja2 template extraction)
-        self._gguf_path = gguf_path
+        self.gguf_path = gguf_path
 
         # Compute optimal context size
         self.actual_n_ctx, warnings = get_default_context_size(
@@ -254,6 +449,7 @@ class GGUFLanguageModel(BaseModel):
             gguf_path=gguf_path,
             device=self.device,
             config_n_ctx=self.requested_n_ctx,
+            available_memory=available_memory,
         )
 
         # Log warnings to stderr
@@ -307,12 +503,36 @@ class GGUFLanguageModel(BaseModel):
         use_mmap = self.requested_use_mmap if self.requested_use_mmap is not None else False
         logger.info(f"Using use_mmap: {use_mmap}")
 
-        # Configure memory locking (default False to allow OS memory management)
+        # Configure memory locking (default False to allow OS memory management).
+        # Opt-in only: each cached model would pin its own weights, and the OS
+        # cannot reclaim locked pages under memory pressure.
         use_mlock = (
             self.requested_use_mlock if self.requested_use_mlock is not None else False
         )
         logger.info(f"Using use_mlock: {use_mlock}")
 
+        # Configure NUMA placement (auto "distribute" on large multi-node CPU hosts)
+        numa = self.requested_numa
+        if numa is None and self.device == "cpu" and _is_multi_numa_host():
+            numa = "distribute"
+        if numa is not None:
+            logger.info(f"Using numa: {numa}")
+
+        # Configure multi-GPU placement (only meaningful when layers are offloaded)
+        gpu_kwargs: dict[str, Any] = {}
+        if self.device != "cpu" and n_gpu_layers != 0:
+            gpu_kwargs = {
+                "main_gpu": self.main_gpu,
+                "tensor_split": self.tensor_split,
+                "split_mode": self.split_mode,
+                "offload_kqv": self.offload_kqv,
+            }
+            if self.tensor_split or self.split_mode:
+                logger.info(
+                    f"Using split_mode: {self.split_mode or 'layer'}, "
+                    f"tensor_split: {self.tensor_split}, main_gpu: {self.main_gpu}"
+                )
+
         # Configure KV cache quantization (None = default f16, use q4_0 for memory savings)
         cache_type_k = self.requested_cache_type_k
         cache_type_v = self.requested_cache_type_v
@@ -321,21 +541,10 @@ class GGUFLanguageModel(BaseModel):
         if cache_type_v is not None:
             logger.info(f"Using cache_type_v: {cache_type_v}")
 
-        # Detect or use explicit mmproj path for multimodal models
-        mmproj_path = self.requested_mmproj_path
-        if mmproj_path is None and self.auto_detect_mmproj:
-            try:
-                from llamafarm_common import get_mmproj_file_path
-
-                mmproj_path = get_mmproj_file_path(self.model_id, self.token)
-                if mmproj_path:
-                    logger.info(f"Auto-detected mmproj file: {mmproj_path}")
-            except Exception as e:
-                logger.debug(f"mmproj auto-detection failed: {e}")
-
         # Load model using llama-cpp
-        # Run in thread pool since Llama() initialization is blocking
-        loop = asyncio.get_running_loop()
+        # Run on the worker thread since Llama() initialization is blocking
+        if not self._worker.is_alive():
+            self._worker = _InferenceWorker()
 
         def _load_model():
             import os
@@ -368,6 +577,8 @@ class GGUFLanguageModel(BaseModel):
                     flash_attn=flash_attn,  # Flash attention optimization
                     use_mmap=use_mmap,  # Memory-mapped file loading
                     use_mlock=use_mlock,  # Lock model in RAM
+                    numa=numa,  # NUMA placement strategy
+                    **gpu_kwargs,  # Multi-GPU split and KV cache placement
                     cache_type_k=cache_type_k,  # KV cache key quantization
                     cache_type_v=cache_type_v,  # KV cache value quantization
                     verbose=False,  # Disable verbose logging (managed by ggml_logging)
@@ -392,11 +603,37 @@ class GGUFLanguageModel(BaseModel):
             # On unified memory platforms (Jetson Tegra, Apple Silicon), load model
             # synchronously to ensure GPU context is created optimally and avoid
             # thread context switching overhead in shared memory architecture
-            if _is_unified_memory_gpu():
+            if is_unified_memory_gpu():
                 logger.info("Loading model synchronously (unified memory GPU optimization)")
                 self.llama = _load_model()
             else:
-                self.llama = await loop.run_in_executor(self._executor, _load_model)
+                self.llama = await self._worker.submit(_load_model)
+
+            # Load extra contexts for concurrent requests, each on its own worker
+            if self.pool_size > 1:
+                if is_unified_memory_gpu():
+                    logger.info(
+                        "Ignoring pool_size on unified memory GPU (sync inference)"
+                    )
+                else:
+                    if not use_mmap:
+                        logger.warning(
+                            f"pool_size={self.pool_size} with use_mmap=False loads "
+                            "a full copy of the weights per context"
+                        )
+                    self._pool = [(self.llama, self._worker)]
+                    for i in range(1, self.pool_size):
+                        worker = _InferenceWorker(name=f"gguf-inference-{i}")
+                        try:
+                            llama = await worker.submit(_load_model)
+                        except Exception:
+                            worker.shutdown(wait=False)
+                            raise
+                        self._pool.append((llama, worker))
+                    self._idle_contexts = asyncio.Queue()
+                    for context in self._pool:
+                        self._idle_contexts.put_nowait(context)
+                    logger.info(f"Loaded {self.pool_size} llama.cpp contexts")
 
             # Initialize context management
             self._token_counter = TokenCounter(self.llama)
@@ -447,11 +684,33 @@ class GGUFLanguageModel(BaseModel):
                 f"with {n_gpu_layers} GPU layers and context size {self.actual_n_ctx}"
             )
         except Exception:
-            # Clean up executor if load fails to prevent resource leak
-            if hasattr(self, "_executor"):
-                self._executor.shutdown(wait=False)
+            # Stop the workers if load fails to prevent leaked threads;
+            # a later load() starts a fresh one
+            self._worker.shutdown(wait=False)
+            for _, worker in self._pool:
+                if worker is not self._worker:
+                    worker.shutdown(wait=False)
+            self._pool = []
+            self._idle_contexts = None
             raise
 
+    @contextlib.asynccontextmanager
+    async def _lease_context(self) -> AsyncIterator[tuple[Llama, _InferenceWorker]]:
+        """Borrow a llama.cpp context and the worker thread that owns it.
+
+        With a single context this is just the model's own instance. With a
+        pool, waits for an idle context and returns it to the pool on exit.
+        """
+        if self._idle_contexts is None:
+            yield self.llama, self._worker
+            return
+
+        context = await self._idle_contexts.get()
+        try:
+            yield context
+        finally:
+            self._idle_contexts.put_nowait(context)
+
     @property
     def supports_audio(self) -> bool:
         """Whether this model supports direct audio input.
@@ -490,18 +749,12 @@ class GGUFLanguageModel(BaseModel):
             >>> model.format_messages(messages)
             'System: You are helpful\\nUser: Hello\\nAssistant:'
         """
-        prompt_parts = []
-
-        for msg in messages:
-            role = msg.get("role", "")
-            content = msg.get("content", "")
-
-            if role == "system":
-                prompt_parts.append(f"System: {content}")
-            elif role == "user":
-                prompt_parts.append(f"User: {content}")
-            elif role == "assistant":
-                prompt_parts.append(f"Assistant: {content}")
+        # Messages with other roles (e.g. tool) are skipped
+        prompt_parts = [
+            f"{_ROLE_PREFIXES[role]}{msg.get('content', '')}"
+            for msg in messages
+            if (role := msg.get("role", "")) in _ROLE_PREFIXES
+        ]
 
         # Add final prompt for assistant response
         prompt_parts.append("Assistant:")
@@ -679,6 +932,7 @@ class GGUFLanguageModel(BaseModel):
         top_p: float,
         stop: list[str] | None,
         thinking_budget: int | None,
+        min_p: float,
     ) -> str:
         """Generate completion from a pre-formatted prompt string.
 
@@ -691,18 +945,14 @@ class GGUFLanguageModel(BaseModel):
             top_p: Nucleus sampling threshold
             stop: List of stop sequences
             thinking_budget: Maximum tokens for thinking
+            min_p: Min-p cutoff for the native sampler chain
 
         Returns:
             Generated text as a string
         """
         assert self.llama is not None, "Model not loaded"
 
-        loop = asyncio.get_running_loop()
-
-        # Capture llama reference for nested function (type checker can't see through closures)
-        llama = self.llama
-
-        def _generate():
+        def _generate(llama: Llama):
             try:
                 # Set up logits processor for thinking budget if specified
                 logits_processor = None
@@ -719,6 +969,8 @@ class GGUFLanguageModel(BaseModel):
                     max_tokens=max_tokens,
                     temperature=temperature,
                     top_p=top_p,
+                    top_k=self.top_k,
+                    min_p=min_p,
                     stop=stop or [],
                     logits_processor=logits_processor,
                 )
@@ -731,17 +983,19 @@ class GGUFLanguageModel(BaseModel):
 
         try:
             # On unified memory platforms (Jetson, Apple Silicon), run synchronously
-            # to avoid ThreadPoolExecutor overhead in shared memory architecture
-            if _is_unified_memory_gpu():
-                result = _generate()
+            # to avoid worker thread hand-off overhead in shared memory architecture
+            if is_unified_memory_gpu():
+                result = _generate(self.llama)
             else:
-                result = await loop.run_in_executor(self._executor, _generate)
+                async with self._lease_context() as (llama, worker):
+                    result = await worker.submit(partial(_generate, llama))
             content = result["choices"][0]["message"]["content"]
             return content.strip() if content else ""
         except Exception as e:
             logger.error(f"Error extracting completion result: {e}", exc_info=True)
             raise ValueError(f"Unexpected result from completion: {e}") from e
 
+    @tracks_requests
     async def generate(
         self,
         messages: list[dict],
@@ -752,6 +1006,7 @@ class GGUFLanguageModel(BaseModel):
         thinking_budget: int | None = None,
         tools: list[dict] | None = None,
         tool_choice: str | dict | None = None,
+        min_p: float | None = None,
     ) -> str:
         """Generate chat completion (non-streaming).
 
@@ -768,6 +1023,7 @@ class GGUFLanguageModel(BaseModel):
             thinking_budget: Maximum tokens for thinking before forcing </think>
             tools: Optional list of tool definitions in OpenAI format
             tool_choice: Optional tool choice strategy ("auto", "none", "required")
+            min_p: Optional min-p sampler cutoff (default: the model's ``min_p``)
 
         Returns:
             Generated text as a string
@@ -781,6 +1037,7 @@ class GGUFLanguageModel(BaseModel):
         assert self.llama is not None, "Model not loaded. Call load() first."
 
         max_tokens = max_tokens or 512
+        min_p = self.min_p if min_p is None else min_p
         logger.info(f"[TIMING] generate() start, max_tokens={max_tokens}")
 
         # Try Jinja2 native tool rendering first (if tools provided)
@@ -799,6 +1056,7 @@ class GGUFLanguageModel(BaseModel):
                     max_tokens=max_tokens,
                     temperature=temperature,
                     top_p=top_p,
+                    min_p=min_p,
                     stop=stop,
                     thinking_budget=thinking_budget,
                 )
@@ -816,9 +1074,8 @@ class GGUFLanguageModel(BaseModel):
                 f"[generate] Prepared messages ({len(prepared_messages)} messages):\n"
                 f"{'=' * 60}\n{json.dumps(prepared_messages, indent=2)}\n{'=' * 60}"
             )
-        loop = asyncio.get_running_loop()
 
-        def _generate():
+        def _generate(llama: Llama):
             try:
                 # Set up logits processor for thinking budget if specified
                 logits_processor = None
@@ -826,15 +1083,17 @@ class GGUFLanguageModel(BaseModel):
                     from utils.thinking import ThinkingBudgetProcessor
 
                     logits_processor = ThinkingBudgetProcessor(
-                        self.llama, max_thinking_tokens=thinking_budget
+                        llama, max_thinking_tokens=thinking_budget
                     )
 
                 # Use create_chat_completion which applies the model's chat template
-                return self.llama.create_chat_completion(
+                return llama.create_chat_completion(
                     messages=prepared_messages,
                     max_tokens=max_tokens,
                     temperature=temperature,
                     top_p=top_p,
+                    top_k=self.top_k,
+                    min_p=min_p,
                     stop=stop or [],
                     logits_processor=logits_processor,
                 )
@@ -847,18 +1106,72 @@ class GGUFLanguageModel(BaseModel):
 
         try:
             # On unified memory platforms (Jetson, Apple Silicon), run synchronously
-            # to avoid ThreadPoolExecutor overhead in shared memory architecture.
+            # to avoid worker thread hand-off overhead in shared memory architecture.
             # This provides both performance and stability benefits.
-            if _is_unified_memory_gpu():
-                result = _generate()
+            if is_unified_memory_gpu():
+                result = _generate(self.llama)
             else:
-                result = await loop.run_in_executor(self._executor, _generate)
+                async with self._lease_context() as (llama, worker):
+                    result = await worker.submit(partial(_generate, llama))
             content = result["choices"][0]["message"]["content"]
             return content.strip() if content else ""
         except Exception as e:
             logger.error(f"Error extracting chat completion result: {e}", exc_info=True)
             raise ValueError(f"Unexpected result from chat completion: {e}") from e
 
+    async def _drain_stream_queue(
+        self, channel: _StreamChannel
+    ) -> AsyncGenerator[str, None]:
+        """Yield text from a producer-thread channel until the None sentinel.
+
+        Tokens that arrive within ``stream_coalesce_ms`` of each other are joined
+        and yielded as one chunk, so the async generator resumes once per burst
+        rather than once per token. Exceptions put on the queue are re-raised
+        after any text gathered before them has been yielded.
+
+        Args:
+            channel: Channel fed by the generation thread with text, an Exception,
+                     or None when generation is finished.
+
+        Yields:
+            Generated text chunks
+        """
+        queue = channel.queue
+        coalesce_s = self.stream_coalesce_ms / 1000.0
+
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            if isinstance(item, Exception):
+                raise item
+            if coalesce_s <= 0:
+                channel.consumed()
+                yield item
+                continue
+
+            # Let the producer run ahead for one window, then take everything queued
+            await asyncio.sleep(coalesce_s)
+            parts = [item]
+            pending: Exception | None = None
+            finished = False
+            while not queue.empty():
+                item = queue.get_nowait()
+                if item is None:
+                    finished = True
+                    break
+                if isinstance(item, Exception):
+                    pending = item
+                    break
+                parts.append(item)
+
+            channel.consumed(len(parts))
+            yield parts[0] if len(parts) == 1 else "".join(parts)
+            if pending is not None:
+                raise pending
+            if finished:
+                return
+
     async def _stream_from_prompt(
         self,
         prompt: str,
@@ -867,6 +1180,7 @@ class GGUFLanguageModel(BaseModel):
         top_p: float,
         stop: list[str] | None,
         thinking_budget: int | None,
+        min_p: float,
     ) -> AsyncGenerator[str, None]:
         """Stream completion from a pre-formatted prompt string.
 
@@ -879,18 +1193,17 @@ class GGUFLanguageModel(BaseModel):
             top_p: Nucleus sampling threshold
             stop: List of stop sequences
             thinking_budget: Maximum tokens for thinking
+            min_p: Min-p cutoff for the native sampler chain
 
         Yields:
             Generated text tokens as strings
         """
         assert self.llama is not None, "Model not loaded"
 
-        # Capture llama reference for nested function (type checker can't see through closures)
-        llama = self.llama
-
         # On Jetson/Tegra, stream synchronously to avoid thread context switching
         # overhead in unified memory architecture
-        if _is_unified_memory_gpu():
+        if is_unified_memory_gpu():
+            llama = self.llama
             logits_processor = None
             if thinking_budget is not None:
                 from utils.thinking import ThinkingBudgetProcessor
@@ -904,6 +1217,8 @@ class GGUFLanguageModel(BaseModel):
                 max_tokens=max_tokens,
                 temperature=temperature,
                 top_p=top_p,
+                top_k=self.top_k,
+                min_p=min_p,
                 stop=stop or [],
                 stream=True,
                 logits_processor=logits_processor,
@@ -915,11 +1230,10 @@ class GGUFLanguageModel(BaseModel):
                     await asyncio.sleep(0)
             return
 
-        # Async path: use ThreadPoolExecutor (Apple Silicon, discrete GPUs, CPU)
-        queue: asyncio.Queue[str | Exception | None] = asyncio.Queue()
-        loop = asyncio.get_running_loop()
+        # Async path: run on the inference worker thread (Apple Silicon, discrete GPUs, CPU)
+        channel = _StreamChannel(asyncio.get_running_loop(), self.stream_queue_size)
 
-        def _generate_stream():
+        def _generate_stream(llama: Llama):
             """Run completion in separate thread."""
             try:
                 thinking_tokens = 0
@@ -941,6 +1255,8 @@ class GGUFLanguageModel(BaseModel):
                     max_tokens=max_tokens,
                     temperature=temperature,
                     top_p=top_p,
+                    top_k=self.top_k,
+                    min_p=min_p,
                     stop=stop or [],
                     stream=True,
                     logits_processor=logits_processor,
@@ -961,30 +1277,27 @@ class GGUFLanguageModel(BaseModel):
                         if in_thinking and not thinking_ended:
                             thinking_tokens += 1
 
-                        future = asyncio.run_coroutine_threadsafe(
-                            queue.put(content), loop
-                        )
-                        future.result()
+                        if not channel.put(content):
+                            break  # Consumer went away
             except Exception as e:
                 logger.error(f"Error in GGUF completion stream: {e}", exc_info=True)
-                future = asyncio.run_coroutine_threadsafe(queue.put(e), loop)
-                future.result()
+                channel.put_final(e)
             finally:
-                future = asyncio.run_coroutine_threadsafe(queue.put(None), loop)
-                future.result()
+                channel.put_final(None)
 
-        loop.run_in_executor(self._executor, _generate_stream)
+        # The context goes back to the pool when the stream ends; if the consumer
+        # stops early, closing the channel stops generation at the next token
+        async with self._lease_context() as (llama, worker):
+            worker.submit(partial(_generate_stream, llama))
 
-        # Yield tokens as they arrive, propagate exceptions
-        while True:
-            item = await queue.get()
-            if item is None:
-                break
-            elif isinstance(item, Exception):
-                raise item
-            else:
-                yield item
+            # Yield tokens as they arrive, propagate exceptions
+            try:
+                async for text in self._drain_stream_queue(channel):
+                    yield text
+            finally:
+                channel.close()
 
+    @tracks_requests
     async def generate_stream(
         self,
         messages: list[dict],
@@ -995,6 +1308,7 @@ class GGUFLanguageModel(BaseModel):
         thinking_budget: int | None = None,
         tools: list[dict] | None = None,
         tool_choice: str | dict | None = None,
+        min_p: float | None = None,
     ) -> AsyncGenerator[str, None]:
         """Generate chat completion with streaming (async generator).
 
@@ -1014,6 +1328,7 @@ class GGUFLanguageModel(BaseModel):
             thinking_budget: Maximum tokens for thinking before forcing </think>
             tools: Optional list of tool definitions in OpenAI format
             tool_choice: Optional tool choice strategy ("auto", "none", "required")
+            min_p: Optional min-p sampler cutoff (default: the model's ``min_p``)
 
         Yields:
             Generated text tokens as strings
@@ -1024,6 +1339,7 @@ class GGUFLanguageModel(BaseModel):
         assert self.llama is not None, "Model not loaded. Call load() first."
 
         max_tokens = max_tokens or 512
+        min_p = self.min_p if min_p is None else min_p
 
         # Try Jinja2 native tool rendering first (if tools provided)
         if tools:
@@ -1041,6 +1357,7 @@ class GGUFLanguageModel(BaseModel):
                     max_tokens=max_tokens,
                     temperature=temperature,
                     top_p=top_p,
+                    min_p=min_p,
                     stop=stop,
                     thinking_budget=thinking_budget,
                 ):
@@ -1063,20 +1380,23 @@ class GGUFLanguageModel(BaseModel):
 
         # On Jetson/Tegra, stream synchronously to avoid thread context switching
         # overhead in unified memory architecture
-        if _is_unified_memory_gpu():
+        if is_unified_memory_gpu():
+            llama = self.llama
             logits_processor = None
             if thinking_budget is not None:
                 from utils.thinking import ThinkingBudgetProcessor
 
                 logits_processor = ThinkingBudgetProcessor(
-                    self.llama, max_thinking_tokens=thinking_budget
+                    llama, max_thinking_tokens=thinking_budget
                 )
 
-            for chunk in self.llama.create_chat_completion(
+            for chunk in llama.create_chat_completion(
                 messages=prepared_messages,
                 max_tokens=max_tokens,
                 temperature=temperature,
                 top_p=top_p,
+                top_k=self.top_k,
+                min_p=min_p,
                 stop=stop or [],
                 stream=True,
                 logits_processor=logits_processor,
@@ -1088,11 +1408,10 @@ class GGUFLanguageModel(BaseModel):
                     await asyncio.sleep(0)
             return
 
-        # Async path: use ThreadPoolExecutor (Apple Silicon, discrete GPUs, CPU)
-        queue: asyncio.Queue[str | Exception | None] = asyncio.Queue()
-        loop = asyncio.get_running_loop()
+        # Async path: run on the inference worker thread (Apple Silicon, discrete GPUs, CPU)
+        channel = _StreamChannel(asyncio.get_running_loop(), self.stream_queue_size)
 
-        def _generate_stream():
+        def _generate_stream(llama: Llama):
             """Run chat completion in separate thread."""
             try:
                 thinking_tokens = 0
@@ -1106,14 +1425,16 @@ class GGUFLanguageModel(BaseModel):
                     from utils.thinking import ThinkingBudgetProcessor
 
                     logits_processor = ThinkingBudgetProcessor(
-                        self.llama, max_thinking_tokens=thinking_budget
+                        llama, max_thinking_tokens=thinking_budget
                     )
 
-                for chunk in self.llama.create_chat_completion(
+                for chunk in llama.create_chat_completion(
                     messages=prepared_messages,
                     max_tokens=max_tokens,
                     temperature=temperature,
                     top_p=top_p,
+                    top_k=self.top_k,
+                    min_p=min_p,
                     stop=stop or [],
                     stream=True,
                     logits_processor=logits_processor,
@@ -1134,30 +1455,27 @@ class GGUFLanguageModel(BaseModel):
                         if in_thinking and not thinking_ended:
                             thinking_tokens += 1
 
-                        future = asyncio.run_coroutine_threadsafe(
-                            queue.put(content), loop
-                        )
-                        future.result()
+                        if not channel.put(content):
+                            break  # Consumer went away
             except Exception as e:
                 logger.error(f"Error in GGUF chat stream: {e}", exc_info=True)
-                future = asyncio.run_coroutine_threadsafe(queue.put(e), loop)
-                future.result()
+                channel.put_final(e)
             finally:
-                future = asyncio.run_coroutine_threadsafe(queue.put(None), loop)
-                future.result()
+                channel.put_final(None)
 
-        loop.run_in_executor(self._executor, _generate_stream)
+        # The context goes back to the pool when the stream ends; if the consumer
+        # stops early, closing the channel stops generation at the next token
+        async with self._lease_context() as (llama, worker):
+            worker.submit(partial(_generate_stream, llama))
 
-        # Yield tokens as they arrive, propagate exceptions
-        while True:
-            item = await queue.get()
-            if item is None:
-                break
-            elif isinstance(item, Exception):
-                raise item
-            else:
-                yield item
+            # Yield tokens as they arrive, propagate exceptions
+            try:
+                async for text in self._drain_stream_queue(channel):
+                    yield text
+            finally:
+                channel.close()
 
+    @tracks_requests
     async def generate_with_audio(
         self,
         messages: list[dict],
@@ -1200,17 +1518,19 @@ class GGUFLanguageModel(BaseModel):
         assert self.llama is not None, "Model not loaded. Call load() first."
 
         max_tokens = max_tokens or 512
-        loop = asyncio.get_running_loop()
+        min_p = self.min_p
 
-        def _generate():
+        def _generate(llama: Llama):
             try:
-                return self.llama.create_chat_completion_with_audio(
+                return llama.create_chat_completion_with_audio(
                     messages=messages,
                     audio_data=audio_data,
                     audio_format=audio_format,
                     max_tokens=max_tokens,
                     temperature=temperature,
                     top_p=top_p,
+                    top_k=self.top_k,
+                    min_p=min_p,
                     stop=stop or [],
                 )
             except Exception as e:
@@ -1219,16 +1539,18 @@ class GGUFLanguageModel(BaseModel):
 
         try:
             # On Jetson/Tegra, run synchronously to avoid thread context switching overhead
-            if _is_unified_memory_gpu():
-                result = _generate()
+            if is_unified_memory_gpu():
+                result = _generate(self.llama)
             else:
-                result = await loop.run_in_executor(self._executor, _generate)
+                async with self._lease_context() as (llama, worker):
+                    result = await worker.submit(partial(_generate, llama))
             content = result["choices"][0]["message"]["content"]
             return content.strip() if content else ""
         except Exception as e:
             logger.error(f"Error extracting audio completion result: {e}", exc_info=True)
             raise ValueError(f"Unexpected result from audio completion: {e}") from e
 
+    @tracks_requests
     async def generate_stream_with_audio(
         self,
         messages: list[dict],
@@ -1269,9 +1591,10 @@ class GGUFLanguageModel(BaseModel):
         assert self.llama is not None, "Model not loaded. Call load() first."
 
         max_tokens = max_tokens or 512
+        min_p = self.min_p
 
         # On Jetson/Tegra, stream synchronously to avoid thread context switching overhead
-        if _is_unified_memory_gpu():
+        if is_unified_memory_gpu():
             for chunk in self.llama.create_chat_completion_with_audio(
                 messages=messages,
                 audio_data=audio_data,
@@ -1279,6 +1602,8 @@ class GGUFLanguageModel(BaseModel):
                 max_tokens=max_tokens,
                 temperature=temperature,
                 top_p=top_p,
+                top_k=self.top_k,
+                min_p=min_p,
                 stop=stop or [],
                 stream=True,
             ):
@@ -1289,70 +1614,83 @@ class GGUFLanguageModel(BaseModel):
                     await asyncio.sleep(0)
             return
 
-        # Async path: use ThreadPoolExecutor (Apple Silicon, discrete GPUs, CPU)
-        queue: asyncio.Queue[str | Exception | None] = asyncio.Queue()
-        loop = asyncio.get_running_loop()
+        # Async path: run on the inference worker thread (Apple Silicon, discrete GPUs, CPU)
+        channel = _StreamChannel(asyncio.get_running_loop(), self.stream_queue_size)
 
-        def _generate_stream():
+        def _generate_stream(llama: Llama):
             try:
-                for chunk in self.llama.create_chat_completion_with_audio(
+                for chunk in llama.create_chat_completion_with_audio(
                     messages=messages,
                     audio_data=audio_data,
                     audio_format=audio_format,
                     max_tokens=max_tokens,
                     temperature=temperature,
                     top_p=top_p,
+                    top_k=self.top_k,
+                    min_p=min_p,
                     stop=stop or [],
                     stream=True,
                 ):
                     delta = chunk["choices"][0].get("delta", {})
                     content = delta.get("content", "")
-                    if content:
-                        future = asyncio.run_coroutine_threadsafe(
-                            queue.put(content), loop
-                        )
-                        future.result()
+                    if content and not channel.put(content):
+                        break  # Consumer went away
             except Exception as e:
                 logger.error(f"Error in audio chat stream: {e}", exc_info=True)
-                future = asyncio.run_coroutine_threadsafe(queue.put(e), loop)
-                future.result()
+                channel.put_final(e)
             finally:
-                future = asyncio.run_coroutine_threadsafe(queue.put(None), loop)
-                future.result()
+                channel.put_final(None)
 
-        loop.run_in_executor(self._executor, _generate_stream)
+        # The context goes back to the pool when the stream ends; if the consumer
+        # stops early, closing the channel stops generation at the next token
+        async with self._lease_context() as (llama, worker):
+            worker.submit(partial(_generate_stream, llama))
 
-        while True:
-            item = await queue.get()
-            if item is None:
-                break
-            elif isinstance(item, Exception):
-                raise item
-            else:
-                yield item
+            # Yield tokens as they arrive, propagate exceptions
+            try:
+                async for text in self._drain_stream_queue(channel):
+                    yield text
+            finally:
+                channel.close()
 
     async def unload(self) -> None:
         """Unload GGUF model and free resources."""
         logger.info(f"Unloading GGUF language model: {self.model_id}")
 
-        # Clear llama-cpp instance
-        self.llama = None
-
         # Reset multimodal flags to prevent use-after-free
         # If these remain True after unload, callers checking supports_audio/supports_vision
         # would see stale values and might attempt to use the freed model
         self._supports_audio = False
         self._supports_vision = False
 
-        # Shutdown thread pool executor
-        if hasattr(self, "_executor"):
-            self._executor.shutdown(wait=True, cancel_futures=True)
-            # Create new executor for potential future use
-            self._executor = ThreadPoolExecutor(max_workers=1)
+        # Stop the worker threads first, so no in-flight call still holds a
+        # context when it is freed. Joining happens off the event loop; load()
+        # starts a new worker if the model is loaded again.
+        workers = [self._worker] if hasattr(self, "_worker") else []
+        workers += [w for _, w in self._pool if w is not self._worker]
+        for worker in workers:
+            await asyncio.to_thread(worker.shutdown, True, True)
+
+        # Drop every reference to the contexts (the token counter holds one too)
+        # and free them explicitly rather than waiting for garbage collection
+        contexts = [llama for llama, _ in self._pool] or [self.llama]
+        self.llama = None
+        self._pool = []
+        self._idle_contexts = None
+        self._token_counter = None
+        self._context_manager = None
+        for llama in contexts:
+            if llama is not None:
+                llama.close()
+        del contexts
+        gc.collect()
 
         logger.info(f"GGUF language model unloaded: {self.model_id}")
 
     def __del__(self):
-        """Cleanup thread pool executor on deletion."""
-        if hasattr(self, "_executor"):
-            self._executor.shutdown(wait=False)
+        """Stop the worker threads on deletion."""
+        if hasattr(self, "_worker"):
+            self._worker.shutdown(wait=False)
+        for _, worker in getattr(self, "_pool", []):
+            if worker is not self._worker:
+                worker.shutdown(wait=False)
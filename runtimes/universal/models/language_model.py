@@ -12,7 +12,7 @@ from typing import TYPE_CHECKING, cast
 if TYPE_CHECKING:
     from transformers import PreTrainedTokenizerBase
 
-from .base import BaseModel
+from .base import BaseModel, tracks_requests
 
 logger = logging.getLogger(__name__)
 
@@ -78,6 +78,7 @@ class LanguageModel(BaseModel):
         prompt_parts.append("Assistant:")
         return "\n".join(prompt_parts)
 
+    @tracks_requests
     async def generate(
         self,
         messages: list[dict],
@@ -135,6 +136,7 @@ class LanguageModel(BaseModel):
 
         return generated_text.strip()
 
+    @tracks_requests
     async def generate_stream(
         self,
         messages: list[dict],
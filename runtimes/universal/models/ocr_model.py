@@ -8,22 +8,185 @@ Supports multiple OCR backends:
 - tesseract: Classic, widely deployed, no GPU needed
 """
 
-import base64
+import asyncio
+import hashlib
 import io
 import logging
+import os
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Literal
+from functools import lru_cache, partial
+from typing import Any, Literal, TypeVar
 
+import numpy as np
+from cachetools import LRUCache
 from PIL import Image
 
-from .base import BaseModel
+from .base import BaseModel, tracks_requests
+
+try:
+    # SIMD base64 decoder, noticeably faster on large page images
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
 
 logger = logging.getLogger(__name__)
 
 OCRBackend = Literal["surya", "easyocr", "paddleocr", "tesseract"]
+OCRPrecision = Literal["auto", "fp32", "fp16", "bf16", "int8"]
+
+# Decoded RGB image: PIL for surya/tesseract, HxWx3 uint8 array for backends
+# that take NumPy input (see ARRAY_BACKENDS)
+DecodedImage = Image.Image | np.ndarray
+ARRAY_BACKENDS = ("easyocr", "paddleocr")
+
+JPEG_MAGIC = b"\xff\xd8\xff"
+
+T = TypeVar("T")
+
+# Dedicated pool for blocking OCR work (decoding and backend calls), sized to
+# the CPU count so concurrent requests queue instead of oversubscribing cores
+_ocr_executor: ThreadPoolExecutor | None = None
+
+
+def _get_ocr_executor() -> ThreadPoolExecutor:
+    """Get or create the OCR thread pool."""
+    global _ocr_executor
+    if _ocr_executor is None:
+        _ocr_executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 4, thread_name_prefix="ocr-"
+        )
+    return _ocr_executor
+
+
+async def _run_ocr(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking function in the OCR thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_ocr_executor(), partial(func, *args, **kwargs)
+    )
+
+
+# Process-wide backend instances shared by OCRModel objects with the same
+# configuration: key -> [instance, reference count]. The lock only guards the
+# dicts; backends are constructed outside it so unrelated loads (and releases
+# from the event loop) never wait on a model that is still loading.
+_BACKEND_CACHE: dict[tuple, list[Any]] = {}
+_BACKEND_LOADING: dict[tuple, Future] = {}
+_BACKEND_CACHE_LOCK = threading.Lock()
+
+# Serializes Surya predictor construction, which toggles Surya's global
+# COMPILE_ALL setting for compiled loads
+_SURYA_SETTINGS_LOCK = threading.Lock()
+
+
+def _acquire_backend(key: tuple, factory: Callable[[], Any]) -> Any:
+    """Get the shared backend instance for ``key``, creating it if needed.
+
+    Blocking: call from a worker thread. Concurrent calls for the same key
+    wait for the first one's ``factory()`` instead of loading it twice.
+    """
+    while True:
+        with _BACKEND_CACHE_LOCK:
+            entry = _BACKEND_CACHE.get(key)
+            if entry is not None:
+                logger.info(f"Reusing loaded OCR backend: {key}")
+                entry[1] += 1
+                return entry[0]
+            pending = _BACKEND_LOADING.get(key)
+            if pending is None:
+                pending = _BACKEND_LOADING[key] = Future()
+                break
+
+        # Another thread is loading this key: wait, then take a reference (or
+        # load it ourselves if it was released in the meantime). A failed
+        # load raises here too.
+        pending.result()
+
+    try:
+        instance = factory()
+    except BaseException as e:
+        with _BACKEND_CACHE_LOCK:
+            del _BACKEND_LOADING[key]
+        pending.set_exception(e)
+        raise
+
+    with _BACKEND_CACHE_LOCK:
+        del _BACKEND_LOADING[key]
+        _BACKEND_CACHE[key] = [instance, 1]
+    pending.set_result(None)
+    return instance
+
+
+def _release_backend(key: tuple) -> None:
+    """Drop one reference to a shared backend, freeing it at zero."""
+    with _BACKEND_CACHE_LOCK:
+        entry = _BACKEND_CACHE.get(key)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+        del _BACKEND_CACHE[key]
+    # Last reference: tearing the backend down can take a while, so it happens
+    # after the lock is released
+    del entry
+
+
+def _bounds(points: Any) -> tuple[float, float, float, float]:
+    """Reduce a polygon of (x, y) points to its enclosing x1, y1, x2, y2."""
+    pts = np.asarray(points, dtype=np.float64)[:, :2]
+    x1, y1 = pts.min(axis=0).tolist()
+    x2, y2 = pts.max(axis=0).tolist()
+    return x1, y1, x2, y2
+
+
+def _has_valid_polygon(line: Any) -> bool:
+    """Check a Surya text line has a polygon of (x, y) points to box."""
+    poly = getattr(line, "polygon", None)
+    if not poly:
+        return False
+    if not all(isinstance(p, (list, tuple)) and len(p) >= 2 for p in poly):
+        logger.warning(f"Invalid polygon for line: {line.text}")
+        return False
+    return True
+
+
+def _uniform_size(shapes: list[tuple[int, ...]]) -> tuple[int, int]:
+    """Pick a shared (width, height) for a batch of differently sized images.
+
+    Uses the median height and median aspect ratio, snapped to multiples of 32
+    (the CRAFT detector downsamples by 32).
+    """
+    dims = np.asarray([shape[:2] for shape in shapes], dtype=np.float64)
+    height = float(np.median(dims[:, 0]))
+    aspect = float(np.median(dims[:, 1] / dims[:, 0]))
+    n_height = max(32, round(height / 32) * 32)
+    n_width = max(32, round(height * aspect / 32) * 32)
+    return n_width, n_height
 
 
-@dataclass
+def _quantize_linear_int8(predictor: Any) -> None:
+    """Swap a CPU predictor's linear layers for dynamic int8 versions in place.
+
+    Weights are stored as int8 and activations quantized on the fly, which runs
+    the transformer's matmuls on int8 kernels (VNNI where the CPU has it).
+    """
+    import torch
+
+    model = getattr(predictor, "model", None)
+    if model is None:
+        logger.warning("Surya predictor has no model to quantize, using fp32")
+        return
+    predictor.model = torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear}, dtype=torch.qint8
+    )
+    logger.info("Quantized Surya recognition model to dynamic int8")
+
+
+@dataclass(slots=True, frozen=True)
 class BoundingBox:
     """Bounding box for detected text."""
 
@@ -35,7 +198,7 @@ class BoundingBox:
     confidence: float | None = None  # None when confidence is unavailable
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OCRResult:
     """Result from OCR processing."""
 
@@ -45,6 +208,78 @@ class OCRResult:
     language: str | None = None
 
 
+class _MicroBatcher:
+    """Coalesces decoded images from concurrent ``recognize()`` calls.
+
+    Images are queued per options key (requests with different options never
+    share a backend call) and flushed as one batch once ``max_batch_size``
+    images are waiting or ``max_wait_ms`` has passed since the first arrived.
+    Each caller awaits futures for its own images, so results come back in
+    order; a backend error is raised in every caller whose images were in the
+    failed batch.
+    """
+
+    def __init__(self, max_batch_size: int = 32, max_wait_ms: float = 50.0):
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_ms = max_wait_ms
+        self._pending: dict[Hashable, list[tuple[DecodedImage, asyncio.Future]]] = {}
+        self._timers: dict[Hashable, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        key: Hashable,
+        images: list[DecodedImage],
+        process_batch: Callable[[list[DecodedImage]], Awaitable[list[OCRResult]]],
+    ) -> list[OCRResult]:
+        """Queue images for the next batch with this key and await their results."""
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in images]
+        bucket = self._pending.setdefault(key, [])
+        bucket.extend(zip(images, futures, strict=True))
+
+        if len(bucket) >= self.max_batch_size:
+            self._flush(key, process_batch)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(
+                self.max_wait_ms / 1000.0, self._flush, key, process_batch
+            )
+
+        return list(await asyncio.gather(*futures))
+
+    def _flush(
+        self,
+        key: Hashable,
+        process_batch: Callable[[list[DecodedImage]], Awaitable[list[OCRResult]]],
+    ) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        items = self._pending.pop(key, [])
+        for i in range(0, len(items), self.max_batch_size):
+            task = asyncio.ensure_future(
+                self._run(items[i : i + self.max_batch_size], process_batch)
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(
+        self,
+        items: list[tuple[DecodedImage, asyncio.Future]],
+        process_batch: Callable[[list[DecodedImage]], Awaitable[list[OCRResult]]],
+    ) -> None:
+        try:
+            results = await process_batch([image for image, _ in items])
+        except Exception as e:
+            for _, fut in items:
+                if not fut.done():
+                    fut.set_exception(e)
+            return
+        for (_, fut), result in zip(items, results, strict=True):
+            if not fut.done():
+                fut.set_result(result)
+
+
 class OCRModel(BaseModel):
     """Wrapper for OCR models with multiple backend support.
 
@@ -63,6 +298,12 @@ class OCRModel(BaseModel):
         device: str,
         backend: OCRBackend = "surya",
         languages: list[str] | None = None,
+        batch_size: int = 8,
+        batch_max: int = 32,
+        batch_wait_ms: float = 50.0,
+        compile_models: bool = False,
+        result_cache_size: int = 256,
+        precision: OCRPrecision = "auto",
     ):
         """Initialize OCR model.
 
@@ -71,12 +312,43 @@ class OCRModel(BaseModel):
             device: Target device (cuda/mps/cpu)
             backend: OCR backend to use
             languages: List of language codes (e.g., ['en', 'fr'])
+            batch_size: Images recognized per backend call. Larger requests are
+                split into chunks, and the next chunk is decoded while the
+                current one is being recognized.
+            batch_max: Maximum images per backend call when coalescing concurrent
+                requests (surya and easyocr on GPU only).
+            batch_wait_ms: How long the first queued image waits for others to
+                join its batch. Set to 0 to disable cross-request batching.
+            compile_models: Compile Surya's detection and recognition models with
+                torch.compile (CUDA only). The first batches are slow while the
+                graphs compile; later batches run fused kernels.
+            result_cache_size: Number of recent per-image results to keep, keyed
+                by a hash of the image and the request options. Repeated images
+                skip decoding and recognition. Set to 0 to disable.
+            precision: Weight dtype for Surya's models on GPU. "auto" keeps
+                Surya's default; "bf16" falls back to "fp16" on GPUs without
+                bfloat16 support (pre-Ampere). On CPU only "int8" applies: it
+                dynamically quantizes the recognition model's linear layers.
+                For PaddleOCR on CUDA, "fp16" runs the models as TensorRT FP16
+                engines (requires a Paddle build with TensorRT).
         """
         super().__init__(model_id, device)
         self.backend = backend
         self.languages = languages or ["en"]
+        self.batch_size = max(1, batch_size)
+        self.batch_max = batch_max
+        self.batch_wait_ms = batch_wait_ms
+        self.compile_models = compile_models
+        self.precision = precision
+        self._result_cache: LRUCache[tuple, OCRResult] | None = (
+            LRUCache(maxsize=result_cache_size) if result_cache_size > 0 else None
+        )
         self.model_type = f"ocr_{backend}"
         self.supports_streaming = False
+        # Tesseract "+"-joined language string for the init-time languages
+        self._default_tesseract_lang = self._tesseract_lang_string(
+            tuple(self.languages)
+        )
 
         # Backend-specific components
         self._reader = None  # EasyOCR reader
@@ -85,8 +357,23 @@ class OCRModel(BaseModel):
         self._surya_det_predictor = None
         self._surya_rec_predictor = None
 
+        # Key of the shared backend instance this model holds (set by load())
+        self._backend_key: tuple | None = None
+
+        # Cross-request batcher (set during load() for GPU batching backends)
+        self._batcher: _MicroBatcher | None = None
+
+        # JPEG decoders (None until first JPEG, False if unavailable)
+        self._tjpeg: Any = None
+        self._nv_decoder: Any = None
+        self._nv_lock = threading.Lock()
+
     async def load(self) -> None:
-        """Load the OCR model based on selected backend."""
+        """Load the OCR model based on selected backend.
+
+        Backend weights are shared with other OCRModel objects that use the
+        same configuration, so they are only loaded once per process.
+        """
         logger.info(f"Loading OCR model: {self.backend} on {self.device}")
 
         if self.backend == "surya":
@@ -100,33 +387,106 @@ class OCRModel(BaseModel):
         else:
             raise ValueError(f"Unsupported OCR backend: {self.backend}")
 
+        # Surya and EasyOCR batch on the GPU, so concurrent requests share calls
+        if (
+            self.backend in ("surya", "easyocr")
+            and self.device in ("cuda", "mps")
+            and self.batch_wait_ms > 0
+        ):
+            self._batcher = _MicroBatcher(self.batch_max, self.batch_wait_ms)
+
         logger.info(f"OCR model loaded: {self.backend}")
 
     async def _load_surya(self) -> None:
-        """Load Surya OCR model (v0.17+ API with predictor classes)."""
-        try:
-            from surya.detection import DetectionPredictor
-            from surya.recognition import FoundationPredictor, RecognitionPredictor
+        """Load Surya OCR model (v0.17+ API with predictor classes).
 
-            # Load detection predictor
-            self._surya_det_predictor = DetectionPredictor(device=self.device)
+        Like the other loaders, the backend import and weight loading happen in
+        the OCR thread pool, and only when no shared instance exists yet.
+        """
+        try:
+            compile_models = self.compile_models and self.device == "cuda"
+            quantize = self.precision == "int8" and self.device == "cpu"
+            dtype = self._surya_dtype()
+            dtype_kwargs = {"dtype": dtype} if dtype is not None else {}
+
+            def create():
+                from surya.detection import DetectionPredictor
+                from surya.recognition import FoundationPredictor, RecognitionPredictor
+                from surya.settings import settings as surya_settings
+
+                # Surya reads its process-global compile flag when predictors
+                # are constructed: turn it on only for this construction, and
+                # keep other Surya loads from building while it is flipped
+                with _SURYA_SETTINGS_LOCK:
+                    if compile_models:
+                        previous = surya_settings.COMPILE_ALL
+                        surya_settings.COMPILE_ALL = True
+                        logger.info("Compiling Surya models with torch.compile")
+                    try:
+                        # Load detection predictor
+                        det_predictor = DetectionPredictor(
+                            device=self.device, **dtype_kwargs
+                        )
 
-            # Load recognition predictor (requires foundation predictor)
-            foundation = FoundationPredictor(device=self.device)
-            self._surya_rec_predictor = RecognitionPredictor(foundation)
+                        # Load recognition predictor (requires foundation predictor)
+                        foundation = FoundationPredictor(
+                            device=self.device, **dtype_kwargs
+                        )
+                        if quantize:
+                            _quantize_linear_int8(foundation)
+                        rec_predictor = RecognitionPredictor(foundation)
+                    finally:
+                        if compile_models:
+                            surya_settings.COMPILE_ALL = previous
+                return det_predictor, rec_predictor
+
+            # Surya is language-agnostic, so languages are not part of the key
+            key = ("surya", self.device, compile_models, "int8" if quantize else dtype)
+            predictors = await _run_ocr(_acquire_backend, key, create)
+            self._surya_det_predictor, self._surya_rec_predictor = predictors
+            self._backend_key = key
 
         except ImportError as e:
             raise ImportError(
                 "Surya OCR not installed. Install with: uv pip install surya-ocr"
             ) from e
 
+    def _surya_dtype(self) -> Any:
+        """Resolve ``precision`` to a torch dtype for Surya, or None for default."""
+        if self.precision in ("auto", "int8") or self.device == "cpu":
+            return None
+
+        import torch
+
+        if self.precision == "fp32":
+            return torch.float32
+        if self.precision == "bf16":
+            if self.device != "cuda" or torch.cuda.get_device_capability() >= (8, 0):
+                return torch.bfloat16
+            logger.info("GPU has no bfloat16 support, loading Surya in fp16")
+        return torch.float16
+
     async def _load_easyocr(self) -> None:
         """Load EasyOCR reader."""
         try:
-            import easyocr
-
             gpu = self.device in ("cuda", "mps")
-            self._reader = easyocr.Reader(self.languages, gpu=gpu)
+
+            def create():
+                import easyocr
+
+                # cuDNN autotuning pays off because batches use a few fixed,
+                # 32-aligned shapes
+                reader = easyocr.Reader(
+                    self.languages, gpu=gpu, cudnn_benchmark=self.device == "cuda"
+                )
+                if gpu:
+                    # Warm up the GPU so the first request doesn't pay for it
+                    reader.readtext(np.zeros((480, 640, 3), dtype=np.uint8))
+                return reader
+
+            key = ("easyocr", self.device, tuple(self.languages))
+            self._reader = await _run_ocr(_acquire_backend, key, create)
+            self._backend_key = key
 
         except ImportError as e:
             raise ImportError(
@@ -136,12 +496,24 @@ class OCRModel(BaseModel):
     async def _load_paddleocr(self) -> None:
         """Load PaddleOCR instance."""
         try:
-            from paddleocr import PaddleOCR
-
             use_gpu = self.device == "cuda"
             # Map language codes
             lang = self.languages[0] if self.languages else "en"
-            self._ocr = PaddleOCR(use_angle_cls=True, lang=lang, use_gpu=use_gpu)
+            trt_kwargs = {}
+            if use_gpu and self.precision == "fp16":
+                # Fused TensorRT FP16 engines instead of plain Paddle Inference
+                trt_kwargs = {"use_tensorrt": True, "precision": "fp16"}
+
+            def create():
+                from paddleocr import PaddleOCR
+
+                return PaddleOCR(
+                    use_angle_cls=True, lang=lang, use_gpu=use_gpu, **trt_kwargs
+                )
+
+            key = ("paddleocr", self.device, lang, bool(trt_kwargs))
+            self._ocr = await _run_ocr(_acquire_backend, key, create)
+            self._backend_key = key
 
         except ImportError as e:
             raise ImportError(
@@ -153,8 +525,8 @@ class OCRModel(BaseModel):
         try:
             import pytesseract
 
-            # Test that tesseract binary is available
-            pytesseract.get_tesseract_version()
+            # Test that tesseract binary is available (spawns a process)
+            await _run_ocr(pytesseract.get_tesseract_version)
 
         except ImportError as e:
             raise ImportError(
@@ -165,6 +537,7 @@ class OCRModel(BaseModel):
                 "Tesseract binary not found. Install tesseract-ocr system package."
             ) from e
 
+    @tracks_requests
     async def recognize(
         self,
         images: list[str | bytes],
@@ -186,7 +559,6 @@ class OCRModel(BaseModel):
         Returns:
             List of OCRResult objects
         """
-        results = []
         langs = languages or self.languages
 
         # Warn if trying to override languages for backends that don't support it
@@ -197,153 +569,345 @@ class OCRModel(BaseModel):
             )
             langs = self.languages
 
-        for img_data in images:
-            # Decode image
-            pil_image = self._decode_image(img_data)
+        # Pick the batch processor for the backend
+        process_batch: Callable[[list[DecodedImage]], Awaitable[list[OCRResult]]]
+        if self.backend == "surya":
+            process_batch = partial(
+                self._recognize_surya,
+                return_boxes=return_boxes,
+                detect_layout=detect_layout,
+            )
+        elif self.backend == "easyocr":
+            process_batch = partial(self._recognize_easyocr, return_boxes=return_boxes)
+        elif self.backend == "paddleocr":
+            process_batch = partial(
+                self._recognize_paddleocr, return_boxes=return_boxes
+            )
+        elif self.backend == "tesseract":
 
-            # Run OCR based on backend
-            if self.backend == "surya":
-                result = await self._recognize_surya(
-                    pil_image, return_boxes, detect_layout
+            async def process_batch(pil_images: list[DecodedImage]) -> list[OCRResult]:
+                # Tesseract runs one process per image, so fan out across the pool
+                return list(
+                    await asyncio.gather(
+                        *(
+                            self._recognize_tesseract(pil_image, langs, return_boxes)
+                            for pil_image in pil_images
+                        )
+                    )
                 )
-            elif self.backend == "easyocr":
-                result = await self._recognize_easyocr(pil_image, return_boxes)
-            elif self.backend == "paddleocr":
-                result = await self._recognize_paddleocr(pil_image, return_boxes)
-            elif self.backend == "tesseract":
-                result = await self._recognize_tesseract(pil_image, langs, return_boxes)
+
+        else:
+            raise ValueError(f"Unsupported backend: {self.backend}")
+
+        # Share backend calls with concurrent requests that use the same options
+        if self._batcher is not None:
+            process_batch = partial(
+                self._batcher.submit,
+                (return_boxes, detect_layout),
+                process_batch=process_batch,
+            )
+
+        if self._result_cache is None:
+            return await self._run_pipeline(images, process_batch)
+
+        # Serve repeated images from the cache; duplicates within the request
+        # are recognized once
+        options = (tuple(langs), return_boxes, detect_layout)
+        results: list[OCRResult | None] = [None] * len(images)
+        misses: dict[tuple, list[int]] = {}
+        for i, img_data in enumerate(images):
+            key = (self._image_digest(img_data), options)
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                results[i] = cached
             else:
-                raise ValueError(f"Unsupported backend: {self.backend}")
+                misses.setdefault(key, []).append(i)
+
+        if misses:
+            miss_images = [images[indices[0]] for indices in misses.values()]
+            recognized = await self._run_pipeline(miss_images, process_batch)
+            for (key, indices), result in zip(misses.items(), recognized, strict=True):
+                self._result_cache[key] = result
+                for i in indices:
+                    results[i] = result
+
+        return results
+
+    @staticmethod
+    def _image_digest(img_data: str | bytes) -> bytes:
+        """Hash encoded image data for the result cache."""
+        if isinstance(img_data, str):
+            img_data = img_data.encode()
+        return hashlib.blake2b(img_data, digest_size=16).digest()
+
+    async def _run_pipeline(
+        self,
+        images: list[str | bytes],
+        process_batch: Callable[[list[DecodedImage]], Awaitable[list[OCRResult]]],
+    ) -> list[OCRResult]:
+        """Decode and recognize images in chunks of ``batch_size``.
+
+        Decoding runs in a worker thread one chunk ahead of recognition, so CPU
+        decode work overlaps with backend inference instead of adding to it.
+
+        Args:
+            images: Encoded images (base64 strings or raw bytes)
+            process_batch: Coroutine that recognizes a chunk of decoded images
 
-            results.append(result)
+        Returns:
+            OCRResult objects in the same order as ``images``
+        """
+        chunks = [
+            images[i : i + self.batch_size]
+            for i in range(0, len(images), self.batch_size)
+        ]
+        if not chunks:
+            return []
+
+        # EasyOCR and PaddleOCR take arrays, so decode straight to NumPy in the
+        # worker thread instead of converting PIL images on the event loop
+        as_array = self.backend in ARRAY_BACKENDS
+
+        def decode_chunk(chunk: list[str | bytes]) -> list[DecodedImage]:
+            return [self._decode_image(img_data, as_array) for img_data in chunk]
+
+        results: list[OCRResult] = []
+        next_decode = asyncio.ensure_future(_run_ocr(decode_chunk, chunks[0]))
+        try:
+            for i in range(len(chunks)):
+                pil_images = await next_decode
+                if i + 1 < len(chunks):
+                    next_decode = asyncio.ensure_future(
+                        _run_ocr(decode_chunk, chunks[i + 1])
+                    )
+                results.extend(await process_batch(pil_images))
+        finally:
+            next_decode.cancel()
 
         return results
 
-    def _decode_image(self, img_data: str | bytes) -> Image.Image:
-        """Decode image from base64 string or bytes."""
+    def _decode_image(
+        self, img_data: str | bytes, as_array: bool = False
+    ) -> DecodedImage:
+        """Decode image from base64 string or bytes.
+
+        Returns an RGB PIL image, or an HxWx3 uint8 array when ``as_array``.
+        JPEG fast paths decode to arrays, so they skip PIL when ``as_array``.
+        """
         if isinstance(img_data, str):
             # Handle base64 with or without data URI prefix
             if img_data.startswith("data:"):
-                # Remove data URI prefix (e.g., "data:image/png;base64,")
-                img_data = img_data.split(",", 1)[1]
-            img_bytes = base64.b64decode(img_data)
+                # Remove data URI prefix (e.g., "data:image/png;base64,"). The
+                # header is short, so only its start is scanned for the comma.
+                img_data = img_data[img_data.index(",", 0, 256) + 1 :]
+            img_bytes = _b64.b64decode(img_data)
         else:
             img_bytes = img_data
 
-        return Image.open(io.BytesIO(img_bytes)).convert("RGB")
+        if img_bytes[:3] == JPEG_MAGIC:
+            pixels = self._decode_jpeg(img_bytes)
+            if pixels is not None:
+                return pixels if as_array else Image.fromarray(pixels)
+
+        image = Image.open(io.BytesIO(img_bytes)).convert("RGB")
+        return np.array(image) if as_array else image
+
+    def _decode_jpeg(self, img_bytes: bytes) -> np.ndarray | None:
+        """Decode a JPEG with nvImageCodec (CUDA) or TurboJPEG.
+
+        Returns None when neither decoder is available or both reject the
+        image, so the caller can fall back to PIL (which also reports errors).
+        """
+        if self.device == "cuda":
+            decoder = self._get_nv_decoder()
+            if decoder:
+                try:
+                    # Decode on the GPU, then copy the RGB pixels back to host
+                    with self._nv_lock:
+                        decoded = decoder.decode(img_bytes)
+                    if decoded is not None:
+                        return np.asarray(decoded.cpu())
+                except Exception as e:
+                    logger.debug(f"nvImageCodec decode failed: {e}")
+
+        tjpeg = self._get_turbojpeg()
+        if tjpeg:
+            from turbojpeg import TJPF_RGB
+
+            try:
+                return tjpeg.decode(img_bytes, pixel_format=TJPF_RGB)
+            except Exception as e:
+                logger.debug(f"TurboJPEG decode failed: {e}")
+
+        return None
+
+    def _get_nv_decoder(self) -> Any:
+        """Get the nvImageCodec GPU decoder, or False if it is not installed.
+
+        Optional: install with ``uv pip install nvidia-nvimgcodec-cu12``.
+        """
+        if self._nv_decoder is None:
+            try:
+                from nvidia import nvimgcodec
+
+                self._nv_decoder = nvimgcodec.Decoder()
+            except Exception as e:
+                # Module missing, or no usable CUDA device/driver
+                logger.debug(f"nvImageCodec unavailable: {e}")
+                self._nv_decoder = False
+        return self._nv_decoder
+
+    def _get_turbojpeg(self) -> Any:
+        """Get this model's TurboJPEG decoder, or False if it is not installed.
+
+        PyTurboJPEG decodes JPEGs straight to RGB with libjpeg-turbo's SIMD
+        routines. It is optional: install with ``uv pip install PyTurboJPEG``.
+        """
+        if self._tjpeg is None:
+            try:
+                from turbojpeg import TurboJPEG
+
+                self._tjpeg = TurboJPEG()
+            except (ImportError, OSError, RuntimeError) as e:
+                # Module missing, or libturbojpeg shared library not found
+                logger.debug(f"TurboJPEG unavailable, decoding JPEG with PIL: {e}")
+                self._tjpeg = False
+        return self._tjpeg
 
     async def _recognize_surya(
-        self, image: Image.Image, return_boxes: bool, detect_layout: bool = True
-    ) -> OCRResult:
-        """Run Surya OCR (v0.17+ API with predictor classes).
+        self,
+        images: list[Image.Image],
+        return_boxes: bool,
+        detect_layout: bool = True,
+    ) -> list[OCRResult]:
+        """Run Surya OCR (v0.17+ API with predictor classes) on a batch of images.
+
+        All images go through detection and recognition in a single predictor
+        call, so the models batch them on the device.
 
         Args:
-            image: PIL Image to process
+            images: PIL Images to process
             return_boxes: Whether to return bounding boxes
             detect_layout: If True, run text detection first to find text regions.
                 If False, treat entire image as single text block (faster but less accurate).
         """
-        import asyncio
 
         # Run detection and recognition in thread pool to avoid blocking
         def run_surya():
             # New Surya API: pass det_predictor as kwarg, it handles detection internally
             rec_results = self._surya_rec_predictor(
-                [image],
+                images,
                 det_predictor=self._surya_det_predictor if detect_layout else None,
             )
             return rec_results
 
-        rec_results = await asyncio.to_thread(run_surya)
+        rec_results = await _run_ocr(run_surya)
 
-        # Extract results from the first image
-        text_lines = []
-        boxes = []
-        confidences = []
-
-        result = rec_results[0]
-        for line in result.text_lines:
-            text_lines.append(line.text)
-            # Use None for unknown confidence rather than a misleading default
-            line_confidence = getattr(line, "confidence", None)
-            confidences.append(line_confidence)
-
-            if return_boxes and hasattr(line, "polygon") and line.polygon:
-                # Get bounding box from polygon - validate polygon structure
-                poly = line.polygon
-                if not poly or not all(
-                    isinstance(p, (list, tuple)) and len(p) >= 2 for p in poly
-                ):
-                    logger.warning(f"Invalid polygon for line: {line.text}")
-                    continue
-
-                x_coords = [p[0] for p in poly]
-                y_coords = [p[1] for p in poly]
-                boxes.append(
-                    BoundingBox(
-                        x1=min(x_coords),
-                        y1=min(y_coords),
-                        x2=max(x_coords),
-                        y2=max(y_coords),
-                        text=line.text,
-                        confidence=line_confidence,
-                    )
-                )
+        return [
+            self._parse_surya_result(result, return_boxes) for result in rec_results
+        ]
 
-        full_text = "\n".join(text_lines)
-        # Filter out None confidences when calculating average
-        valid_confidences = [c for c in confidences if c is not None]
-        avg_confidence = (
-            sum(valid_confidences) / len(valid_confidences)
-            if valid_confidences
-            else None
-        )
+    def _parse_surya_result(self, result: Any, return_boxes: bool) -> OCRResult:
+        """Convert one Surya recognition result into an OCRResult."""
+        lines = result.text_lines
+        # Use None for unknown confidence rather than a misleading default
+        confidences = [getattr(line, "confidence", None) for line in lines]
+        # None confidences are left out of the average
+        known = np.fromiter((c for c in confidences if c is not None), dtype=np.float64)
+        avg_confidence = float(known.mean()) if known.size else None
+
+        boxes = None
+        if return_boxes:
+            boxes = [
+                BoundingBox(*_bounds(line.polygon), text=line.text, confidence=conf)
+                for line, conf in zip(lines, confidences, strict=True)
+                if _has_valid_polygon(line)
+            ]
 
         return OCRResult(
-            text=full_text,
+            text="\n".join([line.text for line in lines]),
             confidence=avg_confidence,
-            boxes=boxes if return_boxes else None,
+            boxes=boxes,
         )
 
     async def _recognize_easyocr(
-        self, image: Image.Image, return_boxes: bool
-    ) -> OCRResult:
-        """Run EasyOCR."""
-        import asyncio
-
-        import numpy as np
+        self, images: list[np.ndarray], return_boxes: bool
+    ) -> list[OCRResult]:
+        """Run EasyOCR on a batch of RGB arrays."""
+        # No-op for decoded arrays; converts PIL images passed in directly
+        img_arrays = [np.asarray(image) for image in images]
 
-        # Convert PIL to numpy array
-        img_array = np.array(image)
+        shapes = [a.shape for a in img_arrays]
+        scales: list[tuple[float, float] | None] = [None] * len(img_arrays)
 
         # Run OCR in thread pool to avoid blocking the event loop
-        results = await asyncio.to_thread(self._reader.readtext, img_array)
+        if len(img_arrays) > 1 and len(set(shapes)) == 1:
+            # Same-sized images go through the detector and recognizer as one batch
+            height, width = shapes[0][:2]
+            batch_results = await _run_ocr(
+                self._reader.readtext_batched,
+                img_arrays,
+                n_width=width,
+                n_height=height,
+            )
+        elif len(img_arrays) > 1 and self.device in ("cuda", "mps"):
+            # On GPU, EasyOCR resizes mixed sizes to one shape so they still
+            # batch; boxes come back in resized coordinates and are scaled back
+            width, height = _uniform_size(shapes)
+            scales = [(shape[1] / width, shape[0] / height) for shape in shapes]
+            batch_results = await _run_ocr(
+                self._reader.readtext_batched,
+                img_arrays,
+                n_width=width,
+                n_height=height,
+            )
+        else:
+            batch_results = await _run_ocr(
+                lambda: [self._reader.readtext(a) for a in img_arrays]
+            )
 
+        return [
+            self._parse_easyocr_result(results, return_boxes, scale)
+            for results, scale in zip(batch_results, scales, strict=True)
+        ]
+
+    def _parse_easyocr_result(
+        self,
+        results: list,
+        return_boxes: bool,
+        scale: tuple[float, float] | None = None,
+    ) -> OCRResult:
+        """Convert EasyOCR detections for one image into an OCRResult.
+
+        ``scale`` maps boxes from a resized batch back to the original image.
+        """
         text_lines = []
         boxes = []
-        confidences = []
+        conf_sum = 0.0
 
         for bbox, text, confidence in results:
             text_lines.append(text)
-            confidences.append(confidence)
+            conf_sum += confidence
 
             if return_boxes:
                 # EasyOCR returns 4 corner points, convert to x1,y1,x2,y2
-                x_coords = [p[0] for p in bbox]
-                y_coords = [p[1] for p in bbox]
+                x1, y1, x2, y2 = _bounds(bbox)
+                if scale is not None:
+                    sx, sy = scale
+                    x1, y1, x2, y2 = x1 * sx, y1 * sy, x2 * sx, y2 * sy
                 boxes.append(
                     BoundingBox(
-                        x1=min(x_coords),
-                        y1=min(y_coords),
-                        x2=max(x_coords),
-                        y2=max(y_coords),
+                        x1=x1,
+                        y1=y1,
+                        x2=x2,
+                        y2=y2,
                         text=text,
                         confidence=confidence,
                     )
                 )
 
         full_text = " ".join(text_lines)
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+        avg_confidence = conf_sum / len(text_lines) if text_lines else 0.0
 
         return OCRResult(
             text=full_text,
@@ -352,46 +916,54 @@ class OCRModel(BaseModel):
         )
 
     async def _recognize_paddleocr(
-        self, image: Image.Image, return_boxes: bool
-    ) -> OCRResult:
-        """Run PaddleOCR."""
-        import asyncio
-
-        import numpy as np
+        self, images: list[np.ndarray], return_boxes: bool
+    ) -> list[OCRResult]:
+        """Run PaddleOCR on a batch of RGB arrays.
 
-        # Convert PIL to numpy array
-        img_array = np.array(image)
+        PaddleOCR's ``ocr()`` takes one image at a time, so the batch is run in a
+        single worker thread hop rather than one hop per image.
+        """
+        # No-op for decoded arrays; converts PIL images passed in directly
+        img_arrays = [np.asarray(image) for image in images]
 
         # Run OCR in thread pool to avoid blocking the event loop
-        results = await asyncio.to_thread(self._ocr.ocr, img_array, cls=True)
+        batch_results = await _run_ocr(
+            lambda: [self._ocr.ocr(a, cls=True) for a in img_arrays]
+        )
+
+        return [
+            self._parse_paddleocr_result(results, return_boxes)
+            for results in batch_results
+        ]
 
+    def _parse_paddleocr_result(self, results: list, return_boxes: bool) -> OCRResult:
+        """Convert PaddleOCR output for one image into an OCRResult."""
         text_lines = []
         boxes = []
-        confidences = []
+        conf_sum = 0.0
 
         if results and results[0]:
             for line in results[0]:
                 bbox, (text, confidence) = line
                 text_lines.append(text)
-                confidences.append(confidence)
+                conf_sum += confidence
 
                 if return_boxes:
                     # PaddleOCR returns 4 corner points
-                    x_coords = [p[0] for p in bbox]
-                    y_coords = [p[1] for p in bbox]
+                    x1, y1, x2, y2 = _bounds(bbox)
                     boxes.append(
                         BoundingBox(
-                            x1=min(x_coords),
-                            y1=min(y_coords),
-                            x2=max(x_coords),
-                            y2=max(y_coords),
+                            x1=x1,
+                            y1=y1,
+                            x2=x2,
+                            y2=y2,
                             text=text,
                             confidence=confidence,
                         )
                     )
 
         full_text = " ".join(text_lines)
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+        avg_confidence = conf_sum / len(text_lines) if text_lines else 0.0
 
         return OCRResult(
             text=full_text,
@@ -434,65 +1006,75 @@ class OCRModel(BaseModel):
         "uk": "ukr",
     }
 
-    def _convert_lang_codes(self, languages: list[str]) -> list[str]:
+    @classmethod
+    def _convert_lang_codes(cls, languages: list[str]) -> list[str]:
         """Convert 2-letter ISO-639-1 codes to Tesseract 3-letter codes."""
         converted = []
         for lang in languages:
             # If it's a 2-letter code, try to convert; otherwise use as-is
-            if len(lang) == 2 and lang.lower() in self.LANG_CODE_MAP:
-                converted.append(self.LANG_CODE_MAP[lang.lower()])
+            if len(lang) == 2 and lang.lower() in cls.LANG_CODE_MAP:
+                converted.append(cls.LANG_CODE_MAP[lang.lower()])
             else:
                 # Assume it's already a valid Tesseract code
                 converted.append(lang)
         return converted
 
+    @classmethod
+    @lru_cache(maxsize=32)
+    def _tesseract_lang_string(cls, languages: tuple[str, ...]) -> str:
+        """Get the "+"-joined Tesseract language string, memoized per language set."""
+        return "+".join(cls._convert_lang_codes(list(languages)))
+
     async def _recognize_tesseract(
         self, image: Image.Image, languages: list[str], return_boxes: bool
     ) -> OCRResult:
         """Run Tesseract OCR."""
-        import asyncio
-
         import pytesseract
 
-        # Convert 2-letter codes to Tesseract 3-letter codes
-        tesseract_langs = self._convert_lang_codes(languages)
-        # Join languages with + for tesseract
-        lang_str = "+".join(tesseract_langs)
+        # Tesseract wants 3-letter codes joined with +
+        if languages == self.languages:
+            lang_str = self._default_tesseract_lang
+        else:
+            lang_str = self._tesseract_lang_string(tuple(languages))
 
         if return_boxes:
             # Get detailed output with bounding boxes
             # Run in thread pool to avoid blocking the event loop
-            data = await asyncio.to_thread(
+            data = await _run_ocr(
                 pytesseract.image_to_data,
                 image,
                 lang=lang_str,
                 output_type=pytesseract.Output.DICT,
             )
 
-            text_lines = []
-            boxes = []
-            confidences = []
-
-            for i, text in enumerate(data["text"]):
-                if text.strip():
-                    conf = float(data["conf"][i])
-                    if conf > 0:  # Filter out low-confidence detections
-                        text_lines.append(text)
-                        confidences.append(conf / 100.0)  # Normalize to 0-1
-
-                        boxes.append(
-                            BoundingBox(
-                                x1=data["left"][i],
-                                y1=data["top"][i],
-                                x2=data["left"][i] + data["width"][i],
-                                y2=data["top"][i] + data["height"][i],
-                                text=text,
-                                confidence=conf / 100.0,
-                            )
-                        )
+            # Keep non-empty words with positive confidence, normalized to 0-1
+            text_arr = np.asarray(data["text"], dtype=str)
+            conf_arr = np.asarray(data["conf"], dtype=np.float64)
+            keep = np.flatnonzero(
+                (conf_arr > 0) & (np.char.str_len(np.char.strip(text_arr)) > 0)
+            )
+            conf_arr = conf_arr[keep] / 100.0
+            left = np.asarray(data["left"])[keep]
+            top = np.asarray(data["top"])[keep]
+            right = left + np.asarray(data["width"])[keep]
+            bottom = top + np.asarray(data["height"])[keep]
+
+            text_lines = [data["text"][i] for i in keep.tolist()]
+            boxes = [
+                BoundingBox(x1=x1, y1=y1, x2=x2, y2=y2, text=text, confidence=conf)
+                for x1, y1, x2, y2, text, conf in zip(
+                    left.tolist(),
+                    top.tolist(),
+                    right.tolist(),
+                    bottom.tolist(),
+                    text_lines,
+                    conf_arr.tolist(),
+                    strict=True,
+                )
+            ]
 
             full_text = " ".join(text_lines)
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+            avg_confidence = float(conf_arr.mean()) if conf_arr.size else 0.0
 
             return OCRResult(
                 text=full_text,
@@ -502,9 +1084,7 @@ class OCRModel(BaseModel):
         else:
             # Simple text extraction
             # Run in thread pool to avoid blocking the event loop
-            text = await asyncio.to_thread(
-                pytesseract.image_to_string, image, lang=lang_str
-            )
+            text = await _run_ocr(pytesseract.image_to_string, image, lang=lang_str)
             return OCRResult(
                 text=text.strip(),
                 confidence=0.9,  # Tesseract doesn't provide overall confidence
@@ -520,6 +1100,14 @@ class OCRModel(BaseModel):
         self._ocr = None
         self._surya_det_predictor = None
         self._surya_rec_predictor = None
+        if self._backend_key is not None:
+            # Off the event loop: freeing the last reference tears down the model
+            await _run_ocr(_release_backend, self._backend_key)
+            self._backend_key = None
+        self._batcher = None
+        self._nv_decoder = None
+        if self._result_cache is not None:
+            self._result_cache.clear()
 
         # Call parent unload for GPU cleanup
         await super().unload()
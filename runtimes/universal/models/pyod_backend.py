@@ -28,7 +28,10 @@ All backends share a common interface:
 Reference: https://pyod.readthedocs.io/
 """
 
+import copy
+import functools
 import logging
+from collections.abc import Callable
 from typing import Any, Literal
 
 import numpy as np
@@ -76,6 +79,11 @@ BACKEND_REGISTRY: dict[str, str] = {
     "mcd": "pyod.models.mcd.MCD",
 }
 
+# Backends whose decision_function() ranks a batch against the training data
+# plus the batch itself (empirical CDF / copula based), so a point's score
+# depends on what it is scored alongside. SUOD's default ensemble includes COPOD.
+TRANSDUCTIVE_BACKENDS = frozenset({"ecod", "copod", "suod"})
+
 # Backend metadata for /v1/anomaly/backends endpoint
 BACKEND_INFO: dict[str, dict[str, Any]] = {
     # Legacy backends
@@ -230,6 +238,36 @@ def is_legacy_backend(backend: str) -> bool:
 # Detector Creation
 # =============================================================================
 
+# Detector classes resolved from BACKEND_REGISTRY-style paths, so repeat
+# detector creation skips the import machinery
+_CLASS_CACHE: dict[str, type] = {}
+
+
+def _import_class(class_path: str) -> type:
+    """Resolve "package.module.ClassName" to the class, caching the result."""
+    detector_class = _CLASS_CACHE.get(class_path)
+    if detector_class is None:
+        import importlib
+
+        module_name, class_name = class_path.rsplit(".", 1)
+        module = importlib.import_module(module_name)
+        detector_class = _CLASS_CACHE[class_path] = getattr(module, class_name)
+    return detector_class
+
+
+@functools.lru_cache(maxsize=8)
+def _default_suod_bases(contamination: float) -> tuple[Any, ...]:
+    """Unfitted prototypes of the default SUOD ensemble (IForest, HBOS, COPOD).
+
+    Never fitted themselves - callers take copies, since SUOD fits its base
+    estimators in place.
+    """
+    return tuple(
+        _import_class(BACKEND_REGISTRY[name])(contamination=contamination)
+        for name in ("isolation_forest", "hbos", "copod")
+    )
+
+
 def create_detector(
     backend: AnomalyBackendType,
     contamination: float = 0.1,
@@ -255,14 +293,9 @@ def create_detector(
             f"Available: {get_all_backends()}"
         )
 
-    # Import the detector class dynamically
-    module_path = BACKEND_REGISTRY[backend]
-    module_name, class_name = module_path.rsplit(".", 1)
-
+    # Import the detector class dynamically (cached after the first call)
     try:
-        import importlib
-        module = importlib.import_module(module_name)
-        detector_class = getattr(module, class_name)
+        detector_class = _import_class(BACKEND_REGISTRY[backend])
     except ImportError as e:
         raise ImportError(
             f"PyOD is required for backend '{backend}'. "
@@ -278,127 +311,144 @@ def create_detector(
     return detector
 
 
-def _create_detector_with_params(
-    detector_class: type,
-    backend: str,
-    contamination: float,
-    **kwargs: Any,
-) -> Any:
-    """Create detector instance with backend-specific parameters."""
+def _make_isolation_forest(cls: type, contamination: float, kwargs: dict[str, Any]) -> Any:
+    return cls(
+        contamination=contamination,
+        n_estimators=kwargs.get("n_estimators", 100),
+        max_samples=kwargs.get("max_samples", "auto"),
+        random_state=kwargs.get("random_state", 42),
+        n_jobs=kwargs.get("n_jobs", -1),
+    )
 
-    # Common parameters
-    common_params = {"contamination": contamination}
-
-    # Backend-specific parameter handling
-    if backend == "isolation_forest":
-        return detector_class(
-            **common_params,
-            n_estimators=kwargs.get("n_estimators", 100),
-            max_samples=kwargs.get("max_samples", "auto"),
-            random_state=kwargs.get("random_state", 42),
-            n_jobs=kwargs.get("n_jobs", -1),
-        )
 
-    elif backend == "one_class_svm":
-        # OCSVM uses 'nu' instead of 'contamination' internally
-        # but PyOD's OCSVM accepts contamination
-        return detector_class(
-            **common_params,
-            kernel=kwargs.get("kernel", "rbf"),
-            gamma=kwargs.get("gamma", "auto"),
-            nu=kwargs.get("nu", contamination),  # nu ≈ contamination
-        )
+def _make_one_class_svm(cls: type, contamination: float, kwargs: dict[str, Any]) -> Any:
+    # OCSVM uses 'nu' instead of 'contamination' internally
+    # but PyOD's OCSVM accepts contamination
+    return cls(
+        contamination=contamination,
+        kernel=kwargs.get("kernel", "rbf"),
+        gamma=kwargs.get("gamma", "auto"),
+        nu=kwargs.get("nu", contamination),  # nu ≈ contamination
+    )
 
-    elif backend == "local_outlier_factor":
-        return detector_class(
-            **common_params,
-            n_neighbors=kwargs.get("n_neighbors", 20),
-            n_jobs=kwargs.get("n_jobs", -1),
-        )
 
-    elif backend == "autoencoder":
-        # AutoEncoder has more parameters
-        # PyOD uses hidden_neuron_list and epoch_num (not hidden_neurons/epochs)
-        # Accept friendly names and map to PyOD parameter names
-        hidden_neuron_list = kwargs.get(
-            "hidden_neuron_list",
-            kwargs.get("hidden_neurons", [64, 32])
-        )
-        return detector_class(
-            **common_params,
-            hidden_neuron_list=hidden_neuron_list,
-            epoch_num=kwargs.get("epochs", kwargs.get("epoch_num", 100)),
-            batch_size=kwargs.get("batch_size", 32),
-            preprocessing=kwargs.get("preprocessing", True),
-            verbose=kwargs.get("verbose", 0),
-            random_state=kwargs.get("random_state", 42),
-        )
+def _make_local_outlier_factor(cls: type, contamination: float, kwargs: dict[str, Any]) -> Any:
+    return cls(
+        contamination=contamination,
+        n_neighbors=kwargs.get("n_neighbors", 20),
+        n_jobs=kwargs.get("n_jobs", -1),
+    )
 
-    elif backend == "ecod":
-        # ECOD is parameter-free
-        return detector_class(**common_params)
 
-    elif backend == "hbos":
-        return detector_class(
-            **common_params,
-            n_bins=kwargs.get("n_bins", 10),
-        )
+def _make_autoencoder(cls: type, contamination: float, kwargs: dict[str, Any]) -> Any:
+    # AutoEncoder has more parameters
+    # PyOD uses hidden_neuron_list and epoch_num (not hidden_neurons/epochs)
+    # Accept friendly names and map to PyOD parameter names
+    hidden_neuron_list = kwargs.get(
+        "hidden_neuron_list",
+        kwargs.get("hidden_neurons", [64, 32])
+    )
+    return cls(
+        contamination=contamination,
+        hidden_neuron_list=hidden_neuron_list,
+        epoch_num=kwargs.get("epochs", kwargs.get("epoch_num", 100)),
+        batch_size=kwargs.get("batch_size", 32),
+        preprocessing=kwargs.get("preprocessing", True),
+        verbose=kwargs.get("verbose", 0),
+        random_state=kwargs.get("random_state", 42),
+    )
 
-    elif backend == "copod":
-        # COPOD is parameter-free
-        return detector_class(**common_params)
 
-    elif backend == "knn":
-        return detector_class(
-            **common_params,
-            n_neighbors=kwargs.get("n_neighbors", 5),
-            method=kwargs.get("method", "largest"),
-            n_jobs=kwargs.get("n_jobs", -1),
-        )
+def _make_parameter_free(cls: type, contamination: float, kwargs: dict[str, Any]) -> Any:
+    # ECOD and COPOD take no parameters besides contamination
+    return cls(contamination=contamination)
 
-    elif backend == "cblof":
-        return detector_class(
-            **common_params,
-            n_clusters=kwargs.get("n_clusters", 8),
-            random_state=kwargs.get("random_state", 42),
-        )
 
-    elif backend == "suod":
-        # SUOD is an ensemble - can accept base estimators
-        base_estimators = kwargs.get("base_estimators")
-        if base_estimators is None:
-            # Default ensemble: fast + accurate mix
-            from pyod.models.copod import COPOD
-            from pyod.models.hbos import HBOS
-            from pyod.models.iforest import IForest
-            base_estimators = [
-                IForest(contamination=contamination),
-                HBOS(contamination=contamination),
-                COPOD(contamination=contamination),
-            ]
-        return detector_class(
-            base_estimators=base_estimators,
-            contamination=contamination,
-            n_jobs=kwargs.get("n_jobs", -1),
-        )
+def _make_hbos(cls: type, contamination: float, kwargs: dict[str, Any]) -> Any:
+    return cls(
+        contamination=contamination,
+        n_bins=kwargs.get("n_bins", 10),
+    )
 
-    elif backend == "loda":
-        return detector_class(
-            **common_params,
-            n_bins=kwargs.get("n_bins", 10),
-            n_random_cuts=kwargs.get("n_random_cuts", 100),
-        )
 
-    elif backend == "mcd":
-        return detector_class(
-            **common_params,
-            random_state=kwargs.get("random_state", 42),
-        )
+def _make_knn(cls: type, contamination: float, kwargs: dict[str, Any]) -> Any:
+    return cls(
+        contamination=contamination,
+        n_neighbors=kwargs.get("n_neighbors", 5),
+        method=kwargs.get("method", "largest"),
+        n_jobs=kwargs.get("n_jobs", -1),
+    )
 
-    else:
-        # Fallback: pass contamination plus any user-provided kwargs
-        # This ensures custom parameters aren't silently ignored
-        return detector_class(**common_params, **kwargs)
+
+def _make_cblof(cls: type, contamination: float, kwargs: dict[str, Any]) -> Any:
+    return cls(
+        contamination=contamination,
+        n_clusters=kwargs.get("n_clusters", 8),
+        random_state=kwargs.get("random_state", 42),
+    )
+
+
+def _make_suod(cls: type, contamination: float, kwargs: dict[str, Any]) -> Any:
+    # SUOD is an ensemble - can accept base estimators
+    base_estimators = kwargs.get("base_estimators")
+    if base_estimators is None:
+        # Default ensemble: fast + accurate mix. Copies of cached unfitted
+        # prototypes, so each detector fits its own instances
+        base_estimators = [copy.copy(e) for e in _default_suod_bases(contamination)]
+    return cls(
+        base_estimators=base_estimators,
+        contamination=contamination,
+        n_jobs=kwargs.get("n_jobs", -1),
+    )
+
+
+def _make_loda(cls: type, contamination: float, kwargs: dict[str, Any]) -> Any:
+    return cls(
+        contamination=contamination,
+        n_bins=kwargs.get("n_bins", 10),
+        n_random_cuts=kwargs.get("n_random_cuts", 100),
+    )
+
+
+def _make_mcd(cls: type, contamination: float, kwargs: dict[str, Any]) -> Any:
+    return cls(
+        contamination=contamination,
+        random_state=kwargs.get("random_state", 42),
+    )
+
+
+def _make_default(cls: type, contamination: float, kwargs: dict[str, Any]) -> Any:
+    # Fallback: pass contamination plus any user-provided kwargs
+    # This ensures custom parameters aren't silently ignored
+    return cls(contamination=contamination, **kwargs)
+
+
+# Backend-specific constructors: one dict lookup per detector instead of an
+# if/elif chain
+_FACTORIES: dict[str, Callable[[type, float, dict[str, Any]], Any]] = {
+    "isolation_forest": _make_isolation_forest,
+    "one_class_svm": _make_one_class_svm,
+    "local_outlier_factor": _make_local_outlier_factor,
+    "autoencoder": _make_autoencoder,
+    "ecod": _make_parameter_free,
+    "hbos": _make_hbos,
+    "copod": _make_parameter_free,
+    "knn": _make_knn,
+    "cblof": _make_cblof,
+    "suod": _make_suod,
+    "loda": _make_loda,
+    "mcd": _make_mcd,
+}
+
+
+def _create_detector_with_params(
+    detector_class: type,
+    backend: str,
+    contamination: float,
+    **kwargs: Any,
+) -> Any:
+    """Create detector instance with backend-specific parameters."""
+    return _FACTORIES.get(backend, _make_default)(detector_class, contamination, kwargs)
 
 
 # =============================================================================
@@ -426,6 +476,46 @@ def fit_detector(detector: Any, X: np.ndarray) -> None:
     logger.debug(f"Fitted detector on {X.shape[0]} samples, {X.shape[1]} features")
 
 
+# KNN queries up to this many rows compute distances to the training matrix
+# directly; sklearn's kneighbors() validation and chunking cost more than the
+# distances themselves for a handful of points (streaming scores one at a time)
+_KNN_DIRECT_MAX_ROWS = 32
+
+
+def _direct_knn_scores(detector: Any, X: np.ndarray) -> np.ndarray | None:
+    """Score a few rows with a fitted PyOD KNN without going through sklearn.
+
+    Returns None when the fast path doesn't apply (other detectors, metrics
+    other than euclidean, large batches), so the caller falls back to
+    decision_function().
+    """
+    neigh = getattr(detector, "neigh_", None)
+    method = getattr(detector, "method", None)
+    if (
+        neigh is None
+        or getattr(neigh, "effective_metric_", None) != "euclidean"
+        or method not in ("largest", "mean", "median")
+        or len(X) > _KNN_DIRECT_MAX_ROWS
+    ):
+        return None
+    train = getattr(neigh, "_fit_X", None)
+    k = detector.n_neighbors
+    if not isinstance(train, np.ndarray) or k > len(train):
+        return None
+
+    X = np.asarray(X, dtype=np.float64)
+    scores = np.empty(len(X), dtype=np.float64)
+    for i, x in enumerate(X):
+        diff = train - x
+        sq = np.einsum("ij,ij->i", diff, diff)
+        if method == "largest":
+            scores[i] = np.sqrt(np.partition(sq, k - 1)[k - 1])
+        else:
+            nearest = np.sqrt(np.partition(sq, k - 1)[:k])
+            scores[i] = nearest.mean() if method == "mean" else np.median(nearest)
+    return scores
+
+
 def get_decision_scores(detector: Any, X: np.ndarray) -> np.ndarray:
     """Get decision scores from a fitted PyOD detector.
 
@@ -439,9 +529,34 @@ def get_decision_scores(detector: Any, X: np.ndarray) -> np.ndarray:
     Returns:
         Anomaly scores (n_samples,) - higher = more anomalous
     """
+    scores = _direct_knn_scores(detector, X)
+    if scores is not None:
+        return scores
     return detector.decision_function(X)
 
 
+def get_pointwise_scores(detector: Any, X: np.ndarray, backend: str) -> np.ndarray:
+    """Get decision scores for each row of X as if it were scored on its own.
+
+    Inductive backends score the whole batch in one decision_function() call.
+    Transductive backends (see TRANSDUCTIVE_BACKENDS) are scored one row at a
+    time, since batching them would change every score in the batch.
+
+    Args:
+        detector: Fitted PyOD detector
+        X: Data to score (n_samples, n_features)
+        backend: Backend name the detector was created with
+
+    Returns:
+        Anomaly scores (n_samples,) - higher = more anomalous
+    """
+    if backend in TRANSDUCTIVE_BACKENDS and len(X) > 1:
+        return np.concatenate(
+            [detector.decision_function(X[i : i + 1]) for i in range(len(X))]
+        )
+    return get_decision_scores(detector, X)
+
+
 def get_predictions(detector: Any, X: np.ndarray) -> np.ndarray:
     """Get binary predictions from a fitted PyOD detector.
 
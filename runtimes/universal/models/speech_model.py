@@ -21,7 +21,7 @@ from queue import Empty, Queue
 from threading import Thread
 from typing import TYPE_CHECKING, Literal
 
-from .base import BaseModel
+from .base import BaseModel, tracks_requests
 
 if TYPE_CHECKING:
     import numpy as np
@@ -173,6 +173,7 @@ class SpeechModel(BaseModel):
 
         logger.info(f"Speech model unloaded: {self.model_id}")
 
+    @tracks_requests
     async def transcribe(
         self,
         audio_path: str | Path,
@@ -268,6 +269,7 @@ class SpeechModel(BaseModel):
             duration=info.duration,
         )
 
+    @tracks_requests
     async def transcribe_stream(
         self,
         audio_path: str | Path,
@@ -378,6 +380,7 @@ class SpeechModel(BaseModel):
         # Ensure thread completes
         thread.join(timeout=1.0)
 
+    @tracks_requests
     async def transcribe_audio(
         self,
         audio: "np.ndarray",
@@ -478,6 +481,7 @@ class SpeechModel(BaseModel):
             duration=info.duration,
         )
 
+    @tracks_requests
     async def transcribe_audio_stream(
         self,
         audio: "np.ndarray",
@@ -584,6 +588,7 @@ class SpeechModel(BaseModel):
         # Ensure thread completes
         thread.join(timeout=1.0)
 
+    @tracks_requests
     async def transcribe_bytes(
         self,
         audio_bytes: bytes,
@@ -627,6 +632,7 @@ class SpeechModel(BaseModel):
             if tmp_path:
                 Path(tmp_path).unlink(missing_ok=True)
 
+    @tracks_requests
     async def transcribe_bytes_stream(
         self,
         audio_bytes: bytes,
@@ -21,26 +21,47 @@ Usage:
 """
 
 import asyncio
+import hashlib
 import logging
+import math
 import time
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 from typing import Any
 
 import numpy as np
 import polars as pl
+from cachetools import LRUCache
+from scipy.special import expit
 
 from utils.polars_buffer import PolarsBuffer
+from utils.rolling_features import IncrementalRollingState
 
 logger = logging.getLogger(__name__)
 
+# Detectors train and score on float32: half the memory traffic of float64
+# in the decision-function scans, and plenty of precision for anomaly scores
+FEATURE_DTYPE = np.float32
 
-class DetectorStatus(str, Enum):
-    """Status of the streaming detector."""
+# Polars column types fed to the model when training on rolling features
+_MODEL_DTYPES = frozenset({pl.Float64, pl.Float32, pl.Int64, pl.Int32})
 
-    COLLECTING = "collecting"  # Cold start - collecting initial data
-    READY = "ready"  # Model trained and ready for inference
-    RETRAINING = "retraining"  # Background retraining in progress
+
+class DetectorStatus(IntEnum):
+    """Status of the streaming detector.
+
+    Integer-valued so the per-point status checks compare ints rather than
+    strings; API responses use ``label``.
+    """
+
+    COLLECTING = 0  # Cold start - collecting initial data
+    READY = 1  # Model trained and ready for inference
+    RETRAINING = 2  # Background retraining in progress
+
+    @property
+    def label(self) -> str:
+        """Lowercase name used in API responses ("collecting", "ready", ...)."""
+        return self.name.lower()
 
 
 @dataclass
@@ -68,6 +89,27 @@ class StreamingBatchResult:
     processing_time_ms: float
 
 
+def _fit_new_detector(
+    backend: str,
+    contamination: float,
+    backend_kwargs: dict[str, Any],
+    X: np.ndarray,
+) -> tuple[Any, float, float]:
+    """Create and fit a detector off the event loop.
+
+    Returns:
+        (detector, score_mean, score_std) for the training data
+    """
+    from models.pyod_backend import create_detector, fit_detector, get_decision_scores
+
+    detector = create_detector(backend, contamination=contamination, **backend_kwargs)
+    fit_detector(detector, X)
+
+    scores = np.asarray(get_decision_scores(detector, X), dtype=np.float64)
+    score_var = float(scores.var())
+    return detector, float(scores.mean()), math.sqrt(score_var) if score_var > 0 else 1.0
+
+
 class StreamingAnomalyDetector:
     """Auto-rolling streaming anomaly detector.
 
@@ -94,6 +136,7 @@ class StreamingAnomalyDetector:
         rolling_windows: list[int] | None = None,
         include_lags: bool = False,
         lag_periods: list[int] | None = None,
+        max_fit_samples: int = 4096,
         **backend_kwargs: Any,
     ):
         """Initialize the streaming detector.
@@ -110,6 +153,8 @@ class StreamingAnomalyDetector:
             rolling_windows: Optional rolling window sizes for feature computation
             include_lags: Whether to include lag features
             lag_periods: Lag periods for lag features
+            max_fit_samples: Fit on a uniform sample of this many rows when
+                the window holds more
             **backend_kwargs: Additional arguments for PyOD backend
         """
         self.model_id = model_id
@@ -123,10 +168,32 @@ class StreamingAnomalyDetector:
         self.rolling_windows = rolling_windows
         self.include_lags = include_lags
         self.lag_periods = lag_periods
+        self.max_fit_samples = max_fit_samples
         self.backend_kwargs = backend_kwargs
 
-        # Data buffer (Polars as substrate - automatic, internal)
-        self._buffer = PolarsBuffer(window_size=window_size)
+        # Data buffer. Polars backs the window when rolling/lag features are
+        # derived from it; raw numeric rows go to a preallocated ring instead
+        self._buffer = PolarsBuffer(window_size=window_size) if rolling_windows else None
+        self._ring: np.ndarray | None = None  # (window_size, n_features), sized on first row
+        self._head = 0  # next ring row to write
+        self._count = 0  # rows in the window
+        # Key order of the first all-numeric dict point, and a row to read
+        # later points into by key
+        self._feature_keys: tuple[str, ...] | None = None
+        self._X_scratch: np.ndarray | None = None
+
+        # Online rolling/lag state so scoring a point doesn't recompute the
+        # features of the whole window (Polars is still used for training)
+        self._rolling_state = (
+            IncrementalRollingState(
+                rolling_windows=rolling_windows,
+                include_lags=include_lags,
+                lag_periods=lag_periods,
+                max_rows=window_size,
+            )
+            if rolling_windows
+            else None
+        )
 
         # Model state
         self._detector = None
@@ -140,9 +207,22 @@ class StreamingAnomalyDetector:
         self._score_mean = 0.0
         self._score_std = 1.0
 
+        # Recent fits keyed by a digest of their training matrix, so a retrain
+        # on unchanged data (replays, idle streams) reuses the fitted model
+        self._fit_cache: LRUCache[tuple, tuple[Any, float, float]] = LRUCache(maxsize=4)
+
         # Retraining lock
         self._retraining = False
 
+        # Background retrain worker: ticks past the interval only set the
+        # event; one task drains it and exits when no retrain is pending
+        self._retrain_event = asyncio.Event()
+        self._retrain_task: asyncio.Task | None = None
+
+        # Bumped by reset(); a fit or retrain started before a reset must not
+        # install its model or touch the status afterwards
+        self._generation = 0
+
     @property
     def status(self) -> DetectorStatus:
         """Current detector status."""
@@ -156,7 +236,7 @@ class StreamingAnomalyDetector:
     @property
     def samples_collected(self) -> int:
         """Total samples in buffer."""
-        return self._buffer.size
+        return self._count
 
     @property
     def is_ready(self) -> bool:
@@ -165,30 +245,35 @@ class StreamingAnomalyDetector:
 
     async def process(
         self,
-        data: dict[str, Any] | list[float],
+        data: dict[str, Any] | list[float] | np.ndarray,
         index: int = 0,
     ) -> StreamingResult:
         """Process a single data point.
 
         Args:
-            data: Feature dict or numeric list
+            data: Feature dict, numeric list or 1-D array
             index: Optional index for tracking
 
         Returns:
             StreamingResult with score and status
         """
-        # Convert to dict if list
-        if isinstance(data, list):
-            data = {f"f{i}": v for i, v in enumerate(data)}
-
-        # Add to buffer
-        self._buffer.append(data)
+        # Numeric vectors go straight into the ring - no per-feature dict
+        raw = self._numeric_matrix([data]) if self._buffer is None else None
+        if raw is not None:
+            self._append_matrix(raw)
+        else:
+            if not isinstance(data, dict):
+                data = {f"f{i}": v for i, v in enumerate(data)}
+            raw = self._append_rows([data])
+            if self._rolling_state is not None:
+                self._rolling_state.push(data)
         self._total_processed += 1
         self._samples_since_retrain += 1
 
         # Cold start - collecting initial data
         if self._status == DetectorStatus.COLLECTING:
-            if self._buffer.size >= self.min_samples:
+            # Points that arrive while the initial fit runs don't start another
+            if self._count >= self.min_samples and not self._retraining:
                 await self._train_initial_model()
 
             return StreamingResult(
@@ -197,18 +282,18 @@ class StreamingAnomalyDetector:
                 is_anomaly=None,
                 raw_score=None,
                 status=self._status,
-                samples_collected=self._buffer.size,
-                samples_until_ready=max(0, self.min_samples - self._buffer.size),
+                samples_collected=self._count,
+                samples_until_ready=max(0, self.min_samples - self._count),
                 model_version=self._model_version,
             )
 
         # Score the new data point
-        score, raw_score, is_anomaly = await self._score_point(data)
+        score, raw_score, is_anomaly = await self._score_point(data, raw)
 
         # Check if retraining needed
         if self._samples_since_retrain >= self.retrain_interval and not self._retraining:
             # Trigger background retrain
-            asyncio.create_task(self._retrain_model())
+            self._request_retrain()
 
         return StreamingResult(
             index=index,
@@ -216,7 +301,7 @@ class StreamingAnomalyDetector:
             is_anomaly=is_anomaly,
             raw_score=raw_score,
             status=self._status,
-            samples_collected=self._buffer.size,
+            samples_collected=self._count,
             samples_until_ready=0,
             model_version=self._model_version,
         )
@@ -233,29 +318,229 @@ class StreamingAnomalyDetector:
         Returns:
             StreamingBatchResult with all scores
         """
-        start_time = time.perf_counter()
+        start_ns = time.perf_counter_ns()
         results = []
 
-        for i, point in enumerate(data):
-            result = await self.process(point, index=i)
-            results.append(result)
+        # Cold start: go point by point until the initial model is trained, so
+        # training happens at exactly min_samples as with single-point calls
+        i = 0
+        while i < len(data) and self._status == DetectorStatus.COLLECTING:
+            results.append(await self.process(data[i], index=i))
+            i += 1
+
+        # Warm: score the rest with one decision_function call per chunk.
+        # Chunks leave room in the window for the rolling/lag lookback, so
+        # each point sees the same history it would have seen on its own.
+        chunk_size = max(1, self.window_size - self._feature_lookback())
+        for start in range(i, len(data), chunk_size):
+            results.extend(
+                await self._process_warm_chunk(data[start : start + chunk_size], start)
+            )
 
-        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
         return StreamingBatchResult(
             results=results,
             status=self._status,
-            samples_collected=self._buffer.size,
+            samples_collected=self._count,
             model_version=self._model_version,
             processing_time_ms=elapsed_ms,
         )
 
+    def _feature_lookback(self) -> int:
+        """Rows of history the rolling/lag features look back over."""
+        if not self.rolling_windows:
+            return 0
+        lookback = max(self.rolling_windows)
+        if self.include_lags:
+            lookback = max(lookback, *(self.lag_periods or [1, 2, 3]))
+        return lookback
+
+    async def _process_warm_chunk(
+        self,
+        data: list[dict[str, Any]] | list[list[float]],
+        start_index: int,
+    ) -> list[StreamingResult]:
+        """Append and score a chunk of points with the current model at once."""
+        from models.pyod_backend import get_pointwise_scores
+
+        size_before = self._count
+        raw = self._numeric_matrix(data) if self._buffer is None else None
+        if raw is not None:
+            rows = []
+            self._append_matrix(raw)
+        else:
+            rows = [
+                point if isinstance(point, dict) else {f"f{i}": v for i, v in enumerate(point)}
+                for point in data
+            ]
+            raw = self._append_rows(rows)
+        self._total_processed += len(data)
+        self._samples_since_retrain += len(data)
+
+        # Advance the online rolling state row by row, taking each row's
+        # features as it goes so a batch sees the same vectors as single points
+        vectors = []
+        if self._rolling_state is not None:
+            for row in rows:
+                self._rolling_state.push(row)
+                if self._feature_columns:
+                    vectors.append(
+                        self._rolling_state.vector(self._feature_columns, dtype=FEATURE_DTYPE)
+                    )
+
+        # Feature matrix for the new rows - must match training format
+        if self.rolling_windows and self._feature_columns:
+            if all(v is not None for v in vectors):
+                X = np.vstack(vectors)
+            else:
+                df = self._buffer.get_features(
+                    rolling_windows=self.rolling_windows,
+                    include_lags=self.include_lags,
+                    lag_periods=self.lag_periods,
+                    fill_null_value=0.0,  # Cold start handling for derived features
+                    fill_base_nulls=True,
+                )
+                X = (
+                    df.tail(len(data))
+                    .select(pl.col(self._feature_columns).cast(pl.Float32))
+                    .to_numpy()
+                )
+        elif raw is not None:
+            X = raw
+        else:
+            X = np.array(
+                [[v for v in row.values() if isinstance(v, (int, float))] for row in rows],
+                dtype=FEATURE_DTYPE,
+            )
+
+        raw_scores = np.asarray(
+            get_pointwise_scores(self._detector, X, self.backend), dtype=np.float64
+        )
+
+        scores = self._normalize_scores(raw_scores)
+        is_anomaly = scores > self.threshold
+
+        # One background retrain per chunk, not one per point past the interval
+        if self._samples_since_retrain >= self.retrain_interval and not self._retraining:
+            self._request_retrain()
+
+        return [
+            StreamingResult(
+                index=start_index + j,
+                score=score,
+                is_anomaly=anomalous,
+                raw_score=raw_score,
+                status=self._status,
+                samples_collected=min(size_before + j + 1, self.window_size),
+                samples_until_ready=0,
+                model_version=self._model_version,
+            )
+            for j, (score, raw_score, anomalous) in enumerate(
+                zip(scores.tolist(), raw_scores.tolist(), is_anomaly.tolist(), strict=True)
+            )
+        ]
+
+    @staticmethod
+    def _numeric_matrix(points: list[Any]) -> np.ndarray | None:
+        """Points as a feature matrix, if they are all plain numeric vectors.
+
+        Returns None for dicts and for vectors with non-numeric or missing
+        entries, which take the dict path instead.
+        """
+        if not all(isinstance(p, (list, tuple, np.ndarray)) for p in points):
+            return None
+        try:
+            X = np.asarray(points)
+        except ValueError:  # ragged
+            return None
+        if X.ndim != 2 or X.dtype.kind not in "biuf":
+            return None
+        return X.astype(FEATURE_DTYPE, copy=False)
+
+    def _append_rows(self, rows: list[dict[str, Any]]) -> np.ndarray | None:
+        """Append rows to the window.
+
+        Returns:
+            The rows' numeric matrix on the ring path, None on the Polars path
+        """
+        if self._buffer is not None:
+            if len(rows) == 1:
+                self._buffer.append(rows[0])
+            else:
+                self._buffer.append_batch(rows)
+            self._count = min(self._count + len(rows), self.window_size)
+            return None
+
+        X = self._read_by_keys(rows[0]) if len(rows) == 1 else None
+        if X is None:
+            X = np.array(
+                [[v for v in row.values() if isinstance(v, (int, float))] for row in rows],
+                dtype=FEATURE_DTYPE,
+            )
+            if self._feature_keys is None and X.shape[1] == len(rows[0]):
+                self._feature_keys = tuple(rows[0])
+                self._X_scratch = np.empty((1, len(self._feature_keys)), dtype=FEATURE_DTYPE)
+        self._append_matrix(X)
+        return X
+
+    def _read_by_keys(self, row: dict[str, Any]) -> np.ndarray | None:
+        """Read a dict point into the scratch row using the cached key order.
+
+        The scratch row is reused on the next call. Returns None when the
+        point doesn't have exactly the cached numeric keys.
+        """
+        keys = self._feature_keys
+        if keys is None or len(row) != len(keys):
+            return None
+        X = self._X_scratch
+        try:
+            for i, key in enumerate(keys):
+                X[0, i] = row[key]
+        except (KeyError, TypeError, ValueError):
+            return None
+        return X
+
+    def _append_matrix(self, X: np.ndarray) -> None:
+        """Write numeric rows into the ring buffer."""
+        if self._ring is None:
+            self._ring = np.empty((self.window_size, X.shape[1]), dtype=FEATURE_DTYPE)
+        elif X.shape[1] != self._ring.shape[1]:
+            raise ValueError(
+                f"Expected {self._ring.shape[1]} numeric features, got {X.shape[1]}"
+            )
+
+        # Write the newest window_size rows at head, wrapping once at most
+        new = X[-self.window_size :]
+        first = min(len(new), self.window_size - self._head)
+        self._ring[self._head : self._head + first] = new[:first]
+        self._ring[: len(new) - first] = new[first:]
+        self._head = (self._head + len(new)) % self.window_size
+        self._count = min(self._count + len(new), self.window_size)
+
+    def _window_matrix(self, copy: bool = False) -> np.ndarray:
+        """Ring contents oldest-first.
+
+        A view into the ring unless it has wrapped (or copy=True), so training
+        doesn't pay for a full copy of the window on every retrain.
+        """
+        if self._ring is None:
+            return np.empty((0, 0), dtype=FEATURE_DTYPE)
+        if self._count < self.window_size or self._head == 0:
+            X = self._ring[: self._count]
+            return X.copy() if copy else X
+        return np.concatenate([self._ring[self._head :], self._ring[: self._head]])
+
     async def _train_initial_model(self) -> None:
         """Train the initial model (cold start complete)."""
-        logger.info(f"Training initial model for {self.model_id} with {self._buffer.size} samples")
+        logger.info(f"Training initial model for {self.model_id} with {self._count} samples")
 
+        generation = self._generation
+        self._retraining = True
         try:
             await self._fit_detector()
+            if self._generation != generation:
+                return
             self._model_version = 1
             self._samples_since_retrain = 0
             self._status = DetectorStatus.READY
@@ -263,71 +548,110 @@ class StreamingAnomalyDetector:
         except Exception as e:
             logger.error(f"Failed to train initial model: {e}")
             raise
+        finally:
+            if self._generation == generation:
+                self._retraining = False
+
+    def _request_retrain(self) -> None:
+        """Ask for a background retrain, starting the worker if it isn't running.
+
+        Repeated requests before the worker picks one up coalesce into one
+        retrain instead of one task per tick.
+        """
+        self._retrain_event.set()
+        if self._retrain_task is None or self._retrain_task.done():
+            self._retrain_task = asyncio.create_task(self._retrain_worker())
+
+    async def _retrain_worker(self) -> None:
+        """Run retrains while requests are pending, then exit."""
+        while self._retrain_event.is_set():
+            self._retrain_event.clear()
+            await self._retrain_model()
 
     async def _retrain_model(self) -> None:
         """Retrain model in background (non-blocking)."""
         if self._retraining:
             return
 
+        generation = self._generation
         self._retraining = True
         self._status = DetectorStatus.RETRAINING
         logger.info(f"Starting background retrain for {self.model_id}")
 
         try:
             await self._fit_detector()
+            if self._generation != generation:
+                return
             self._model_version += 1
             self._samples_since_retrain = 0
             logger.info(f"Retrained model {self.model_id} to version {self._model_version}")
         except Exception as e:
             logger.error(f"Failed to retrain model: {e}")
         finally:
-            self._retraining = False
-            self._status = DetectorStatus.READY
+            # After a reset (which also cancels this task) the detector is
+            # back in cold start with no model; leave its state alone
+            if self._generation == generation:
+                self._retraining = False
+                self._status = DetectorStatus.READY
 
     async def _fit_detector(self) -> None:
         """Fit the PyOD detector on buffer data.
 
         Uses rolling features if configured, otherwise uses raw numeric data.
         """
-        from models.pyod_backend import (
-            create_detector,
-            fit_detector,
-            get_decision_scores,
-        )
+        from services.training_executor import run_in_executor
+
+        generation = self._generation
 
         # Get data from buffer - optionally with rolling features
         if self.rolling_windows:
             # get_features uses lazy evaluation with SIMD + parallel execution
-            # fill_null(0.0) handles cold start - no data is dropped
+            # fill_null(0.0) handles cold start - no data is dropped. Base
+            # columns are filled in the same pass (missing data in input)
             df = self._buffer.get_features(
                 rolling_windows=self.rolling_windows,
                 include_lags=self.include_lags,
                 lag_periods=self.lag_periods,
                 fill_null_value=0.0,  # Cold start handling for derived features
+                fill_base_nulls=True,
             )
             # Select only numeric columns for the model
-            numeric_cols = [c for c in df.columns if df[c].dtype in [pl.Float64, pl.Float32, pl.Int64, pl.Int32]]
-            # Fill nulls in base numeric columns too (handles missing data in input)
-            df = df.with_columns([pl.col(c).fill_null(0.0) for c in numeric_cols])
-            X = df.select(numeric_cols).to_numpy()
+            numeric_cols = [c for c, dtype in df.schema.items() if dtype in _MODEL_DTYPES]
+            X = df.select(pl.col(numeric_cols).cast(pl.Float32)).to_numpy()
         else:
-            X = self._buffer.get_numpy()
+            # Snapshot the ring: points keep arriving while the fit runs
+            X = self._window_matrix(copy=True)
 
         if len(X) == 0:
             raise ValueError("No data in buffer")
 
-        # Create and fit detector
-        self._detector = create_detector(
-            self.backend,
-            contamination=self.contamination,
-            **self.backend_kwargs,
-        )
-        fit_detector(self._detector, X)
+        # Large windows: fit on a uniform sample (kept in time order). IForest
+        # already subsamples per tree (max_samples), so it gets the full window
+        if len(X) > self.max_fit_samples and self.backend != "isolation_forest":
+            rng = np.random.default_rng(42)
+            idx = np.sort(rng.choice(len(X), self.max_fit_samples, replace=False))
+            X = X[idx]
+
+        feature_columns = tuple(numeric_cols) if self.rolling_windows else ()
+        X = np.ascontiguousarray(X)
+        key = (feature_columns, X.shape, hashlib.blake2b(X.data, digest_size=16).digest())
+        fitted = self._fit_cache.get(key)
+        if fitted is None:
+            # Fit in the training thread pool so the event loop keeps scoring
+            # with the current model meanwhile
+            fitted = await run_in_executor(
+                _fit_new_detector, self.backend, self.contamination, self.backend_kwargs, X
+            )
+            self._fit_cache[key] = fitted
+        detector, score_mean, score_std = fitted
+        if self._generation != generation:
+            # Fitted on data from before a reset
+            return
 
-        # Update normalization stats
-        scores = get_decision_scores(self._detector, X)
-        self._score_mean = float(np.mean(scores))
-        self._score_std = float(np.std(scores)) if np.std(scores) > 0 else 1.0
+        # Swap the model and its stats in one step (no await in between)
+        self._detector = detector
+        self._score_mean = score_mean
+        self._score_std = score_std
 
         # Store feature column names for inference
         if self.rolling_windows:
@@ -337,11 +661,13 @@ class StreamingAnomalyDetector:
 
     async def _score_point(
         self,
-        data: dict[str, Any],
+        data: dict[str, Any] | list[float] | np.ndarray,
+        raw: np.ndarray | None = None,
     ) -> tuple[float, float, bool]:
         """Score a single data point.
 
         Uses rolling features if configured, matching the training data format.
+        ``raw`` is the point's numeric row when it was appended to the ring.
 
         Returns:
             (normalized_score, raw_score, is_anomaly)
@@ -350,50 +676,61 @@ class StreamingAnomalyDetector:
 
         # Get feature vector - must match training format
         if self.rolling_windows and self._feature_columns:
-            # Get the latest row with rolling features computed
-            df = self._buffer.get_features(
-                rolling_windows=self.rolling_windows,
-                include_lags=self.include_lags,
-                lag_periods=self.lag_periods,
-                fill_null_value=0.0,  # Cold start handling for derived features
-            )
-            # Get the last row (most recent, which includes the data point we just added)
-            # Fill nulls in base columns and select only feature columns
-            latest = df.tail(1).with_columns(
-                [pl.col(c).fill_null(0.0) for c in self._feature_columns]
-            ).select(self._feature_columns)
-            X = latest.to_numpy()
+            # Latest row from the online rolling state - O(features), not O(window)
+            X = self._rolling_state.vector(self._feature_columns, dtype=FEATURE_DTYPE)
+            if X is None:
+                # A feature column the online state doesn't track: recompute
+                # the last row from the buffer
+                df = self._buffer.get_features(
+                    rolling_windows=self.rolling_windows,
+                    include_lags=self.include_lags,
+                    lag_periods=self.lag_periods,
+                    fill_null_value=0.0,  # Cold start handling for derived features
+                    fill_base_nulls=True,
+                )
+                latest = df.tail(1).select(pl.col(self._feature_columns).cast(pl.Float32))
+                X = latest.to_numpy()
+        elif raw is not None:
+            X = raw
         else:
             # Convert to numpy array (raw numeric values)
             numeric_values = [v for v in data.values() if isinstance(v, (int, float))]
-            X = np.array([numeric_values])
+            X = np.array([numeric_values], dtype=FEATURE_DTYPE)
 
         # Get raw score
         raw_scores = get_decision_scores(self._detector, X)
         raw_score = float(raw_scores[0])
 
-        # Normalize score
-        if self.normalization == "standardization":
-            # Sigmoid normalization to [0, 1]
-            z = (raw_score - self._score_mean) / self._score_std
-            score = 1 / (1 + np.exp(-z))
-        elif self.normalization == "zscore":
-            score = (raw_score - self._score_mean) / self._score_std
-        else:  # raw
-            score = raw_score
-
+        score = float(self._normalize_scores(raw_scores)[0])
         is_anomaly = score > self.threshold
 
-        return float(score), raw_score, is_anomaly
+        return score, raw_score, is_anomaly
+
+    def _normalize_scores(self, raw_scores: np.ndarray) -> np.ndarray:
+        """Normalize raw decision scores with the stats from the last fit.
+
+        Works in one output array (no temporaries per operation); raw mode
+        returns the input as-is.
+        """
+        if self.normalization not in ("standardization", "zscore"):
+            return np.asarray(raw_scores)  # raw
+
+        z = np.subtract(raw_scores, self._score_mean, dtype=np.float64)
+        np.divide(z, self._score_std, out=z)
+        if self.normalization == "standardization":
+            # Sigmoid normalization to [0, 1]; expit does not overflow for
+            # very negative z
+            expit(z, out=z)
+        return z
 
     def get_stats(self) -> dict[str, Any]:
         """Get detector statistics."""
         return {
             "model_id": self.model_id,
             "backend": self.backend,
-            "status": self._status.value,
+            "status": self._status.label,
             "model_version": self._model_version,
-            "samples_collected": self._buffer.size,
+            "samples_collected": self._count,
             "total_processed": self._total_processed,
             "samples_since_retrain": self._samples_since_retrain,
             "min_samples": self.min_samples,
@@ -405,7 +742,22 @@ class StreamingAnomalyDetector:
 
     def reset(self) -> None:
         """Reset detector to initial state."""
-        self._buffer.clear()
+        self._generation += 1
+        # Drop any in-flight retrain so it can't install a model fitted on
+        # the old data
+        if self._retrain_task is not None:
+            self._retrain_task.cancel()
+            self._retrain_task = None
+        self._retrain_event.clear()
+        if self._buffer is not None:
+            self._buffer.clear()
+        self._ring = None
+        self._head = 0
+        self._count = 0
+        self._feature_keys = None
+        self._X_scratch = None
+        if self._rolling_state is not None:
+            self._rolling_state.clear()
         self._detector = None
         self._model_version = 0
         self._feature_columns = None
@@ -414,6 +766,7 @@ class StreamingAnomalyDetector:
         self._total_processed = 0
         self._score_mean = 0.0
         self._score_std = 1.0
+        self._fit_cache.clear()
         self._retraining = False
 
 
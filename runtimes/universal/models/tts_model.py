@@ -20,7 +20,7 @@ from queue import Empty, Queue
 from threading import Thread
 from typing import Any
 
-from .base import BaseModel
+from .base import BaseModel, tracks_requests
 
 logger = logging.getLogger(__name__)
 
@@ -1219,6 +1219,7 @@ class TTSModel(BaseModel):
 
         logger.info(f"TTS model unloaded: {self.model_id}")
 
+    @tracks_requests
     async def synthesize(
         self,
         text: str,
@@ -1243,6 +1244,7 @@ class TTSModel(BaseModel):
         voice = voice or self.voice
         return await self._backend.synthesize(text, voice, speed, **kwargs)
 
+    @tracks_requests
     async def synthesize_stream(
         self,
         text: str,
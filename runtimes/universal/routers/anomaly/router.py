@@ -33,6 +33,7 @@ from services.path_validator import (
     validate_path_within_directory,
 )
 from utils.feature_encoder import FeatureEncoder
+from utils.keyed_lock import KeyedLock
 
 logger = UniversalRuntimeLogger("anomaly-router")
 
@@ -46,7 +47,7 @@ _load_anomaly_fn: Callable[..., Coroutine[Any, Any, Any]] | None = None
 # These are injected from the main server to share state
 _models: dict | None = None
 _encoders: dict[str, FeatureEncoder] | None = None
-_model_load_lock = None
+_load_locks: KeyedLock | None = None
 
 # Model storage directory - uses shared path_validator config
 _ANOMALY_MODELS_DIR = ANOMALY_MODELS_DIR
@@ -85,19 +86,19 @@ def set_models_dir(models_dir: Path) -> None:
 def set_state(
     models: dict,
     encoders: dict[str, FeatureEncoder],
-    model_load_lock,
+    load_locks: KeyedLock,
 ) -> None:
     """Set shared state from the main server.
 
     Args:
         models: Model cache dictionary
         encoders: Feature encoder cache dictionary
-        model_load_lock: Async lock for model loading
+        load_locks: Per-cache-key load locks, shared with the server's loaders
     """
-    global _models, _encoders, _model_load_lock
+    global _models, _encoders, _load_locks
     _models = models
     _encoders = encoders
-    _model_load_lock = model_load_lock
+    _load_locks = load_locks
 
 
 async def _get_anomaly_model(
@@ -469,7 +470,7 @@ async def load_anomaly_model(request: AnomalyLoadRequest):
     re-training. The model path is automatically determined from the
     model name and backend - no user control over file paths.
     """
-    if _models is None or _model_load_lock is None:
+    if _models is None or _load_locks is None:
         raise HTTPException(
             status_code=500,
             detail="Model state not initialized. Server configuration error.",
@@ -497,28 +498,25 @@ async def load_anomaly_model(request: AnomalyLoadRequest):
             f"Available models: {available}",
         )
 
-    # Load via the injected loader
-    async with _model_load_lock:
-        logger.info(f"Loading pre-trained anomaly model: {model_path}")
+    # Import here to avoid circular imports
+    from models import AnomalyModel
+    from utils.device import get_optimal_device
 
-        # Import here to avoid circular imports
-        from models import AnomalyModel
-        from utils.device import get_optimal_device
+    device = get_optimal_device()
 
-        device = get_optimal_device()
+    model = AnomalyModel(
+        model_id=str(model_path),
+        device=device,
+        backend=request.backend,
+    )
+    cache_key = _make_cache_key(request.model, request.backend, model.normalization)
 
-        model = AnomalyModel(
-            model_id=str(model_path),
-            device=device,
-            backend=request.backend,
-        )
+    # Same per-key lock as the server's load_anomaly, which writes this key too
+    async with _load_locks(cache_key):
+        logger.info(f"Loading pre-trained anomaly model: {model_path}")
 
         await model.load()
 
-        cache_key = _make_cache_key(
-            request.model, request.backend, model.normalization
-        )
-
         if cache_key in _models:
             await _models[cache_key].unload()
             del _models[cache_key]
@@ -698,7 +696,7 @@ async def anomaly_stream(request: dict) -> dict:
     return AnomalyStreamResponse(
         object="streaming_result",
         model=parsed.model,
-        status=detector.status.value,
+        status=detector.status.label,
         results=[
             {
                 "index": r.index,
@@ -824,6 +822,6 @@ async def reset_streaming_detector(model_id: str) -> dict:
     return {
         "object": "reset_result",
         "model": model_id,
-        "status": detector.status.value,
+        "status": detector.status.label,
         "reset": True,
     }
@@ -3,8 +3,8 @@ import base64
 import json
 import logging
 import os
+import time
 import uuid
-from datetime import datetime
 from enum import Enum
 
 from fastapi import HTTPException
@@ -436,7 +436,7 @@ class ChatCompletionsService:
                 # Return SSE stream
                 async def generate_sse():
                     completion_id = f"chatcmpl-{os.urandom(16).hex()}"
-                    created_time = int(datetime.now().timestamp())
+                    created_time = int(time.time())
 
                     # Send initial chunk
                     initial_chunk = ChatCompletionChunk(
@@ -807,7 +807,7 @@ class ChatCompletionsService:
                 response = {
                     "id": f"chatcmpl-{os.urandom(16).hex()}",
                     "object": "chat.completion",
-                    "created": int(datetime.now().timestamp()),
+                    "created": int(time.time()),
                     "model": chat_request.model,
                     "choices": [
                         {
@@ -856,7 +856,7 @@ class ChatCompletionsService:
             response = {
                 "id": f"chatcmpl-{os.urandom(16).hex()}",
                 "object": "chat.completion",
-                "created": int(datetime.now().timestamp()),
+                "created": int(time.time()),
                 "model": chat_request.model,
                 "choices": [
                     {
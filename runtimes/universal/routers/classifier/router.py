@@ -30,6 +30,7 @@ from services.path_validator import (
     sanitize_model_name,
     validate_path_within_directory,
 )
+from utils.keyed_lock import KeyedLock
 
 logger = logging.getLogger(__name__)
 
@@ -49,7 +50,7 @@ _CLASSIFIER_MODELS_DIR: Path | None = None
 
 # Injected shared state
 _classifiers: dict | None = None
-_model_load_lock = None
+_load_locks: KeyedLock | None = None
 
 
 def set_classifier_loader(
@@ -70,16 +71,16 @@ def set_models_dir(models_dir: Path):
     _CLASSIFIER_MODELS_DIR = models_dir
 
 
-def set_state(classifiers: dict, model_load_lock):
+def set_state(classifiers: dict, load_locks: KeyedLock):
     """Set shared state for classifier caching.
 
     Args:
         classifiers: Dict/ModelCache for caching loaded classifiers
-        model_load_lock: asyncio.Lock for synchronizing model loads
+        load_locks: Per-cache-key load locks, shared with the server's loaders
     """
-    global _classifiers, _model_load_lock
+    global _classifiers, _load_locks
     _classifiers = classifiers
-    _model_load_lock = model_load_lock
+    _load_locks = load_locks
 
 
 def _get_classifier_loader():
@@ -307,7 +308,7 @@ async def load_classifier_endpoint(request: ClassifierLoadRequest):
     The model will be loaded from the classifier models directory and cached
     for subsequent /v1/classifier/predict calls.
     """
-    if _classifiers is None or _model_load_lock is None:
+    if _classifiers is None or _load_locks is None:
         raise HTTPException(
             status_code=500,
             detail="Classifier state not initialized. Server configuration error.",
@@ -335,13 +336,14 @@ async def load_classifier_endpoint(request: ClassifierLoadRequest):
 
     cache_key = _make_classifier_cache_key(request.model)
 
-    # Remove existing model from cache if present
-    if cache_key in _classifiers:
-        existing = _classifiers.pop(cache_key)
-        if existing:
-            await existing.unload()
+    # Same per-key lock as the server's load_classifier, which writes this key too
+    async with _load_locks(cache_key):
+        # Remove existing model from cache if present
+        if cache_key in _classifiers:
+            existing = _classifiers.pop(cache_key)
+            if existing:
+                await existing.unload()
 
-    async with _model_load_lock:
         logger.info(f"Loading pre-trained classifier: {model_path}")
         device = get_optimal_device()
 
@@ -1,6 +1,7 @@
 """Health router for health check and models list endpoints."""
 
 import os
+import time
 from collections.abc import Callable
 from datetime import datetime
 from typing import Any
@@ -60,13 +61,14 @@ async def list_models():
             detail="Health router not initialized. Call set_models_cache() first.",
         )
 
+    created = int(time.time())
     models_list = []
     for model_id, model in _models.items():
         models_list.append(
             {
                 "id": model_id,
                 "object": "model",
-                "created": int(datetime.now().timestamp()),
+                "created": created,
                 "owned_by": "transformers-runtime",
                 "type": model.model_type,
             }
@@ -9,8 +9,8 @@ This router handles:
 
 import base64
 import logging
-import struct
 
+import numpy as np
 from fastapi import APIRouter, HTTPException
 
 from api_types import (
@@ -28,6 +28,7 @@ from api_types import (
     RerankResponse,
     RerankResult,
 )
+from utils.model_format import parse_model_with_quantization
 
 logger = logging.getLogger(__name__)
 
@@ -65,9 +66,6 @@ async def create_embeddings(request: EmbeddingRequest) -> EmbeddingResponse:
     Model names can include quantization suffix (e.g., "model:Q4_K_M").
     """
     try:
-        # Import parsing utility
-        from utils.model_format import parse_model_with_quantization
-
         # Parse model name to extract quantization if present
         model_id, gguf_quantization = parse_model_with_quantization(request.model)
 
@@ -82,11 +80,14 @@ async def create_embeddings(request: EmbeddingRequest) -> EmbeddingResponse:
         embeddings = await model.embed(texts, normalize=True)
 
         # Format response
+        if request.encoding_format == "base64":
+            # One float32 conversion for the batch; each row is then a single memcpy
+            packed = np.ascontiguousarray(embeddings, dtype=np.float32)
+
         data = []
         for idx, embedding in enumerate(embeddings):
             if request.encoding_format == "base64":
-                embedding_bytes = struct.pack(f"{len(embedding)}f", *embedding)
-                embedding_data = base64.b64encode(embedding_bytes).decode("utf-8")
+                embedding_data = base64.b64encode(packed[idx].tobytes()).decode("ascii")
             else:
                 embedding_data = embedding
 
@@ -174,9 +175,6 @@ async def classify_texts(request: ClassifyRequest) -> ClassifyResponse:
     - cardiffnlp/twitter-roberta-base-sentiment-latest (social media sentiment)
     """
     try:
-        # Import parsing utility
-        from utils.model_format import parse_model_with_quantization
-
         # Parse model name
         model_id, _ = parse_model_with_quantization(request.model)
 
@@ -228,9 +226,6 @@ async def extract_entities(request: NERRequest) -> NERResponse:
     - xlm-roberta-large-finetuned-conll03-english (multilingual)
     """
     try:
-        # Import parsing utility
-        from utils.model_format import parse_model_with_quantization
-
         # Parse model name
         model_id, _ = parse_model_with_quantization(request.model)
 
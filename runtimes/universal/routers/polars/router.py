@@ -11,10 +11,13 @@ For most users, the streaming anomaly detection API is recommended instead.
 """
 
 import asyncio
+import io
 import logging
-from typing import Any
+from typing import Any, Literal
 
-from fastapi import APIRouter, HTTPException
+import polars as pl
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import Response
 
 from api_types.anomaly import (
     PolarsBufferAppendRequest,
@@ -24,6 +27,7 @@ from api_types.anomaly import (
     PolarsBuffersListResponse,
     PolarsBufferStats,
 )
+from utils.keyed_lock import KeyedLock
 from utils.polars_buffer import PolarsBuffer
 
 logger = logging.getLogger(__name__)
@@ -32,7 +36,49 @@ router = APIRouter(prefix="/v1/polars", tags=["polars"])
 
 # Global buffer registry
 _buffers: dict[str, PolarsBuffer] = {}
-_buffers_lock = asyncio.Lock()
+_buffer_locks = KeyedLock()
+
+# Clients sending this in Accept get the frame as an Arrow IPC stream
+# instead of JSON, ready to load with pl.read_ipc_stream / pyarrow
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+_ARROW_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {"content": {ARROW_STREAM_MEDIA_TYPE: {}}}
+}
+
+
+def _serialize(df: pl.DataFrame, fmt: str) -> list[dict] | dict[str, list]:
+    """Convert a DataFrame to row dicts, or to one list per column for "columns"."""
+    if fmt == "columns":
+        return df.to_dict(as_series=False)
+    return df.to_dicts()
+
+
+def _collect(
+    lf: pl.LazyFrame, tail: int | None, fmt: str
+) -> tuple[pl.DataFrame, list[dict] | dict[str, list]]:
+    """Apply the optional tail, run the query and serialize the result.
+
+    CPU-bound (rolling kernels plus Python object construction), so callers
+    run it in a worker thread to keep the event loop responsive.
+    """
+    if tail is not None and tail > 0:
+        lf = lf.tail(tail)
+    df = lf.collect()
+    return df, _serialize(df, fmt)
+
+
+def _collect_ipc(lf: pl.LazyFrame, tail: int | None) -> bytes:
+    """Apply the optional tail, run the query and write an LZ4 Arrow IPC stream."""
+    if tail is not None and tail > 0:
+        lf = lf.tail(tail)
+    buf = io.BytesIO()
+    lf.collect().write_ipc_stream(buf, compression="lz4")
+    return buf.getvalue()
+
+
+def _wants_arrow(accept: str | None) -> bool:
+    """Whether the Accept header asks for an Arrow IPC stream."""
+    return accept is not None and ARROW_STREAM_MEDIA_TYPE in accept
 
 
 async def _get_buffer(buffer_id: str) -> PolarsBuffer:
@@ -56,7 +102,7 @@ async def create_buffer(request: PolarsBufferCreateRequest) -> dict[str, Any]:
         POST /v1/polars/buffers
         {"buffer_id": "sensor-data", "window_size": 1000}
     """
-    async with _buffers_lock:
+    async with _buffer_locks(request.buffer_id):
         if request.buffer_id in _buffers:
             raise HTTPException(
                 status_code=409,
@@ -117,7 +163,7 @@ async def get_buffer_stats(buffer_id: str) -> PolarsBufferStats:
 @router.delete("/buffers/{buffer_id}")
 async def delete_buffer(buffer_id: str) -> dict[str, Any]:
     """Delete a buffer and free its memory."""
-    async with _buffers_lock:
+    async with _buffer_locks(buffer_id):
         if buffer_id not in _buffers:
             raise HTTPException(status_code=404, detail=f"Buffer '{buffer_id}' not found")
 
@@ -155,19 +201,26 @@ async def append_data(request: PolarsBufferAppendRequest) -> dict[str, Any]:
         buffer.append(request.data)
         count = 1
 
-    stats = buffer.get_stats()
-
+    # size/avg_append_ms read counters only; get_stats() would materialize
+    # the staged records on every append
     return {
         "object": "append_result",
         "buffer_id": request.buffer_id,
         "appended": count,
-        "buffer_size": stats.size,
-        "avg_append_ms": stats.avg_append_ms,
+        "buffer_size": buffer.size,
+        "avg_append_ms": buffer.avg_append_ms,
     }
 
 
-@router.post("/features")
-async def compute_features(request: PolarsBufferFeaturesRequest) -> PolarsBufferDataResponse:
+@router.post(
+    "/features",
+    response_model=PolarsBufferDataResponse,
+    responses=_ARROW_RESPONSES,
+)
+async def compute_features(
+    request: PolarsBufferFeaturesRequest,
+    accept: str | None = Header(default=None),
+) -> PolarsBufferDataResponse | Response:
     """Compute rolling features from buffer data.
 
     Computes rolling statistics (mean, std, min, max) and lag features
@@ -183,76 +236,95 @@ async def compute_features(request: PolarsBufferFeaturesRequest) -> PolarsBuffer
             "tail": 10
         }
 
-    Returns the data with computed features as new columns.
+    Returns the data with computed features as new columns. Send
+    ``Accept: application/vnd.apache.arrow.stream`` to receive the frame as
+    an LZ4-compressed Arrow IPC stream instead of JSON.
     """
     buffer = await _get_buffer(request.buffer_id)
 
+    if _wants_arrow(accept):
+        lf = buffer.get_features_lazy(
+            rolling_windows=request.rolling_windows,
+            include_lags=request.include_lags,
+            lag_periods=request.lag_periods,
+        )
+        content = await asyncio.to_thread(_collect_ipc, lf, request.tail)
+        return Response(content=content, media_type=ARROW_STREAM_MEDIA_TYPE)
+
     if buffer.size == 0:
         return PolarsBufferDataResponse(
             buffer_id=request.buffer_id,
             rows=0,
             columns=[],
-            data=[],
+            format=request.format,
+            data={} if request.format == "columns" else [],
         )
 
-    # Compute features
-    df = buffer.get_features(
+    # Compose features and tail lazily so the slice is optimized into the plan
+    lf = buffer.get_features_lazy(
         rolling_windows=request.rolling_windows,
         include_lags=request.include_lags,
         lag_periods=request.lag_periods,
     )
-
-    # Optionally return only the tail
-    if request.tail is not None and request.tail > 0:
-        df = df.tail(request.tail)
-
-    # Convert to list of dicts
-    data = df.to_dicts()
+    df, data = await asyncio.to_thread(_collect, lf, request.tail, request.format)
 
     return PolarsBufferDataResponse(
         buffer_id=request.buffer_id,
-        rows=len(data),
+        rows=df.height,
         columns=df.columns,
+        format=request.format,
         data=data,
     )
 
 
-@router.get("/buffers/{buffer_id}/data")
+@router.get(
+    "/buffers/{buffer_id}/data",
+    response_model=PolarsBufferDataResponse,
+    responses=_ARROW_RESPONSES,
+)
 async def get_buffer_data(
     buffer_id: str,
     tail: int | None = None,
     with_features: bool = False,
-) -> PolarsBufferDataResponse:
+    format: Literal["rows", "columns"] = "rows",
+    accept: str | None = Header(default=None),
+) -> PolarsBufferDataResponse | Response:
     """Get raw data from a buffer.
 
     Args:
         buffer_id: Buffer identifier
         tail: Return only last N rows (optional)
         with_features: Compute and include rolling features
+        format: "rows" for a list of dictionaries, "columns" for a dict of
+            column lists (cheaper to build for wide buffers)
 
-    Returns buffer data as a list of dictionaries.
+    Returns buffer data in the requested layout, or as an Arrow IPC stream
+    when the Accept header asks for application/vnd.apache.arrow.stream.
     """
     buffer = await _get_buffer(buffer_id)
 
+    if _wants_arrow(accept):
+        lf = buffer.get_features_lazy() if with_features else buffer.get_data().lazy()
+        content = await asyncio.to_thread(_collect_ipc, lf, tail)
+        return Response(content=content, media_type=ARROW_STREAM_MEDIA_TYPE)
+
     if buffer.size == 0:
         return PolarsBufferDataResponse(
             buffer_id=buffer_id,
             rows=0,
             columns=[],
-            data=[],
+            format=format,
+            data={} if format == "columns" else [],
         )
 
-    df = buffer.get_features() if with_features else buffer.get_data()
-
-    if tail is not None and tail > 0:
-        df = df.tail(tail)
-
-    data = df.to_dicts()
+    lf = buffer.get_features_lazy() if with_features else buffer.get_data().lazy()
+    df, data = await asyncio.to_thread(_collect, lf, tail, format)
 
     return PolarsBufferDataResponse(
         buffer_id=buffer_id,
-        rows=len(data),
+        rows=df.height,
         columns=df.columns,
+        format=format,
         data=data,
     )
 
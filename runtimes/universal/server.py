@@ -17,12 +17,17 @@ Key Features:
 Environment Variables:
 - MODEL_UNLOAD_TIMEOUT: Seconds of inactivity before unloading models (default: 300)
 - CLEANUP_CHECK_INTERVAL: Seconds between cleanup checks (default: 30)
+- LF_MODEL_MEMORY_BUDGET_MB: Evict least recently used models once loaded models
+  exceed this many MB; models serving a request are kept (default: 0, disabled)
 """
 
 import asyncio
+import functools
+import hashlib
 import os
 from contextlib import asynccontextmanager, suppress
 
+import psutil
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -88,9 +93,10 @@ from routers.vision import (
     set_file_image_getter,
     set_ocr_loader,
 )
-from utils.device import get_device_info, get_optimal_device
+from utils.device import get_device_info, get_optimal_device, is_unified_memory_gpu
 from utils.feature_encoder import FeatureEncoder
 from utils.file_handler import get_file_images
+from utils.keyed_lock import KeyedLock
 from utils.model_cache import ModelCache
 from utils.model_format import detect_model_format
 
@@ -125,7 +131,11 @@ def _init_llama_backend():
         - ggml_backend_load_all() discovers and initializes compute backends
         - On Tegra, CUDA initialization from worker threads can corrupt internal state
         - By initializing at module load time (main thread), we avoid this issue
+        - Elsewhere Llama() initializes the backend on first load, so processes
+          that never serve a GGUF model skip loading the llama.cpp library
     """
+    if not is_unified_memory_gpu():
+        return
     try:
         from llamafarm_llama._bindings import ensure_backend
 
@@ -250,7 +260,9 @@ async def lifespan(app: FastAPI):
     # Unload all remaining models
     if _models:
         logger.info(f"Unloading {len(_models)} remaining model(s)")
-        for cache_key, model in list(_models.items()):
+        # Pop one at a time so each reference is dropped once it is unloaded
+        while (item := _models.pop_lru()) is not None:
+            cache_key, model = item
             try:
                 await model.unload()
                 logger.info(f"Unloaded model: {cache_key}")
@@ -260,7 +272,9 @@ async def lifespan(app: FastAPI):
 
     if _classifiers:
         logger.info(f"Unloading {len(_classifiers)} remaining classifier(s)")
-        for cache_key, model in list(_classifiers.items()):
+        # Pop one at a time so each reference is dropped once it is unloaded
+        while (item := _classifiers.pop_lru()) is not None:
+            cache_key, model = item
             try:
                 await model.unload()
                 logger.info(f"Unloaded classifier: {cache_key}")
@@ -311,12 +325,25 @@ MODEL_UNLOAD_TIMEOUT = int(os.getenv("MODEL_UNLOAD_TIMEOUT", "300"))
 # Cleanup check interval (in seconds) - how often to check for idle models
 # Default: 30 seconds
 CLEANUP_CHECK_INTERVAL = int(os.getenv("CLEANUP_CHECK_INTERVAL", "30"))
+# Memory budget for loaded models (in MB). When set, loading a model that
+# pushes the total over budget unloads least recently used models first.
+# Default: 0 (disabled, models are only unloaded when idle)
+MODEL_MEMORY_BUDGET_MB = int(os.getenv("LF_MODEL_MEMORY_BUDGET_MB", "0"))
 
 # Global model caches using TTL-based caching (via cachetools)
 # Models are automatically tracked for idle time and cleaned up by background task
 _models: ModelCache[BaseModel] = ModelCache(ttl=MODEL_UNLOAD_TIMEOUT)
 _classifiers: ModelCache["ClassifierModel"] = ModelCache(ttl=MODEL_UNLOAD_TIMEOUT)
-_model_load_lock = asyncio.Lock()
+# Loads of different cache keys proceed concurrently; each key has its own lock.
+# Shared with the anomaly/classifier routers, which write the same cache keys
+# when loading pre-trained models from disk.
+_load_locks = KeyedLock()
+# Footprint (bytes) measured the last time each cache key was loaded. Kept after
+# a model is unloaded so a reload can make room before it starts.
+_footprints: dict[str, int] = {}
+# Loads in progress and loads ever started, to spot overlapping measurements
+_loads_in_flight = 0
+_loads_started = 0
 _current_device = None
 
 # Feature encoder cache for anomaly detection with mixed data types
@@ -382,11 +409,93 @@ def get_device():
     return _current_device
 
 
+def _memory_in_use() -> int:
+    """Bytes in use on the model device.
+
+    On CUDA this is whole-GPU usage, which also covers llama.cpp allocations
+    that torch's allocator does not see; elsewhere it is this process's RSS.
+    RSS barely counts mmap'd GGUF weights, which are only paged in as they are
+    read, so GGUF footprints are floored at the .gguf file size.
+    """
+    if get_device() == "cuda":
+        import torch
+
+        free, total = torch.cuda.mem_get_info()
+        return total - free
+    return psutil.Process().memory_info().rss
+
+
+async def _evict_to_budget(reserve: int, exclude: str) -> None:
+    """Unload least recently used models until ``reserve`` more bytes fit.
+
+    Models with requests in flight are skipped, so the budget may stay
+    exceeded until they finish and a later load or the idle cleanup runs.
+    """
+    budget = MODEL_MEMORY_BUDGET_MB * 1024 * 1024
+    while _models.total_size + reserve > budget:
+        evicted = _models.pop_lru(exclude=exclude, skip=lambda m: m.in_use)
+        if evicted is None:
+            break
+        evicted_key, evicted_model = evicted
+        logger.info(
+            f"Unloading {evicted_key} to stay within memory budget "
+            f"({MODEL_MEMORY_BUDGET_MB} MB)"
+        )
+        try:
+            await evicted_model.unload()
+        except Exception as e:
+            logger.error(f"Error unloading model {evicted_key}: {e}", exc_info=True)
+
+
+async def _load_and_cache(cache_key: str, model: BaseModel) -> None:
+    """Load a model and cache it, enforcing the memory budget when one is set.
+
+    Room is made before load() using the footprint measured the last time this
+    key was loaded; the budget is checked again once the new footprint is known.
+    The footprint is the device memory delta across load(), so it is only
+    measured when no other load ran at the same time (GGUF models still get
+    their file size). Without a budget the
+    model is just loaded, so the device is never probed.
+    """
+    global _loads_in_flight, _loads_started
+    if MODEL_MEMORY_BUDGET_MB <= 0:
+        await model.load()
+        _models[cache_key] = model
+        return
+
+    await _evict_to_budget(_footprints.get(cache_key, 0), exclude=cache_key)
+
+    _loads_in_flight += 1
+    _loads_started += 1
+    started = _loads_started
+    overlapped = _loads_in_flight > 1
+    before = _memory_in_use()
+    try:
+        await model.load()
+        overlapped = overlapped or _loads_started != started
+        footprint = None if overlapped else max(0, _memory_in_use() - before)
+        if isinstance(gguf_path := getattr(model, "gguf_path", None), str):
+            footprint = max(footprint or 0, os.path.getsize(gguf_path))
+        if footprint is not None:
+            _footprints[cache_key] = footprint
+    finally:
+        _loads_in_flight -= 1
+
+    _models[cache_key] = model
+    if cache_key in _footprints:
+        _models.set_size(cache_key, _footprints[cache_key])
+
+    await _evict_to_budget(0, exclude=cache_key)
+
+
 # ============================================================================
 # Language Model Loading
 # ============================================================================
 
 
+# Memoized: called on every request, including cache hits. typed=True keeps
+# e.g. flash_attn=True and 1 from sharing an entry with different key text.
+@functools.lru_cache(maxsize=1024, typed=True)
 def _make_language_cache_key(
     model_id: str,
     n_ctx: int | None = None,
@@ -448,7 +557,7 @@ async def load_language(
         preferred_quantization,
     )
     if cache_key not in _models:
-        async with _model_load_lock:
+        async with _load_locks(cache_key):
             if cache_key not in _models:
                 logger.info(
                     f"Loading causal LM: {model_id} "
@@ -485,8 +594,7 @@ async def load_language(
                 else:
                     model = LanguageModel(model_id, device)
 
-                await model.load()
-                _models[cache_key] = model
+                await _load_and_cache(cache_key, model)
 
     # Return model (get() refreshes TTL automatically)
     return _models.get(cache_key)
@@ -497,6 +605,7 @@ async def load_language(
 # ============================================================================
 
 
+@functools.lru_cache(maxsize=1024, typed=True)
 def _make_encoder_cache_key(
     model_id: str,
     task: str,
@@ -526,7 +635,7 @@ async def load_encoder(
     )
 
     if cache_key not in _models:
-        async with _model_load_lock:
+        async with _load_locks(cache_key):
             if cache_key not in _models:
                 logger.info(
                     f"Loading encoder ({task}): {model_id} (format: {model_format})"
@@ -551,8 +660,7 @@ async def load_encoder(
                         use_flash_attention=use_flash_attention,
                     )
 
-                await model.load()
-                _models[cache_key] = model
+                await _load_and_cache(cache_key, model)
 
     return _models.get(cache_key)
 
@@ -575,7 +683,7 @@ async def load_document(
     cache_key = _make_document_cache_key(model_id, task)
 
     if cache_key not in _models:
-        async with _model_load_lock:
+        async with _load_locks(cache_key):
             if cache_key not in _models:
                 logger.info(f"Loading document model ({task}): {model_id}")
                 device = get_device()
@@ -586,8 +694,7 @@ async def load_document(
                     task=task,
                 )
 
-                await model.load()
-                _models[cache_key] = model
+                await _load_and_cache(cache_key, model)
 
     return _models.get(cache_key)
 
@@ -609,7 +716,7 @@ async def load_ocr(backend: str = "surya", languages: list[str] | None = None):
     cache_key = _make_ocr_cache_key(backend, langs)
 
     if cache_key not in _models:
-        async with _model_load_lock:
+        async with _load_locks(cache_key):
             if cache_key not in _models:
                 logger.info(f"Loading OCR model: {backend} (languages: {langs})")
                 device = get_device()
@@ -621,8 +728,7 @@ async def load_ocr(backend: str = "surya", languages: list[str] | None = None):
                     languages=langs,
                 )
 
-                await model.load()
-                _models[cache_key] = model
+                await _load_and_cache(cache_key, model)
 
     return _models.get(cache_key)
 
@@ -652,7 +758,7 @@ async def load_anomaly(
     cache_key = _make_anomaly_cache_key(model_id, backend, normalization)
 
     if cache_key not in _models:
-        async with _model_load_lock:
+        async with _load_locks(cache_key):
             if cache_key not in _models:
                 logger.info(f"Loading anomaly model ({backend}): {model_id}")
                 device = get_device()
@@ -666,8 +772,7 @@ async def load_anomaly(
                     normalization=normalization,
                 )
 
-                await model.load()
-                _models[cache_key] = model
+                await _load_and_cache(cache_key, model)
 
     return _models.get(cache_key)
 
@@ -701,7 +806,7 @@ async def load_classifier(
         await cached.unload()
 
     if cache_key not in _classifiers:
-        async with _model_load_lock:
+        async with _load_locks(cache_key):
             if cache_key not in _classifiers:
                 logger.info(f"Loading classifier model: {model_id}")
                 device = get_device()
@@ -745,7 +850,7 @@ async def load_speech(
     cache_key = _make_speech_cache_key(model_id, compute_type)
 
     if cache_key not in _models:
-        async with _model_load_lock:
+        async with _load_locks(cache_key):
             if cache_key not in _models:
                 logger.info(f"Loading speech model: {model_id}")
                 device = get_device()
@@ -756,8 +861,7 @@ async def load_speech(
                     compute_type=compute_type,
                 )
 
-                await model.load()
-                _models[cache_key] = model
+                await _load_and_cache(cache_key, model)
 
     return _models.get(cache_key)
 
@@ -784,8 +888,6 @@ def _make_tts_cache_key(
     """
     if voice_profile_path:
         # Hash the path to keep key reasonable length
-        import hashlib
-
         path_hash = hashlib.md5(voice_profile_path.encode()).hexdigest()[:8]
         return f"tts:{model_id}:{voice}:{path_hash}"
     return f"tts:{model_id}:{voice}"
@@ -830,7 +932,7 @@ async def load_tts(
     cache_key = _make_tts_cache_key(model_id, voice, voice_profile_path)
 
     if cache_key not in _models:
-        async with _model_load_lock:
+        async with _load_locks(cache_key):
             if cache_key not in _models:
                 logger.info(f"Loading TTS model: {model_id} (voice={voice})")
                 device = get_device()
@@ -853,8 +955,7 @@ async def load_tts(
                     chatterbox_config=chatterbox_config,
                 )
 
-                await model.load()
-                _models[cache_key] = model
+                await _load_and_cache(cache_key, model)
 
     # Return model (get() refreshes TTL automatically)
     return _models.get(cache_key)
@@ -878,12 +979,12 @@ set_file_image_getter(get_file_images)
 
 # Anomaly router
 set_anomaly_loader(load_anomaly)
-set_anomaly_state(_models, _encoders, _model_load_lock)
+set_anomaly_state(_models, _encoders, _load_locks)
 
 # Classifier router
 set_classifier_loader(load_classifier)
 set_classifier_models_dir(CLASSIFIER_MODELS_DIR)
-set_classifier_state(_classifiers, _model_load_lock)
+set_classifier_state(_classifiers, _load_locks)
 
 # Audio router
 set_speech_loader(load_speech)
@@ -144,6 +144,33 @@ class TestPyODDetectorCreation:
         except ImportError:
             pytest.skip("SUOD dependencies not installed")
 
+    def test_detector_class_cached(self):
+        """Test detector classes are resolved once and new instances created."""
+        from models.pyod_backend import _CLASS_CACHE, BACKEND_REGISTRY, create_detector
+
+        first = create_detector("hbos", contamination=0.1)
+        second = create_detector("hbos", contamination=0.1)
+
+        assert type(first) is _CLASS_CACHE[BACKEND_REGISTRY["hbos"]]
+        assert first is not second
+
+    def test_every_backend_has_factory(self):
+        """Test each registered backend has a dedicated constructor."""
+        from models.pyod_backend import _FACTORIES, BACKEND_REGISTRY
+
+        assert set(_FACTORIES) == set(BACKEND_REGISTRY)
+
+    def test_default_suod_bases_cached(self):
+        """Test the default SUOD ensemble prototypes are built once per contamination."""
+        from models.pyod_backend import _default_suod_bases
+
+        bases = _default_suod_bases(0.1)
+
+        assert _default_suod_bases(0.1) is bases
+        assert [type(e).__name__ for e in bases] == ["IForest", "HBOS", "COPOD"]
+        assert all(e.contamination == 0.1 for e in bases)
+        assert _default_suod_bases(0.2)[0].contamination == 0.2
+
 
 class TestPyODFitAndScore:
     """Test fitting and scoring with PyOD backends."""
@@ -208,6 +235,32 @@ class TestPyODFitAndScore:
         scores = get_decision_scores(detector, test_data_with_anomaly)
         assert len(scores) == len(test_data_with_anomaly)
 
+    @pytest.mark.parametrize("method", ["largest", "mean", "median"])
+    def test_knn_direct_scores_match_decision_function(self, method, normal_data, test_data_with_anomaly):
+        """Test the small-batch KNN fast path agrees with PyOD."""
+        from models.pyod_backend import (
+            create_detector,
+            fit_detector,
+            get_decision_scores,
+        )
+
+        detector = create_detector("knn", contamination=0.1, n_neighbors=5, method=method)
+        fit_detector(detector, normal_data.astype(np.float32))
+
+        scores = get_decision_scores(detector, test_data_with_anomaly)
+        expected = detector.decision_function(test_data_with_anomaly)
+        np.testing.assert_allclose(scores, expected, rtol=1e-5)
+
+        # Euclidean only - other metrics go through sklearn
+        from pyod.models.knn import KNN
+
+        detector = KNN(contamination=0.1, metric="manhattan", method=method)
+        fit_detector(detector, normal_data)
+        np.testing.assert_allclose(
+            get_decision_scores(detector, test_data_with_anomaly),
+            detector.decision_function(test_data_with_anomaly),
+        )
+
     def test_fit_and_score_copod(self, normal_data, test_data_with_anomaly):
         """Test COPOD backend (parameter-free)."""
         from models.pyod_backend import (
@@ -496,8 +549,6 @@ class TestBackendsEndpoint:
     @pytest.fixture
     def test_app(self):
         """Create a test FastAPI app with the anomaly router."""
-        import asyncio
-
         from fastapi import FastAPI
 
         from routers.anomaly import (
@@ -506,6 +557,7 @@ class TestBackendsEndpoint:
             set_models_dir,
             set_state,
         )
+        from utils.keyed_lock import KeyedLock
 
         app = FastAPI()
         app.include_router(router)
@@ -519,8 +571,8 @@ class TestBackendsEndpoint:
 
         models = {}
         encoders = {}
-        model_load_lock = asyncio.Lock()
-        set_state(models, encoders, model_load_lock)
+        load_locks = KeyedLock()
+        set_state(models, encoders, load_locks)
 
         # Mock loader not needed for backends endpoint
         set_anomaly_loader(None)
@@ -82,6 +82,7 @@ def temp_models_dir():
 def test_app(mock_anomaly_model, temp_models_dir):
     """Create a test FastAPI app with the anomaly router."""
     from routers.anomaly import router, set_anomaly_loader, set_models_dir, set_state
+    from utils.keyed_lock import KeyedLock
 
     app = FastAPI()
     app.include_router(router)
@@ -92,8 +93,8 @@ def test_app(mock_anomaly_model, temp_models_dir):
     # Set up shared state (models cache, encoders, lock)
     models = {}
     encoders = {}
-    model_load_lock = asyncio.Lock()
-    set_state(models, encoders, model_load_lock)
+    load_locks = KeyedLock()
+    set_state(models, encoders, load_locks)
 
     # Set up mock model loader
     async def mock_load_anomaly(model_id, backend="isolation_forest", **kwargs):
@@ -262,6 +263,47 @@ class TestAnomalyLoadEndpoint:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
+    async def test_load_waits_for_key_lock(
+        self, test_app, temp_models_dir, monkeypatch
+    ):
+        """Test a disk load holds the same per-key lock as the server's loader."""
+        import importlib
+
+        import models
+        from api_types.anomaly import AnomalyLoadRequest
+
+        anomaly_router = importlib.import_module("routers.anomaly.router")
+
+        loads = []
+
+        class FakeAnomalyModel:
+            def __init__(self, model_id, device, backend):
+                self.normalization = "standardization"
+                self.is_fitted = True
+                self.threshold = 0.5
+
+            async def load(self):
+                loads.append(self)
+
+            async def unload(self):
+                pass
+
+        monkeypatch.setattr(models, "AnomalyModel", FakeAnomalyModel)
+        (temp_models_dir / "locked_isolation_forest.joblib").write_bytes(b"data")
+
+        cache_key = "anomaly:isolation_forest:standardization:locked"
+        async with anomaly_router._load_locks(cache_key):
+            task = asyncio.create_task(
+                anomaly_router.load_anomaly_model(AnomalyLoadRequest(model="locked"))
+            )
+            await asyncio.sleep(0.05)
+            assert not loads
+            assert not task.done()
+
+        await task
+        assert len(loads) == 1
+        assert anomaly_router._models[cache_key] is loads[0]
+
     def test_load_request_validation(self, client):
         """Test that load request requires model and backend."""
         from api_types.anomaly import AnomalyLoadRequest
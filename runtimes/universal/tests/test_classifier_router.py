@@ -84,6 +84,7 @@ def test_app(mock_classifier_model, temp_models_dir):
         set_models_dir,
         set_state,
     )
+    from utils.keyed_lock import KeyedLock
 
     app = FastAPI()
     app.include_router(router)
@@ -93,8 +94,8 @@ def test_app(mock_classifier_model, temp_models_dir):
 
     # Set up shared state
     classifiers = {}
-    model_load_lock = asyncio.Lock()
-    set_state(classifiers, model_load_lock)
+    load_locks = KeyedLock()
+    set_state(classifiers, load_locks)
 
     # Set up mock model loader
     async def mock_load_classifier(
@@ -258,6 +259,45 @@ class TestClassifierLoadEndpoint:
         assert response.status_code == 404
         assert "not found" in response.json()["detail"].lower()
 
+    async def test_load_waits_for_key_lock(
+        self, test_app, temp_models_dir, monkeypatch
+    ):
+        """Test a disk load holds the same per-key lock as the server's loader."""
+        import importlib
+
+        import models
+        from api_types.classifier import ClassifierLoadRequest
+
+        classifier_router = importlib.import_module("routers.classifier.router")
+
+        loads = []
+
+        class FakeClassifierModel:
+            def __init__(self, model_id, device):
+                self.is_fitted = True
+                self.labels = ["a", "b"]
+
+            async def load(self):
+                loads.append(self)
+
+        monkeypatch.setattr(models, "ClassifierModel", FakeClassifierModel)
+        (temp_models_dir / "locked").mkdir()
+
+        cache_key = "classifier:locked"
+        async with classifier_router._load_locks(cache_key):
+            task = asyncio.create_task(
+                classifier_router.load_classifier_endpoint(
+                    ClassifierLoadRequest(model="locked")
+                )
+            )
+            await asyncio.sleep(0.05)
+            assert not loads
+            assert not task.done()
+
+        await task
+        assert len(loads) == 1
+        assert classifier_router._classifiers[cache_key] is loads[0]
+
     def test_load_request_validation(self, client):
         """Test that load request requires model."""
         from api_types.classifier import ClassifierLoadRequest
@@ -221,6 +221,51 @@ class TestGetDefaultContextSize:
         assert n_ctx == 8192
         assert len(warnings) == 0
 
+    @pytest.mark.parametrize(
+        "config_n_ctx,n_ctx_train,expected",
+        [
+            (3117, None, 3584),  # Rounded up to the next multiple of 512
+            (3117, 3200, 3117),  # Rounding up would pass n_ctx_train
+            (4096, None, 4096),  # Already aligned
+            (None, 4000, 4000),  # Unaligned training context is kept
+            (None, 10000, 10000),
+            (8000, 4096, 8000),  # Explicit request is never lowered
+        ],
+    )
+    @patch("utils.context_calculator.get_gguf_metadata")
+    @patch("utils.context_calculator.get_available_memory")
+    @patch("utils.context_calculator.load_model_context_config")
+    def test_context_size_aligned(
+        self,
+        mock_config,
+        mock_memory,
+        mock_metadata,
+        config_n_ctx,
+        n_ctx_train,
+        expected,
+    ):
+        """Test that context sizes are aligned to a multiple of 512 tokens."""
+        mock_metadata.return_value = {
+            "file_size_bytes": 1 * 1024**3,  # 1GB model
+            "file_size_mb": 1024,
+            "n_ctx_train": n_ctx_train,
+        }
+        mock_memory.return_value = 16 * 1024**3  # 16GB available
+        mock_config.return_value = {
+            "memory_usage_factor": 0.8,
+            "model_defaults": [{"pattern": "*", "n_ctx": 2048}],
+        }
+
+        n_ctx, warnings = get_default_context_size(
+            model_id="test/model",
+            gguf_path="/fake/path.gguf",
+            device="cpu",
+            config_n_ctx=config_n_ctx,
+        )
+
+        assert n_ctx == expected
+        assert len(warnings) == 0
+
     @patch("utils.context_calculator.get_gguf_metadata")
     @patch("utils.context_calculator.get_available_memory")
     @patch("utils.context_calculator.load_model_context_config")
@@ -253,6 +298,34 @@ class TestGetDefaultContextSize:
         assert len(warnings) > 0
         assert "exceeds computed maximum" in warnings[0]
 
+    @patch("utils.context_calculator.get_gguf_metadata")
+    @patch("utils.context_calculator.get_available_memory")
+    @patch("utils.context_calculator.load_model_context_config")
+    def test_pre_probed_memory_skips_probe(
+        self, mock_config, mock_memory, mock_metadata
+    ):
+        """Test that an already-probed memory value is used as-is."""
+        mock_metadata.return_value = {
+            "file_size_bytes": 1 * 1024**3,  # 1GB model
+            "file_size_mb": 1024,
+        }
+        mock_config.return_value = {
+            "memory_usage_factor": 0.8,
+            "model_defaults": [{"pattern": "*", "n_ctx": 2048}],
+        }
+
+        n_ctx, warnings = get_default_context_size(
+            model_id="test/model",
+            gguf_path="/fake/path.gguf",
+            device="cpu",
+            config_n_ctx=8192,
+            available_memory=16 * 1024**3,
+        )
+
+        assert n_ctx == 8192
+        assert len(warnings) == 0
+        mock_memory.assert_not_called()
+
     @patch("utils.context_calculator.get_gguf_metadata")
     @patch("utils.context_calculator.get_available_memory")
     @patch("utils.context_calculator.load_model_context_config")
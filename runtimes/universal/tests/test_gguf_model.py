@@ -11,7 +11,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from models.gguf_language_model import GGUFLanguageModel
+from models.gguf_language_model import GGUFLanguageModel, _StreamChannel
 
 
 class TestGGUFLanguageModel:
@@ -33,6 +33,20 @@ class TestGGUFLanguageModel:
         model = GGUFLanguageModel("test/model", "cpu", n_ctx=8192)
         assert model.n_ctx == 8192
 
+    @pytest.mark.parametrize(
+        "device,expected",
+        [("cpu", "Q4_K_M"), ("mps", "Q4_K_M"), ("cuda", "Q5_K_M")],
+    )
+    def test_default_quantization_by_device(self, device, expected):
+        """Test the default quantization depends on the target device."""
+        model = GGUFLanguageModel("test/model", device)
+        assert model.preferred_quantization == expected
+
+    def test_explicit_quantization_overrides_default(self):
+        """Test an explicit quantization is kept regardless of device."""
+        model = GGUFLanguageModel("test/model", "cuda", preferred_quantization="Q8_0")
+        assert model.preferred_quantization == "Q8_0"
+
     def test_format_messages_simple(self):
         """Test formatting of simple chat messages."""
         model = GGUFLanguageModel("test/model", "cpu")
@@ -120,6 +134,38 @@ class TestGGUFLanguageModel:
             call_kwargs = mock_llama_cls.call_args[1]
             assert call_kwargs["n_gpu_layers"] == -1
 
+    @pytest.mark.asyncio
+    async def test_load_model_multi_gpu_split(self, tmp_path):
+        """Test multi-GPU split settings are passed through on GPU devices."""
+        gguf_file = tmp_path / "model.gguf"
+        gguf_file.write_text("mock gguf content")
+
+        model = GGUFLanguageModel(
+            "test/model",
+            "cuda",
+            n_gpu_layers=-1,
+            tensor_split=[1.0, 1.0],
+            split_mode="row",
+        )
+
+        with (
+            patch(
+                "models.gguf_language_model.get_gguf_file_path",
+                return_value=str(gguf_file),
+            ),
+            patch(
+                "models.gguf_language_model.get_default_context_size",
+                return_value=(2048, []),
+            ),
+            patch("llamafarm_llama.Llama", return_value=MagicMock()) as mock_llama_cls,
+        ):
+            await model.load()
+            call_kwargs = mock_llama_cls.call_args[1]
+            assert call_kwargs["tensor_split"] == [1.0, 1.0]
+            assert call_kwargs["split_mode"] == "row"
+            assert call_kwargs["main_gpu"] == 0
+            assert call_kwargs["offload_kqv"] is True
+
     @pytest.mark.asyncio
     async def test_load_model_force_cpu(self, tmp_path, monkeypatch):
         """Test loading GGUF model with forced CPU mode."""
@@ -154,6 +200,55 @@ class TestGGUFLanguageModel:
             call_kwargs = mock_llama_cls.call_args[1]
             assert call_kwargs["n_gpu_layers"] == 0
 
+    @pytest.mark.asyncio
+    async def test_load_model_cpu_mlock_and_numa_defaults(self, tmp_path):
+        """Test CPU loads leave mlock opt-in and distribute on NUMA hosts."""
+        model_dir = tmp_path / "model"
+        model_dir.mkdir()
+        gguf_file = model_dir / "model.gguf"
+        gguf_file.write_text("mock gguf content")
+
+        model = GGUFLanguageModel("test/model", "cpu")
+
+        with (
+            patch(
+                "models.gguf_language_model.get_gguf_file_path",
+                return_value=str(gguf_file),
+            ),
+            patch(
+                "models.gguf_language_model.get_default_context_size",
+                return_value=(2048, []),
+            ),
+            patch.object(model, "_get_available_memory_mb", return_value=16000),
+            patch(
+                "models.gguf_language_model._is_multi_numa_host", return_value=True
+            ),
+            patch("llamafarm_llama.Llama", return_value=MagicMock()) as mock_llama_cls,
+        ):
+            await model.load()
+            call_kwargs = mock_llama_cls.call_args[1]
+            assert call_kwargs["use_mlock"] is False
+            assert call_kwargs["numa"] == "distribute"
+
+        # Explicit settings always win
+        model = GGUFLanguageModel("test/model", "cpu", use_mlock=True, numa="isolate")
+        with (
+            patch(
+                "models.gguf_language_model.get_gguf_file_path",
+                return_value=str(gguf_file),
+            ),
+            patch(
+                "models.gguf_language_model.get_default_context_size",
+                return_value=(2048, []),
+            ),
+            patch.object(model, "_get_available_memory_mb", return_value=16000),
+            patch("llamafarm_llama.Llama", return_value=MagicMock()) as mock_llama_cls,
+        ):
+            await model.load()
+            call_kwargs = mock_llama_cls.call_args[1]
+            assert call_kwargs["use_mlock"] is True
+            assert call_kwargs["numa"] == "isolate"
+
     @pytest.mark.asyncio
     async def test_generate_not_loaded(self):
         """Test generate raises error if model not loaded."""
@@ -195,6 +290,61 @@ class TestGGUFLanguageModel:
             )
             assert result == "Hello! How can I help?"
 
+    @pytest.mark.asyncio
+    async def test_context_pool_serves_concurrent_requests(self, tmp_path):
+        """Test pool_size > 1 loads several contexts and spreads requests across them."""
+        import asyncio
+        import threading
+
+        gguf_file = tmp_path / "model.gguf"
+        gguf_file.write_text("mock gguf content")
+
+        model = GGUFLanguageModel("test/model", "cpu", pool_size=2, use_mmap=True)
+
+        both_started = threading.Barrier(2, timeout=5)
+        used = []
+
+        def make_llama(*args, **kwargs):
+            llama = MagicMock()
+
+            def complete(**kw):
+                # Blocks until the other request is running on another context
+                both_started.wait()
+                used.append(llama)
+                return {"choices": [{"message": {"content": "ok"}}]}
+
+            llama.create_chat_completion.side_effect = complete
+            return llama
+
+        with (
+            patch(
+                "models.gguf_language_model.get_gguf_file_path",
+                return_value=str(gguf_file),
+            ),
+            patch(
+                "models.gguf_language_model.get_default_context_size",
+                return_value=(2048, []),
+            ),
+            patch("llamafarm_llama.Llama", side_effect=make_llama) as mock_llama_cls,
+            patch(
+                "models.gguf_language_model.is_unified_memory_gpu",
+                return_value=False,
+            ),
+        ):
+            await model.load()
+            assert mock_llama_cls.call_count == 2
+
+            messages = [{"role": "user", "content": "Hi"}]
+            results = await asyncio.gather(
+                model.generate(messages), model.generate(messages)
+            )
+
+        assert results == ["ok", "ok"]
+        assert len({id(llama) for llama in used}) == 2
+
+        await model.unload()
+        assert model._pool == []
+
     @pytest.mark.asyncio
     async def test_generate_stream_not_loaded(self):
         """Test streaming generate raises error if model not loaded."""
@@ -280,6 +430,129 @@ class TestGGUFLanguageModel:
         )
         assert callable(logits_processor), "logits_processor must be callable"
 
+    @pytest.mark.asyncio
+    async def test_native_sampler_params_passed(self):
+        """Test min_p/top_k reach the native sampler and min_p can be overridden."""
+        model = GGUFLanguageModel("test/model", "cpu", min_p=0.1, top_k=20)
+        mock_llama = Mock()
+        mock_llama.create_chat_completion.return_value = {
+            "choices": [{"message": {"content": "ok"}}]
+        }
+        model.llama = mock_llama
+
+        await model.generate([{"role": "user", "content": "Hi"}])
+        call_kwargs = mock_llama.create_chat_completion.call_args[1]
+        assert call_kwargs["min_p"] == 0.1
+        assert call_kwargs["top_k"] == 20
+
+        await model.generate([{"role": "user", "content": "Hi"}], min_p=0.0)
+        assert mock_llama.create_chat_completion.call_args[1]["min_p"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_stream_queue_coalesces_tokens(self):
+        """Test tokens queued within the coalesce window are yielded as one chunk."""
+        import asyncio
+
+        model = GGUFLanguageModel("test/model", "cpu", stream_coalesce_ms=5.0)
+        channel = _StreamChannel(asyncio.get_running_loop())
+        for item in ["Hel", "lo", " world", None]:
+            channel.queue.put_nowait(item)
+
+        chunks = [chunk async for chunk in model._drain_stream_queue(channel)]
+        assert chunks == ["Hello world"]
+
+    @pytest.mark.asyncio
+    async def test_stream_queue_no_coalescing(self):
+        """Test stream_coalesce_ms=0 yields every token individually."""
+        import asyncio
+
+        model = GGUFLanguageModel("test/model", "cpu", stream_coalesce_ms=0)
+        channel = _StreamChannel(asyncio.get_running_loop())
+        for item in ["Hel", "lo", None]:
+            channel.queue.put_nowait(item)
+
+        chunks = [chunk async for chunk in model._drain_stream_queue(channel)]
+        assert chunks == ["Hel", "lo"]
+
+    @pytest.mark.asyncio
+    async def test_stream_queue_error_after_text(self):
+        """Test text gathered before an error is yielded before the error is raised."""
+        import asyncio
+
+        model = GGUFLanguageModel("test/model", "cpu")
+        channel = _StreamChannel(asyncio.get_running_loop())
+        for item in ["partial", RuntimeError("boom"), None]:
+            channel.queue.put_nowait(item)
+
+        chunks = []
+        with pytest.raises(RuntimeError, match="boom"):
+            async for chunk in model._drain_stream_queue(channel):
+                chunks.append(chunk)
+        assert chunks == ["partial"]
+
+    @pytest.mark.asyncio
+    async def test_stream_channel_back_pressure(self):
+        """Test the producer blocks on a full channel and stops once it is closed."""
+        import asyncio
+        import threading
+
+        channel = _StreamChannel(asyncio.get_running_loop(), maxsize=2)
+        results = []
+
+        def produce():
+            for text in ["a", "b", "c", "d"]:
+                if not channel.put(text):
+                    results.append("stopped")
+                    return
+                results.append(text)
+
+        producer = threading.Thread(target=produce)
+        producer.start()
+        await asyncio.sleep(0.05)
+        assert results == ["a", "b"]  # Blocked with two chunks waiting
+
+        channel.consumed(1)
+        await asyncio.sleep(0.05)
+        assert results == ["a", "b", "c"]
+
+        channel.close()
+        producer.join(timeout=1)
+        assert not producer.is_alive()
+        assert results == ["a", "b", "c", "stopped"]
+
+    @pytest.mark.asyncio
+    async def test_inference_worker_results_and_errors(self):
+        """Test the worker thread returns results and propagates exceptions."""
+        from models.gguf_language_model import _InferenceWorker
+
+        worker = _InferenceWorker()
+        try:
+            assert await worker.submit(lambda: 21 * 2) == 42
+
+            def fail():
+                raise RuntimeError("worker failure")
+
+            with pytest.raises(RuntimeError, match="worker failure"):
+                await worker.submit(fail)
+        finally:
+            worker.shutdown(wait=True)
+        assert not worker.is_alive()
+
+    @pytest.mark.asyncio
+    async def test_unload_stops_worker(self):
+        """Test unload stops the inference worker thread and frees the context."""
+        model = GGUFLanguageModel("test/model", "cpu")
+        llama = Mock()
+        model.llama = llama
+        model._token_counter = Mock()
+
+        await model.unload()
+
+        assert model.llama is None
+        assert model._token_counter is None
+        assert not model._worker.is_alive()
+        llama.close.assert_called_once()
+
 
 @pytest.mark.integration
 class TestGGUFIntegration:
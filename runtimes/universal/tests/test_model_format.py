@@ -1,212 +1,168 @@
 """Tests for runtime-specific model format detection utilities."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
+from utils.model_format import clear_format_cache, detect_model_format
 
-class TestDetectModelFormat:
-    """Test model format detection (runtime-specific)."""
+# Sharded safetensors listing, as returned for large transformers repos
+_SHARDS = [f"model-{i:05d}-of-00500.safetensors" for i in range(1, 501)]
 
-    @patch("utils.model_format._check_local_cache_for_model")
-    @patch("utils.model_format.HfApi")
-    def test_detect_model_format_gguf(self, mock_hf_api_class, mock_check_local_cache):
-        """Test detecting GGUF format."""
-        from utils.model_format import clear_format_cache, detect_model_format
-
-        # Clear cache for fresh test
-        clear_format_cache()
-
-        # Mock local cache to return None (not found), forcing API call
-        mock_check_local_cache.return_value = None
-
-        # Setup mock
-        mock_api = Mock()
-        mock_api.list_repo_files.return_value = [
-            "README.md",
-            "model.Q4_K_M.gguf",
-            "model.Q8_0.gguf",
-        ]
-        mock_hf_api_class.return_value = mock_api
-
-        # Test
-        result = detect_model_format("test/model")
-
-        # Verify
-        assert result == "gguf"
-
-    @patch("utils.model_format._check_local_cache_for_model")
-    @patch("utils.model_format.HfApi")
-    def test_detect_model_format_transformers(
-        self, mock_hf_api_class, mock_check_local_cache
-    ):
-        """Test detecting transformers format."""
-        from utils.model_format import clear_format_cache, detect_model_format
-
-        # Clear cache for fresh test
-        clear_format_cache()
-
-        # Mock local cache to return None (not found), forcing API call
-        mock_check_local_cache.return_value = None
-
-        # Setup mock
-        mock_api = Mock()
-        mock_api.list_repo_files.return_value = [
-            "config.json",
-            "model.safetensors",
-            "tokenizer.json",
-        ]
-        mock_hf_api_class.return_value = mock_api
-
-        # Test
-        result = detect_model_format("test/model")
-
-        # Verify
-        assert result == "transformers"
-
-    @patch("utils.model_format._check_local_cache_for_model")
-    @patch("utils.model_format.HfApi")
-    def test_detect_model_format_strips_quantization_suffix(
-        self, mock_hf_api_class, mock_check_local_cache
-    ):
-        """
-        Test that detect_model_format() strips quantization suffix before calling HF API.
 
-        This ensures 'unsloth/Qwen3-1.7B-GGUF:Q4_K_M' is passed to HF API as
-        'unsloth/Qwen3-1.7B-GGUF' (without the ':Q4_K_M' suffix).
-        """
-        from utils.model_format import clear_format_cache, detect_model_format
+class FakeHfApi:
+    """Stand-in for HfApi that serves ``files`` and records each listing."""
 
-        # Clear cache to ensure fresh API call
-        clear_format_cache()
+    files: list[str] = []
+    calls: list[tuple[str, str | None]] = []
 
-        # Mock local cache to return None (not found), forcing API call
-        mock_check_local_cache.return_value = None
+    def list_repo_files(self, repo_id, token=None):
+        FakeHfApi.calls.append((repo_id, token))
+        return FakeHfApi.files
 
-        # Setup mock
-        mock_api = Mock()
-        mock_api.list_repo_files.return_value = ["model.Q4_K_M.gguf", "model.Q8_0.gguf"]
-        mock_hf_api_class.return_value = mock_api
 
-        # Test with quantization suffix
-        result = detect_model_format("unsloth/Qwen3-1.7B-GGUF:Q4_K_M")
+@pytest.fixture(autouse=True)
+def format_env(monkeypatch):
+    """Patch HfApi and the local HF cache lookup, starting from an empty cache.
 
-        # Verify HF API was called with CLEAN model ID (no suffix)
-        mock_api.list_repo_files.assert_called_once_with(
-            repo_id="unsloth/Qwen3-1.7B-GGUF",  # Should NOT have :Q4_K_M
-            token=None,
-        )
+    Yields ``(FakeHfApi, mock_check_local_cache)``. The local cache lookup
+    returns None (not found) by default, forcing an API call.
+    """
+    FakeHfApi.files = []
+    FakeHfApi.calls = []
+    monkeypatch.setattr("utils.model_format.HfApi", FakeHfApi)
+    mock_check_local_cache = Mock(return_value=None)
+    monkeypatch.setattr(
+        "utils.model_format._check_local_cache_for_model", mock_check_local_cache
+    )
+    clear_format_cache()
+    yield FakeHfApi, mock_check_local_cache
+    clear_format_cache()
 
-        # Verify correct format was detected
-        assert result == "gguf"
 
-    @patch("utils.model_format._check_local_cache_for_model")
-    @patch("utils.model_format.HfApi")
-    def test_caching_with_quantization_suffix(
-        self, mock_hf_api_class, mock_check_local_cache
-    ):
-        """
-        Test that format detection cache works correctly with quantization suffixes.
+class TestDetectModelFormat:
+    """Test model format detection (runtime-specific)."""
 
-        Both 'model:Q4_K_M' and 'model:Q8_0' should use the same cached result
-        since they're the same base model.
-        """
-        from utils.model_format import clear_format_cache, detect_model_format
-
-        # Clear cache for fresh test
-        clear_format_cache()
-
-        # Mock local cache to return None (not found), forcing API call
-        mock_check_local_cache.return_value = None
-
-        # Setup mock
-        mock_api = Mock()
-        mock_api.list_repo_files.return_value = ["model.Q4_K_M.gguf"]
-        mock_hf_api_class.return_value = mock_api
-
-        # First call with Q4_K_M suffix
-        result1 = detect_model_format("test/model:Q4_K_M")
-        assert result1 == "gguf"
-        assert mock_api.list_repo_files.call_count == 1
-
-        # Second call with Q8_0 suffix - should use cache (same base model)
-        result2 = detect_model_format("test/model:Q8_0")
-        assert result2 == "gguf"
-        assert mock_api.list_repo_files.call_count == 1  # Still 1, cache was used
-
-        # Third call without suffix - should also use cache
-        result3 = detect_model_format("test/model")
-        assert result3 == "gguf"
-        assert mock_api.list_repo_files.call_count == 1  # Still 1, cache was used
-
-    @patch("utils.model_format._check_local_cache_for_model")
-    @patch("utils.model_format.HfApi")
-    def test_detect_model_format_uses_local_cache(
-        self, mock_hf_api_class, mock_check_local_cache
+    @pytest.mark.parametrize(
+        "model_id,files,expected,local,api_repo",
+        [
+            (
+                "test/model",
+                ["README.md", "model.Q4_K_M.gguf", "model.Q8_0.gguf"],
+                "gguf",
+                False,
+                "test/model",
+            ),
+            (
+                "test/model",
+                ["config.json", "model.safetensors", "tokenizer.json"],
+                "transformers",
+                False,
+                "test/model",
+            ),
+            # The quantization suffix must be stripped before calling HF API
+            (
+                "unsloth/Qwen3-1.7B-GGUF:Q4_K_M",
+                ["model.Q4_K_M.gguf", "model.Q8_0.gguf"],
+                "gguf",
+                False,
+                "unsloth/Qwen3-1.7B-GGUF",
+            ),
+            # Files found in the local HF cache mean no network request is made
+            (
+                "test/model",
+                ["README.md", "model.Q4_K_M.gguf", "model.Q8_0.gguf"],
+                "gguf",
+                True,
+                None,
+            ),
+            (
+                "test/model",
+                ["config.json", "model.safetensors", "tokenizer.json"],
+                "transformers",
+                True,
+                None,
+            ),
+            # Large sharded repos: a single .gguf after hundreds of shards
+            (
+                "test/model",
+                [*_SHARDS, "model.Q4_K_M.gguf"],
+                "gguf",
+                False,
+                "test/model",
+            ),
+            (
+                "test/model",
+                _SHARDS,
+                "transformers",
+                False,
+                "test/model",
+            ),
+        ],
+        ids=[
+            "gguf",
+            "transformers",
+            "strips_quantization_suffix",
+            "local_cache_gguf",
+            "local_cache_transformers",
+            "large_repo_gguf",
+            "large_repo_transformers",
+        ],
+    )
+    def test_detect_model_format(
+        self, format_env, model_id, files, expected, local, api_repo
     ):
+        """Test detecting the format from the local HF cache or the HF API."""
+        api, mock_check_local_cache = format_env
+        if local:
+            mock_check_local_cache.return_value = files
+        else:
+            api.files = files
+
+        assert detect_model_format(model_id) == expected
+
+        if local:
+            assert api.calls == []
+        else:
+            assert api.calls == [(api_repo, None)]
+
+    @pytest.mark.parametrize(
+        "suffix", ["Q2_K", "Q3_K_S", "Q4_0", "Q4_K_M", "Q5_K_M", "Q6_K", "Q8_0", None]
+    )
+    def test_caching_with_quantization_suffix(self, format_env, suffix):
         """
-        Test that detect_model_format() uses local HF cache before making API calls.
+        Test that format detection cache works correctly with quantization suffixes.
 
-        This is the key offline functionality - if files are in local cache,
-        no network request is made.
+        Once 'model:Q4_K_M' has been detected, any other quantization of the
+        same base model (or the bare model ID) should use the cached result.
         """
-        from utils.model_format import clear_format_cache, detect_model_format
-
-        # Clear cache for fresh test
-        clear_format_cache()
-
-        # Mock local cache to return GGUF files
-        mock_check_local_cache.return_value = [
-            "README.md",
-            "model.Q4_K_M.gguf",
-            "model.Q8_0.gguf",
-        ]
-
-        # Setup mock - should NOT be called
-        mock_api = Mock()
-        mock_hf_api_class.return_value = mock_api
-
-        # Test
-        result = detect_model_format("test/model")
+        api, _ = format_env
+        api.files = ["model.Q4_K_M.gguf"]
 
-        # Verify format was detected from local cache
-        assert result == "gguf"
+        # Prime the cache with one quantization
+        assert detect_model_format("test/model:Q4_K_M") == "gguf"
+        assert api.calls == [("test/model", None)]
 
-        # Verify HF API was NOT called (used local cache instead)
-        mock_api.list_repo_files.assert_not_called()
+        model_id = f"test/model:{suffix}" if suffix else "test/model"
+        assert detect_model_format(model_id) == "gguf"
+        assert len(api.calls) == 1  # Still 1, cache was used
 
-    @patch("utils.model_format._check_local_cache_for_model")
-    @patch("utils.model_format.HfApi")
-    def test_detect_model_format_local_cache_transformers(
-        self, mock_hf_api_class, mock_check_local_cache
-    ):
+    def test_repeat_lookup_skips_parsing(self, format_env, monkeypatch):
         """
-        Test that detect_model_format() detects transformers format from local cache.
+        Test that a model ID already resolved is returned without re-parsing it.
         """
-        from utils.model_format import clear_format_cache, detect_model_format
-
-        # Clear cache for fresh test
-        clear_format_cache()
-
-        # Mock local cache to return transformers files (no .gguf)
-        mock_check_local_cache.return_value = [
-            "config.json",
-            "model.safetensors",
-            "tokenizer.json",
-        ]
-
-        # Setup mock - should NOT be called
-        mock_api = Mock()
-        mock_hf_api_class.return_value = mock_api
-
-        # Test
-        result = detect_model_format("test/model")
+        _, mock_check_local_cache = format_env
+        mock_check_local_cache.return_value = ["model.Q4_K_M.gguf"]
+        mock_parse = Mock(return_value=("test/model", None))
+        monkeypatch.setattr(
+            "utils.model_format.parse_model_with_quantization", mock_parse
+        )
 
-        # Verify format was detected from local cache
-        assert result == "transformers"
+        assert detect_model_format("test/model") == "gguf"
+        assert detect_model_format("test/model") == "gguf"
 
-        # Verify HF API was NOT called (used local cache instead)
-        mock_api.list_repo_files.assert_not_called()
+        assert mock_parse.call_count == 1
+        assert mock_check_local_cache.call_count == 1
 
 
 if __name__ == "__main__":
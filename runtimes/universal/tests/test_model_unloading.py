@@ -35,11 +35,13 @@ def reset_server_globals():
     original_models = server._models
     original_classifiers = server._classifiers
     original_task = server._cleanup_task
+    original_footprints = server._footprints
 
     # Replace with fresh caches for test
     server._models = ModelCache(ttl=server.MODEL_UNLOAD_TIMEOUT)
     server._classifiers = ModelCache(ttl=server.MODEL_UNLOAD_TIMEOUT)
     server._cleanup_task = None
+    server._footprints = {}
 
     yield
 
@@ -47,6 +49,7 @@ def reset_server_globals():
     server._models = original_models
     server._classifiers = original_classifiers
     server._cleanup_task = original_task
+    server._footprints = original_footprints
 
 
 class TestModelCache:
@@ -111,6 +114,44 @@ class TestModelCache:
         assert expired[0][1] is model
         assert "test:key" not in cache
 
+    def test_expiry_follows_access_order(self):
+        """Test that re-accessed items move behind idle ones for expiry."""
+        cache = ModelCache(ttl=0.1)  # 100ms TTL
+        cache["old"] = MagicMock()
+        cache["touched"] = MagicMock()
+
+        time.sleep(0.2)
+        cache.get("touched")
+
+        assert cache.get_expired_keys() == ["old"]
+        assert list(cache._access) == ["old", "touched"]
+
+    def test_pop_lru_tracks_sizes(self):
+        """Test LRU eviction order and footprint accounting."""
+        cache = ModelCache(ttl=300)
+        cache["a"] = MagicMock()
+        cache["b"] = MagicMock()
+        cache.set_size("a", 100)
+        cache.set_size("b", 50)
+        cache.get("a")
+
+        assert cache.total_size == 150
+        key, _ = cache.pop_lru(exclude="a")
+        assert key == "b"
+        assert cache.total_size == 100
+        assert cache.pop_lru(exclude="a") is None
+
+    def test_pop_lru_skips_matching_items(self):
+        """Test that items matched by ``skip`` are passed over."""
+        cache = ModelCache(ttl=300)
+        cache["busy"] = "busy"
+        cache["idle"] = "idle"
+
+        key, _ = cache.pop_lru(skip=lambda value: value == "busy")
+        assert key == "idle"
+        assert cache.pop_lru(skip=lambda value: value == "busy") is None
+        assert "busy" in cache
+
     def test_recent_items_not_expired(self):
         """Test that recently accessed items are not expired."""
         cache = ModelCache(ttl=1)  # 1 second TTL
@@ -325,3 +366,310 @@ async def test_cleanup_handles_unload_errors(reset_server_globals):
     # Verify both unloads were attempted
     mock_model1.unload.assert_called_once()
     mock_model2.unload.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_loads_of_different_models_overlap(reset_server_globals):
+    """Test that loading one model does not block loading another."""
+    import server
+
+    started = []
+    release = asyncio.Event()
+
+    def make_model(model_id, device):
+        async def load():
+            started.append(model_id)
+            await release.wait()
+
+        model = MagicMock()
+        model.load = load
+        return model
+
+    with (
+        patch("server.get_device", return_value="cpu"),
+        patch("server.detect_model_format", return_value="transformers"),
+        patch("server.LanguageModel", side_effect=make_model),
+    ):
+        tasks = [
+            asyncio.create_task(server.load_language("test/model-a")),
+            asyncio.create_task(server.load_language("test/model-b")),
+        ]
+        await asyncio.sleep(0.05)
+
+        # Both loads are in progress at once
+        assert sorted(started) == ["test/model-a", "test/model-b"]
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+    assert len(server._models) == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_of_same_encoder_load_once(reset_server_globals):
+    """Test that concurrent cold requests for one encoder share a single load."""
+    import server
+
+    release = asyncio.Event()
+
+    async def slow_load():
+        await release.wait()
+
+    with (
+        patch("server.get_device", return_value="cpu"),
+        patch("server.detect_model_format", return_value="transformers"),
+        patch("server.EncoderModel") as MockEncoderModel,
+    ):
+        mock_instance = MagicMock()
+        mock_instance.load = AsyncMock(side_effect=slow_load)
+        MockEncoderModel.return_value = mock_instance
+
+        tasks = [
+            asyncio.create_task(server.load_encoder("test/embedding-model"))
+            for _ in range(20)
+        ]
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+    assert MockEncoderModel.call_count == 1
+    assert mock_instance.load.await_count == 1
+    assert all(result is mock_instance for result in results)
+
+
+@pytest.mark.asyncio
+async def test_memory_budget_evicts_least_recently_used(reset_server_globals):
+    """Test that loading past the memory budget unloads the oldest model."""
+    import server
+
+    mb = 1024 * 1024
+    usage = [0]
+
+    def make_model(model_id, device):
+        async def load():
+            usage[0] += 600 * mb
+
+        model = MagicMock()
+        model.load = load
+        model.unload = AsyncMock()
+        model.in_use = False
+        return model
+
+    with (
+        patch("server.get_device", return_value="cpu"),
+        patch("server.detect_model_format", return_value="transformers"),
+        patch("server.LanguageModel", side_effect=make_model),
+        patch("server._memory_in_use", side_effect=lambda: usage[0]),
+        patch("server.MODEL_MEMORY_BUDGET_MB", 1000),
+    ):
+        first = await server.load_language("test/model-a")
+        await server.load_language("test/model-b")
+
+    first.unload.assert_awaited_once()
+    assert len(server._models) == 1
+    assert server._models.total_size == 600 * mb
+
+
+@pytest.mark.asyncio
+async def test_memory_budget_evicts_before_reload(reset_server_globals):
+    """Test that reloading a measured model makes room before load() runs."""
+    import server
+
+    mb = 1024 * 1024
+    usage = [0]
+    models = {}
+
+    def make_model(model_id, device):
+        async def load():
+            # By the time a reload starts, the resident model must be gone
+            if model_id == "test/model-a" and "test/model-b" in models:
+                models["test/model-b"].unload.assert_awaited_once()
+            usage[0] += 600 * mb
+
+        model = MagicMock()
+        model.load = load
+        model.unload = AsyncMock()
+        model.in_use = False
+        models[model_id] = model
+        return model
+
+    with (
+        patch("server.get_device", return_value="cpu"),
+        patch("server.detect_model_format", return_value="transformers"),
+        patch("server.LanguageModel", side_effect=make_model),
+        patch("server._memory_in_use", side_effect=lambda: usage[0]),
+        patch("server.MODEL_MEMORY_BUDGET_MB", 1000),
+    ):
+        await server.load_language("test/model-a")
+        await server.load_language("test/model-b")
+        await server.load_language("test/model-a")
+
+    assert list(server._models.keys()) == [
+        server._make_language_cache_key("test/model-a")
+    ]
+    assert server._models.total_size == 600 * mb
+
+
+@pytest.mark.asyncio
+async def test_overlapping_loads_record_no_footprint(reset_server_globals):
+    """Test that a memory delta shared by concurrent loads is not recorded."""
+    import server
+
+    mb = 1024 * 1024
+    usage = [0]
+    release = asyncio.Event()
+
+    def make_model(model_id, device):
+        async def load():
+            usage[0] += 600 * mb
+            await release.wait()
+
+        model = MagicMock()
+        model.load = load
+        model.unload = AsyncMock()
+        model.in_use = False
+        return model
+
+    with (
+        patch("server.get_device", return_value="cpu"),
+        patch("server.detect_model_format", return_value="transformers"),
+        patch("server.LanguageModel", side_effect=make_model),
+        patch("server._memory_in_use", side_effect=lambda: usage[0]),
+        patch("server.MODEL_MEMORY_BUDGET_MB", 1000),
+    ):
+        tasks = [
+            asyncio.create_task(server.load_language("test/model-a")),
+            asyncio.create_task(server.load_language("test/model-b")),
+        ]
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.gather(*tasks)
+
+    assert len(server._models) == 2
+    assert server._footprints == {}
+    assert server._models.total_size == 0
+
+
+@pytest.mark.asyncio
+async def test_memory_budget_keeps_models_in_use(reset_server_globals):
+    """Test that a model with a request in flight is not evicted."""
+    import server
+
+    mb = 1024 * 1024
+    usage = [0]
+
+    def make_model(model_id, device):
+        async def load():
+            usage[0] += 600 * mb
+
+        model = MagicMock()
+        model.load = load
+        model.unload = AsyncMock()
+        model.in_use = True
+        return model
+
+    with (
+        patch("server.get_device", return_value="cpu"),
+        patch("server.detect_model_format", return_value="transformers"),
+        patch("server.LanguageModel", side_effect=make_model),
+        patch("server._memory_in_use", side_effect=lambda: usage[0]),
+        patch("server.MODEL_MEMORY_BUDGET_MB", 1000),
+    ):
+        first = await server.load_language("test/model-a")
+        await server.load_language("test/model-b")
+
+    first.unload.assert_not_awaited()
+    assert len(server._models) == 2
+
+
+@pytest.mark.asyncio
+async def test_memory_budget_floors_gguf_footprint(reset_server_globals, tmp_path):
+    """Test that a GGUF model counts at least its file, which RSS misses."""
+    import server
+
+    gguf_file = tmp_path / "model.gguf"
+    gguf_file.write_bytes(b"\0" * 4096)
+    model = MagicMock()
+    model.load = AsyncMock()
+    model.gguf_path = str(gguf_file)
+
+    with (
+        patch("server._memory_in_use", return_value=0),
+        patch("server.MODEL_MEMORY_BUDGET_MB", 1000),
+    ):
+        await server._load_and_cache("gguf:test", model)
+
+    assert server._footprints == {"gguf:test": 4096}
+    assert server._models.total_size == 4096
+
+
+@pytest.mark.asyncio
+async def test_no_memory_budget_skips_probes(reset_server_globals, mock_model):
+    """Test that without a budget loading never probes device memory."""
+    import server
+
+    mock_model.load = AsyncMock()
+    with (
+        patch("server._memory_in_use") as mock_memory_in_use,
+        patch("server.MODEL_MEMORY_BUDGET_MB", 0),
+    ):
+        await server._load_and_cache("test:key", mock_model)
+
+    mock_memory_in_use.assert_not_called()
+    assert server._models.get("test:key") is mock_model
+    assert server._footprints == {}
+    assert server._models.total_size == 0
+
+
+@pytest.mark.asyncio
+async def test_tracks_requests_counts_calls_and_streams():
+    """Test that in-flight calls and unfinished streams mark a model in use."""
+    from models.base import BaseModel, tracks_requests
+
+    release = asyncio.Event()
+
+    class FakeModel(BaseModel):
+        async def load(self):
+            pass
+
+        @tracks_requests
+        async def run(self):
+            await release.wait()
+            return "done"
+
+        @tracks_requests
+        async def stream(self):
+            yield "a"
+            yield "b"
+
+    model = FakeModel("test/model", "cpu")
+    task = asyncio.create_task(model.run())
+    await asyncio.sleep(0)
+    assert model.in_use
+    release.set()
+    assert await task == "done"
+    assert not model.in_use
+
+    stream = model.stream()
+    assert await anext(stream) == "a"
+    assert model.in_use
+    await stream.aclose()
+    assert not model.in_use
+
+
+@pytest.mark.asyncio
+async def test_shutdown_unloads_all_models(reset_server_globals, mock_model):
+    """Test that lifespan shutdown drains and unloads every cached model."""
+    import server
+
+    other = MagicMock()
+    other.unload = AsyncMock()
+
+    async with server.lifespan(server.app):
+        server._models["test:a"] = mock_model
+        server._classifiers["test:b"] = other
+
+    mock_model.unload.assert_awaited_once()
+    other.unload.assert_awaited_once()
+    assert len(server._models) == 0
+    assert len(server._classifiers) == 0
@@ -0,0 +1,554 @@
+"""Tests for OCR model support in Universal Runtime.
+
+Backends are replaced with mocks, so these tests do not require surya,
+easyocr, paddleocr or tesseract to be installed.
+"""
+
+import asyncio
+import base64
+import dataclasses
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType, SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from models import ocr_model
+from models.ocr_model import (
+    _BACKEND_CACHE,
+    OCRModel,
+    OCRResult,
+    _acquire_backend,
+    _MicroBatcher,
+    _quantize_linear_int8,
+    _release_backend,
+)
+
+
+def _image_b64(width: int = 32, height: int = 16) -> str:
+    """Encode a blank RGB PNG as base64."""
+    buf = io.BytesIO()
+    Image.new("RGB", (width, height), "white").save(buf, format="PNG")
+    return base64.b64encode(buf.getvalue()).decode()
+
+
+def _surya_result(text: str, confidence: float | None = 0.9):
+    """Build a fake Surya recognition result with a single text line."""
+    line = SimpleNamespace(
+        text=text,
+        confidence=confidence,
+        polygon=[[1, 2], [11, 2], [11, 8], [1, 8]],
+    )
+    return SimpleNamespace(text_lines=[line])
+
+
+class TestOCRModel:
+    """Tests for OCRModel class."""
+
+    def test_model_initialization(self):
+        """Test OCR model initialization."""
+        model = OCRModel("surya", "cpu")
+        assert model.backend == "surya"
+        assert model.languages == ["en"]
+        assert model.model_type == "ocr_surya"
+        assert model.supports_streaming is False
+
+    @pytest.mark.asyncio
+    async def test_recognize_empty(self):
+        """Test recognizing no images returns no results."""
+        model = OCRModel("surya", "cpu")
+        assert await model.recognize([]) == []
+
+    @pytest.mark.asyncio
+    async def test_surya_batches_images(self):
+        """Test Surya runs every image through a single predictor call."""
+        model = OCRModel("surya", "cpu")
+        model._surya_det_predictor = MagicMock()
+        model._surya_rec_predictor = MagicMock(
+            return_value=[_surya_result("first"), _surya_result("second", None)]
+        )
+
+        results = await model.recognize(
+            [_image_b64(), _image_b64(64, 64)], return_boxes=True
+        )
+
+        model._surya_rec_predictor.assert_called_once()
+        batch = model._surya_rec_predictor.call_args[0][0]
+        assert len(batch) == 2
+        assert [r.text for r in results] == ["first", "second"]
+        assert results[0].confidence == pytest.approx(0.9)
+        assert results[1].confidence is None
+        box = results[0].boxes[0]
+        assert (box.x1, box.y1, box.x2, box.y2) == (1, 2, 11, 8)
+
+    @pytest.mark.asyncio
+    async def test_easyocr_same_size_images_batched(self):
+        """Test same-sized images go through readtext_batched in one call."""
+        model = OCRModel("easyocr", "cpu", backend="easyocr", result_cache_size=0)
+        detection = ([[0, 0], [4, 0], [4, 2], [0, 2]], "hello", 0.8)
+        model._reader = MagicMock()
+        model._reader.readtext_batched.return_value = [[detection], [detection]]
+
+        results = await model.recognize([_image_b64(), _image_b64()])
+
+        model._reader.readtext_batched.assert_called_once()
+        model._reader.readtext.assert_not_called()
+        assert [r.text for r in results] == ["hello", "hello"]
+        assert results[0].confidence == pytest.approx(0.8)
+
+    @pytest.mark.asyncio
+    async def test_easyocr_mixed_sizes_per_image(self):
+        """Test differently sized images fall back to per-image readtext."""
+        model = OCRModel("easyocr", "cpu", backend="easyocr")
+        model._reader = MagicMock()
+        model._reader.readtext.return_value = []
+
+        results = await model.recognize([_image_b64(), _image_b64(64, 64)])
+
+        model._reader.readtext_batched.assert_not_called()
+        assert model._reader.readtext.call_count == 2
+        assert [r.text for r in results] == ["", ""]
+
+    @pytest.mark.asyncio
+    async def test_pipeline_chunks_keep_order(self):
+        """Test large requests are recognized in batch_size chunks, in order."""
+        model = OCRModel("surya", "cpu", batch_size=2)
+        model._surya_rec_predictor = MagicMock(
+            side_effect=lambda images, det_predictor=None: [
+                _surya_result(f"{img.width}") for img in images
+            ]
+        )
+
+        results = await model.recognize(
+            [_image_b64(width) for width in (10, 20, 30, 40, 50)]
+        )
+
+        assert model._surya_rec_predictor.call_count == 3
+        assert [r.text for r in results] == ["10", "20", "30", "40", "50"]
+
+    @pytest.mark.asyncio
+    async def test_micro_batcher_coalesces_concurrent_requests(self):
+        """Test concurrent single-image requests share one backend call."""
+        model = OCRModel("surya", "cuda")
+        model._batcher = _MicroBatcher(max_batch_size=32, max_wait_ms=20)
+        model._surya_rec_predictor = MagicMock(
+            side_effect=lambda images, det_predictor=None: [
+                _surya_result(f"{img.width}") for img in images
+            ]
+        )
+
+        first, second = await asyncio.gather(
+            model.recognize([_image_b64(10)]), model.recognize([_image_b64(20)])
+        )
+
+        model._surya_rec_predictor.assert_called_once()
+        assert [r.text for r in first] == ["10"]
+        assert [r.text for r in second] == ["20"]
+
+    @pytest.mark.asyncio
+    async def test_micro_batcher_propagates_errors(self):
+        """Test a failing batch raises in every request that was part of it."""
+        batcher = _MicroBatcher(max_batch_size=2, max_wait_ms=1000)
+
+        async def failing_batch(images):
+            raise RuntimeError("backend failed")
+
+        image = Image.new("RGB", (4, 4))
+        results = await asyncio.gather(
+            batcher.submit("key", [image], failing_batch),
+            batcher.submit("key", [image], failing_batch),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_surya_compile_models(self, monkeypatch):
+        """Test compile_models sets Surya's compile flag only for its own load."""
+        settings = SimpleNamespace(COMPILE_ALL=False)
+        seen = []
+
+        def foundation(device):
+            seen.append(settings.COMPILE_ALL)
+            return MagicMock()
+
+        modules = {
+            "surya": ModuleType("surya"),
+            "surya.detection": SimpleNamespace(DetectionPredictor=MagicMock()),
+            "surya.recognition": SimpleNamespace(
+                FoundationPredictor=foundation, RecognitionPredictor=MagicMock()
+            ),
+            "surya.settings": SimpleNamespace(settings=settings),
+        }
+        for name, module in modules.items():
+            monkeypatch.setitem(sys.modules, name, module)
+
+        model = OCRModel("surya", "cuda", compile_models=True)
+        await model._load_surya()
+        await model.unload()
+
+        assert seen == [True]
+        # The global flag is restored, so later loads are not compiled
+        assert settings.COMPILE_ALL is False
+
+        plain = OCRModel("surya", "cuda")
+        await plain._load_surya()
+        await plain.unload()
+
+        assert seen == [True, False]
+        assert settings.COMPILE_ALL is False
+
+    @pytest.mark.asyncio
+    async def test_tesseract_boxes_filter_low_confidence(self, monkeypatch):
+        """Test tesseract boxes skip empty text and non-positive confidence."""
+        data = {
+            "text": ["", "hello", "noise", "world"],
+            "conf": ["-1", "90", "0", 70.0],
+            "left": [0, 1, 5, 20],
+            "top": [0, 2, 5, 4],
+            "width": [0, 10, 3, 8],
+            "height": [0, 6, 3, 5],
+        }
+        fake = SimpleNamespace(
+            image_to_data=MagicMock(return_value=data),
+            Output=SimpleNamespace(DICT="dict"),
+        )
+        monkeypatch.setitem(sys.modules, "pytesseract", fake)
+
+        model = OCRModel("tesseract", "cpu", backend="tesseract")
+        result = await model._recognize_tesseract(
+            Image.new("RGB", (4, 4)), ["en"], return_boxes=True
+        )
+
+        assert result.text == "hello world"
+        assert result.confidence == pytest.approx(0.8)
+        assert fake.image_to_data.call_args.kwargs["lang"] == "eng"
+        assert [(b.x1, b.y1, b.x2, b.y2) for b in result.boxes] == [
+            (1, 2, 11, 8),
+            (20, 4, 28, 9),
+        ]
+
+    def test_decode_jpeg_uses_turbojpeg(self, monkeypatch):
+        """Test JPEG input is decoded by TurboJPEG when it is installed."""
+        decoder = MagicMock()
+        decoder.decode.return_value = np.zeros((3, 5, 3), dtype=np.uint8)
+        fake = SimpleNamespace(TurboJPEG=lambda: decoder, TJPF_RGB=0)
+        monkeypatch.setitem(sys.modules, "turbojpeg", fake)
+
+        buf = io.BytesIO()
+        Image.new("RGB", (5, 3)).save(buf, format="JPEG")
+        model = OCRModel("surya", "cpu")
+        image = model._decode_image(buf.getvalue())
+
+        decoder.decode.assert_called_once()
+        assert image.size == (5, 3)
+        # PNG input never touches the JPEG decoder
+        model._decode_image(_image_b64())
+        decoder.decode.assert_called_once()
+
+    def test_decode_jpeg_without_turbojpeg(self, monkeypatch):
+        """Test JPEG input falls back to PIL when TurboJPEG is missing."""
+        monkeypatch.setitem(sys.modules, "turbojpeg", None)
+
+        buf = io.BytesIO()
+        Image.new("RGB", (5, 3)).save(buf, format="JPEG")
+        model = OCRModel("surya", "cpu")
+
+        assert model._decode_image(buf.getvalue()).size == (5, 3)
+        assert model._tjpeg is False
+
+    def test_decode_jpeg_uses_nvimgcodec_on_cuda(self, monkeypatch):
+        """Test JPEG input is decoded on the GPU when nvImageCodec is installed."""
+        decoded = MagicMock()
+        decoded.cpu.return_value = np.zeros((3, 5, 3), dtype=np.uint8)
+        decoder = MagicMock()
+        decoder.decode.return_value = decoded
+        nvidia = SimpleNamespace(nvimgcodec=SimpleNamespace(Decoder=lambda: decoder))
+        monkeypatch.setitem(sys.modules, "nvidia", nvidia)
+        monkeypatch.setitem(sys.modules, "turbojpeg", None)
+
+        buf = io.BytesIO()
+        Image.new("RGB", (5, 3)).save(buf, format="JPEG")
+        model = OCRModel("surya", "cuda")
+
+        assert model._decode_image(buf.getvalue()).size == (5, 3)
+        decoder.decode.assert_called_once()
+
+    def test_tesseract_lang_string(self):
+        """Test language codes are converted and joined for Tesseract."""
+        model = OCRModel(
+            "tesseract", "cpu", backend="tesseract", languages=["en", "FR"]
+        )
+        assert model._default_tesseract_lang == "eng+fra"
+        assert model._tesseract_lang_string(("de", "chi_tra")) == "deu+chi_tra"
+
+    @pytest.mark.asyncio
+    async def test_result_cache_skips_repeated_images(self):
+        """Test repeated images are recognized once and served from the cache."""
+        model = OCRModel("surya", "cpu")
+        model._surya_rec_predictor = MagicMock(
+            side_effect=lambda images, det_predictor=None: [
+                _surya_result(f"{img.width}") for img in images
+            ]
+        )
+
+        first = await model.recognize([_image_b64(10), _image_b64(10)])
+        second = await model.recognize([_image_b64(20), _image_b64(10)])
+        await model.recognize([_image_b64(10)], return_boxes=True)
+
+        assert [r.text for r in first] == ["10", "10"]
+        assert [r.text for r in second] == ["20", "10"]
+        batches = [len(c.args[0]) for c in model._surya_rec_predictor.call_args_list]
+        # Different options (return_boxes) are cached separately
+        assert batches == [1, 1, 1]
+
+    @pytest.mark.asyncio
+    async def test_result_cache_disabled(self):
+        """Test result_cache_size=0 recognizes every image."""
+        model = OCRModel("surya", "cpu", result_cache_size=0)
+        model._surya_rec_predictor = MagicMock(
+            side_effect=lambda images, det_predictor=None: [
+                _surya_result("x") for _ in images
+            ]
+        )
+
+        await model.recognize([_image_b64(), _image_b64()])
+
+        assert len(model._surya_rec_predictor.call_args[0][0]) == 2
+
+    @pytest.mark.asyncio
+    async def test_backend_shared_between_models(self, monkeypatch):
+        """Test models with the same configuration share one backend instance."""
+        fake = SimpleNamespace(Reader=MagicMock(side_effect=lambda *a, **k: object()))
+        monkeypatch.setitem(sys.modules, "easyocr", fake)
+
+        first = OCRModel("easyocr", "cpu", backend="easyocr", languages=["en"])
+        second = OCRModel("easyocr", "cpu", backend="easyocr", languages=["en"])
+        other = OCRModel("easyocr", "cpu", backend="easyocr", languages=["fr"])
+        for model in (first, second, other):
+            await model.load()
+
+        assert fake.Reader.call_count == 2
+        assert first._reader is second._reader
+        assert other._reader is not first._reader
+
+        # The shared reader survives until its last user unloads
+        await first.unload()
+        third = OCRModel("easyocr", "cpu", backend="easyocr", languages=["en"])
+        await third.load()
+        assert fake.Reader.call_count == 2
+        assert third._reader is second._reader
+
+        for model in (second, other, third):
+            await model.unload()
+        assert _BACKEND_CACHE == {}
+
+    def test_backend_loads_of_different_keys_overlap(self):
+        """Test one backend loading does not block loading another."""
+        b_started = threading.Event()
+
+        def load_a():
+            # Only returns if b's factory runs while this one is still loading
+            assert b_started.wait(timeout=5)
+            return "a"
+
+        def load_b():
+            b_started.set()
+            return "b"
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            a = pool.submit(_acquire_backend, ("test", "a"), load_a)
+            b = pool.submit(_acquire_backend, ("test", "b"), load_b)
+            assert a.result(timeout=10) == "a"
+            assert b.result(timeout=10) == "b"
+
+        _release_backend(("test", "a"))
+        _release_backend(("test", "b"))
+        assert _BACKEND_CACHE == {}
+
+    def test_concurrent_acquires_of_same_key_load_once(self):
+        """Test threads acquiring a key that is loading wait for that load."""
+        release = threading.Event()
+        calls = []
+
+        def load():
+            calls.append(1)
+            assert release.wait(timeout=5)
+            return object()
+
+        def failing_load():
+            raise RuntimeError("boom")
+
+        key = ("test", "shared")
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            first = pool.submit(_acquire_backend, key, load)
+            second = pool.submit(_acquire_backend, key, load)
+            release.set()
+            assert first.result(timeout=10) is second.result(timeout=10)
+
+        assert len(calls) == 1
+        assert _BACKEND_CACHE[key][1] == 2
+        _release_backend(key)
+        _release_backend(key)
+        assert _BACKEND_CACHE == {}
+
+        # A failed load leaves nothing behind, so the next acquire retries
+        with pytest.raises(RuntimeError, match="boom"):
+            _acquire_backend(key, failing_load)
+        assert _acquire_backend(key, lambda: "ok") == "ok"
+        _release_backend(key)
+        assert _BACKEND_CACHE == {}
+
+    def test_decode_as_array(self):
+        """Test array decoding returns an HxWx3 uint8 RGB array."""
+        model = OCRModel("easyocr", "cpu", backend="easyocr")
+        pixels = model._decode_image(_image_b64(7, 5), as_array=True)
+
+        assert isinstance(pixels, np.ndarray)
+        assert pixels.shape == (5, 7, 3)
+        assert pixels.dtype == np.uint8
+
+    def test_decode_data_uri(self):
+        """Test base64 data URIs are decoded after stripping the header."""
+        model = OCRModel("surya", "cpu")
+        image = model._decode_image("data:image/png;base64," + _image_b64(6, 4))
+        assert image.size == (6, 4)
+
+    @pytest.mark.asyncio
+    async def test_easyocr_mixed_sizes_batched_on_gpu(self):
+        """Test mixed sizes batch at one 32-aligned shape on GPU, boxes rescaled."""
+        model = OCRModel("easyocr", "cuda", backend="easyocr")
+        detection = ([[0, 0], [32, 0], [32, 16], [0, 16]], "hi", 0.5)
+        model._reader = MagicMock()
+        model._reader.readtext_batched.return_value = [[detection], [detection]]
+
+        results = await model.recognize(
+            [_image_b64(64, 64), _image_b64(128, 64)], return_boxes=True
+        )
+
+        kwargs = model._reader.readtext_batched.call_args.kwargs
+        assert (kwargs["n_width"], kwargs["n_height"]) == (96, 64)
+        box = results[1].boxes[0]
+        assert (box.x1, box.y1, box.x2, box.y2) == pytest.approx(
+            (0, 0, 32 * 128 / 96, 16)
+        )
+
+    def test_results_are_immutable(self):
+        """Test results are frozen, so cached results can be shared safely."""
+        result = OCRResult(text="cached", confidence=0.5)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.text = "changed"
+        assert not hasattr(result, "__dict__")
+
+    @pytest.mark.asyncio
+    async def test_tesseract_images_run_concurrently(self, monkeypatch):
+        """Test multi-image tesseract requests recognize images concurrently."""
+        # Two workers regardless of the machine's CPU count
+        executor = ThreadPoolExecutor(max_workers=2)
+        monkeypatch.setattr(ocr_model, "_ocr_executor", executor)
+
+        model = OCRModel("tesseract", "cpu", backend="tesseract")
+        barrier = threading.Barrier(2, timeout=5)
+
+        def image_to_string(image, lang):
+            # Both images must be in flight at once to get past the barrier
+            barrier.wait()
+            return f"{image.width}"
+
+        fake = SimpleNamespace(image_to_string=image_to_string)
+        monkeypatch.setitem(sys.modules, "pytesseract", fake)
+
+        results = await model.recognize([_image_b64(10), _image_b64(20)])
+        executor.shutdown()
+
+        assert [r.text for r in results] == ["10", "20"]
+
+    @pytest.mark.asyncio
+    async def test_surya_precision(self, monkeypatch):
+        """Test precision selects Surya's weight dtype, with a pre-Ampere fallback."""
+        import torch
+
+        det = MagicMock()
+        foundation = MagicMock()
+        modules = {
+            "surya": ModuleType("surya"),
+            "surya.detection": SimpleNamespace(DetectionPredictor=det),
+            "surya.recognition": SimpleNamespace(
+                FoundationPredictor=foundation, RecognitionPredictor=MagicMock()
+            ),
+            "surya.settings": SimpleNamespace(settings=SimpleNamespace()),
+        }
+        for name, module in modules.items():
+            monkeypatch.setitem(sys.modules, name, module)
+        monkeypatch.setattr(torch.cuda, "get_device_capability", lambda: (7, 5))
+
+        model = OCRModel("surya", "cuda", precision="bf16")
+        await model._load_surya()
+        await model.unload()
+
+        assert det.call_args.kwargs["dtype"] is torch.float16
+        assert foundation.call_args.kwargs["dtype"] is torch.float16
+
+        # "auto" and CPU leave the dtype to Surya
+        assert OCRModel("surya", "cuda")._surya_dtype() is None
+        assert OCRModel("surya", "cpu", precision="fp16")._surya_dtype() is None
+
+    def test_quantize_linear_int8(self):
+        """Test int8 quantization replaces linear layers with dynamic int8 ones."""
+        import torch
+
+        predictor = SimpleNamespace(model=torch.nn.Sequential(torch.nn.Linear(8, 4)))
+        _quantize_linear_int8(predictor)
+
+        layer = predictor.model[0]
+        assert type(layer) is not torch.nn.Linear
+        assert predictor.model(torch.ones(1, 8)).shape == (1, 4)
+
+    def test_parse_surya_result_mixed_lines(self):
+        """Test unknown confidences are averaged out and bad polygons skipped."""
+        lines = [
+            SimpleNamespace(text="a", confidence=0.5, polygon=[[0, 0], [2, 3]]),
+            SimpleNamespace(text="b", confidence=None, polygon=[[1, 1], [4, 5]]),
+            SimpleNamespace(text="c", confidence=1.0, polygon=[1, 2, 3, 4]),
+            SimpleNamespace(text="d", confidence=None, polygon=None),
+        ]
+        model = OCRModel("surya", "cpu")
+        result = model._parse_surya_result(
+            SimpleNamespace(text_lines=lines), return_boxes=True
+        )
+
+        assert result.text == "a\nb\nc\nd"
+        assert result.confidence == pytest.approx(0.75)
+        assert [b.text for b in result.boxes] == ["a", "b"]
+        assert result.boxes[1].confidence is None
+
+    @pytest.mark.asyncio
+    async def test_paddleocr_tensorrt_fp16(self, monkeypatch):
+        """Test fp16 precision on CUDA loads PaddleOCR with TensorRT FP16."""
+        fake = SimpleNamespace(PaddleOCR=MagicMock())
+        monkeypatch.setitem(sys.modules, "paddleocr", fake)
+
+        model = OCRModel("paddleocr", "cuda", backend="paddleocr", precision="fp16")
+        await model._load_paddleocr()
+        await model.unload()
+
+        kwargs = fake.PaddleOCR.call_args.kwargs
+        assert kwargs["use_tensorrt"] is True
+        assert kwargs["precision"] == "fp16"
+
+    @pytest.mark.asyncio
+    async def test_failed_load_holds_no_backend(self, monkeypatch):
+        """Test a missing backend raises ImportError without taking a reference."""
+        monkeypatch.setitem(sys.modules, "easyocr", None)
+
+        model = OCRModel("easyocr", "cpu", backend="easyocr")
+        with pytest.raises(ImportError, match="EasyOCR not installed"):
+            await model.load()
+
+        assert model._backend_key is None
+        assert _BACKEND_CACHE == {}
@@ -6,10 +6,22 @@ Tests the high-performance data buffer for streaming ML:
 - Performance benchmarks
 """
 
+import math
 import time
 
+import numpy as np
 import polars as pl
 import pytest
+from polars.testing import assert_series_equal
+
+from utils.polars_buffer import PolarsBuffer
+from utils.rolling_features import (
+    IncrementalRollingState,
+    RollingFeatureConfig,
+    compute_anomaly_features,
+    compute_features,
+    get_feature_names,
+)
 
 
 class TestPolarsBufferBasic:
@@ -17,8 +29,6 @@ class TestPolarsBufferBasic:
 
     def test_create_empty_buffer(self):
         """Test creating an empty buffer."""
-        from utils.polars_buffer import PolarsBuffer
-
         buffer = PolarsBuffer(window_size=100)
         assert buffer.size == 0
         assert buffer.window_size == 100
@@ -26,8 +36,6 @@ class TestPolarsBufferBasic:
 
     def test_append_single_record(self):
         """Test appending a single record."""
-        from utils.polars_buffer import PolarsBuffer
-
         buffer = PolarsBuffer(window_size=100)
         buffer.append({"value": 1.0, "category": "A"})
 
@@ -37,8 +45,6 @@ class TestPolarsBufferBasic:
 
     def test_append_multiple_records(self):
         """Test appending multiple records one by one."""
-        from utils.polars_buffer import PolarsBuffer
-
         buffer = PolarsBuffer(window_size=100)
         for i in range(10):
             buffer.append({"value": float(i), "id": i})
@@ -47,8 +53,6 @@ class TestPolarsBufferBasic:
 
     def test_append_batch(self):
         """Test batch append."""
-        from utils.polars_buffer import PolarsBuffer
-
         buffer = PolarsBuffer(window_size=100)
         records = [{"value": float(i), "id": i} for i in range(50)]
         buffer.append_batch(records)
@@ -57,8 +61,6 @@ class TestPolarsBufferBasic:
 
     def test_creates_dataframe_from_dict(self):
         """Test that buffer creates DataFrame from dict data correctly."""
-        from utils.polars_buffer import PolarsBuffer
-
         buffer = PolarsBuffer(window_size=100)
         buffer.append({"time_ms": 100, "value": 1.5, "category": "A"})
         buffer.append({"time_ms": 200, "value": 2.5, "category": "B"})
@@ -76,8 +78,6 @@ class TestPolarsBufferWindow:
 
     def test_window_truncation(self):
         """Test that buffer truncates to window size."""
-        from utils.polars_buffer import PolarsBuffer
-
         buffer = PolarsBuffer(window_size=10)
 
         # Add more than window size
@@ -87,98 +87,113 @@ class TestPolarsBufferWindow:
         assert buffer.size == 10
         # Should have last 10 values (10-19)
         df = buffer.get_data()
-        assert df["value"].to_list() == list(range(10, 20))
+        assert_series_equal(df["value"], pl.Series("value", range(10, 20), pl.Float64))
 
     def test_window_truncation_keeps_last_n(self):
         """Test that truncation keeps the most recent N records."""
-        from utils.polars_buffer import PolarsBuffer
-
         buffer = PolarsBuffer(window_size=5)
         buffer.append_batch([{"id": i} for i in range(100)])
 
         assert buffer.size == 5
         df = buffer.get_data()
         # Should have ids 95-99
-        assert df["id"].to_list() == [95, 96, 97, 98, 99]
+        assert_series_equal(df["id"], pl.Series("id", range(95, 100), pl.Int64))
+
+    def test_staged_appends_materialize_as_one_chunk(self):
+        """Test that single-record appends read back as one contiguous window."""
+        buffer = PolarsBuffer(window_size=50)
+        for i in range(120):
+            buffer.append({"value": float(i), "label": f"r{i}"})
+            if i == 60:
+                assert buffer.get_data()["value"][-1] == 60.0
+
+        df = buffer.get_data()
+        assert df.n_chunks() == 1
+        assert_series_equal(df["value"], pl.Series("value", range(70, 120), pl.Float64))
+
+    def test_counters_do_not_materialize(self):
+        """Test size and avg_append_ms are read without building the window."""
+        buffer = PolarsBuffer(window_size=10)
+        for i in range(15):
+            buffer.append({"value": float(i)})
+
+        assert buffer.size == 10
+        assert buffer.avg_append_ms >= 0.0
+        assert buffer._pending
+
+        assert buffer.get_stats().avg_append_ms == buffer.avg_append_ms
+        assert not buffer._pending
+
+    def test_mixed_records_match_row_construction(self):
+        """Test columnar ingestion agrees with row-wise DataFrame construction."""
+        batches = [
+            [{"a": 1, "b": "x"}, {"b": "y", "a": 2.5}, {"a": None, "b": None}],
+            [{"a": 1}, {"a": 2, "c": True}, {"c": False}],
+            [{"a": 1}, {"a": 2}],
+        ]
+        for records in batches:
+            buffer = PolarsBuffer(window_size=10)
+            buffer.append_batch(records)
+
+            expected = pl.DataFrame(records, infer_schema_length=None)
+            assert buffer.get_data().equals(expected)
 
     def test_batch_append_truncation(self):
         """Test window truncation with batch append."""
-        from utils.polars_buffer import PolarsBuffer
-
         buffer = PolarsBuffer(window_size=5)
         buffer.append_batch([{"value": i} for i in range(10)])
 
         assert buffer.size == 5
 
 
-class TestPolarsBufferFeatures:
-    """Test rolling feature computation."""
+@pytest.fixture(scope="class")
+def counting_buffer():
+    """Buffer holding values 1-10, shared by tests that only read features."""
+    buffer = PolarsBuffer(window_size=100)
+    buffer.append_batch([{"value": float(i)} for i in range(1, 11)])
+    return buffer
 
-    def test_rolling_mean(self):
-        """Test rolling mean computation."""
-        from utils.polars_buffer import PolarsBuffer
 
-        buffer = PolarsBuffer(window_size=100)
-        # Add values 1-10
-        buffer.append_batch([{"value": float(i)} for i in range(1, 11)])
+@pytest.fixture(scope="class")
+def rolling_3_last(counting_buffer):
+    """Last row of counting_buffer's window-3 features, computed once per class."""
+    return counting_buffer.get_features(rolling_windows=[3]).row(-1, named=True)
 
-        df = buffer.get_features(rolling_windows=[3])
 
-        assert "value_rolling_mean_3" in df.columns
+class TestPolarsBufferFeatures:
+    """Test rolling feature computation."""
+
+    def test_rolling_mean(self, rolling_3_last):
+        """Test rolling mean computation."""
         # Rolling mean of window 3 for last value (8,9,10) = 9.0
-        assert df["value_rolling_mean_3"][-1] == 9.0
+        assert rolling_3_last["value_rolling_mean_3"] == 9.0
 
-    def test_rolling_std(self):
+    def test_rolling_std(self, rolling_3_last):
         """Test rolling std computation."""
-        from utils.polars_buffer import PolarsBuffer
-
-        buffer = PolarsBuffer(window_size=100)
-        buffer.append_batch([{"value": float(i)} for i in range(1, 11)])
-
-        df = buffer.get_features(rolling_windows=[3])
-
-        assert "value_rolling_std_3" in df.columns
         # Std should be ~1.0 for consecutive integers
-        assert abs(df["value_rolling_std_3"][-1] - 1.0) < 0.01
+        assert rolling_3_last["value_rolling_std_3"] == pytest.approx(1.0, abs=0.01)
 
-    def test_rolling_min_max(self):
+    def test_rolling_min_max(self, rolling_3_last):
         """Test rolling min/max computation."""
-        from utils.polars_buffer import PolarsBuffer
-
-        buffer = PolarsBuffer(window_size=100)
-        buffer.append_batch([{"value": float(i)} for i in range(1, 11)])
-
-        df = buffer.get_features(rolling_windows=[3])
-
-        assert "value_rolling_min_3" in df.columns
-        assert "value_rolling_max_3" in df.columns
         # For last 3 values (8, 9, 10): min=8, max=10
-        assert df["value_rolling_min_3"][-1] == 8.0
-        assert df["value_rolling_max_3"][-1] == 10.0
+        assert rolling_3_last["value_rolling_min_3"] == 8.0
+        assert rolling_3_last["value_rolling_max_3"] == 10.0
 
-    def test_lag_features(self):
+    def test_lag_features(self, counting_buffer):
         """Test lag feature computation."""
-        from utils.polars_buffer import PolarsBuffer
-
-        buffer = PolarsBuffer(window_size=100)
-        buffer.append_batch([{"value": float(i)} for i in range(1, 11)])
-
-        df = buffer.get_features(
+        df = counting_buffer.get_features(
             rolling_windows=[],
             include_lags=True,
             lag_periods=[1, 2],
         )
+        last = df.row(-1, named=True)
 
-        assert "value_lag_1" in df.columns
-        assert "value_lag_2" in df.columns
         # Last value is 10, lag_1 should be 9, lag_2 should be 8
-        assert df["value_lag_1"][-1] == 9.0
-        assert df["value_lag_2"][-1] == 8.0
+        assert last["value_lag_1"] == 9.0
+        assert last["value_lag_2"] == 8.0
 
     def test_multiple_rolling_windows(self):
         """Test multiple rolling window sizes."""
-        from utils.polars_buffer import PolarsBuffer
-
         buffer = PolarsBuffer(window_size=100)
         buffer.append_batch([{"value": float(i)} for i in range(50)])
 
@@ -190,8 +205,6 @@ class TestPolarsBufferFeatures:
 
     def test_numeric_columns_only(self):
         """Test that features are only computed for numeric columns."""
-        from utils.polars_buffer import PolarsBuffer
-
         buffer = PolarsBuffer(window_size=100)
         buffer.append_batch([
             {"value": float(i), "category": f"cat_{i}"}
@@ -204,25 +217,67 @@ class TestPolarsBufferFeatures:
         assert "value_rolling_mean_3" in df.columns
         assert "category_rolling_mean_3" not in df.columns
 
+    def test_numpy_features_match_polars(self):
+        """Test the NumPy fast path agrees with the lazy Polars query."""
+        buffer = PolarsBuffer(window_size=100, schema={"a": pl.Float32, "b": pl.Float64, "tag": pl.String})
+        buffer.append_batch([
+            {"a": math.sin(i), "b": float(i % 5), "tag": "x"} for i in range(40)
+        ])
+
+        for windows, lags in [([5, 10, 20], [1, 2, 3]), ([3, 50], [1, 45])]:
+            assert buffer._numpy_features(buffer.get_data(), windows, True, lags, 0.0) is not None
+            eager = buffer.get_features(rolling_windows=windows, lag_periods=lags)
+            lazy = buffer.get_features_lazy(rolling_windows=windows, lag_periods=lags).collect()
+
+            assert eager.schema == lazy.schema
+            for col in eager.columns:
+                if eager[col].dtype.is_float():
+                    diff = (eager[col] - lazy[col]).abs().max()
+                    assert diff < 1e-5, col
+                else:
+                    assert eager[col].equals(lazy[col])
+
+    def test_fill_base_nulls(self):
+        """Test base column nulls are filled only when requested."""
+        buffer = PolarsBuffer(window_size=100)
+        buffer.append_batch([{"value": 1.0}, {"value": None}, {"value": 3.0}])
+
+        df = buffer.get_features(rolling_windows=[2], include_lags=False)
+        assert df["value"].null_count() == 1
+
+        df = buffer.get_features(rolling_windows=[2], include_lags=False, fill_base_nulls=True)
+        assert df["value"].to_list() == [1.0, 0.0, 3.0]
+        # Rolling features still see the original null
+        assert df["value_rolling_mean_2"].to_list() == [0.0, 0.0, 0.0]
+
+    def test_lazy_features_tail_matches_eager(self):
+        """Test a lazily sliced feature query matches slicing the eager result."""
+        buffer = PolarsBuffer(window_size=100)
+        buffer.append_batch([{"value": float(i), "label": "x"} for i in range(50)])
+
+        eager = buffer.get_features(rolling_windows=[5, 10]).tail(3)
+        lazy = buffer.get_features_lazy(rolling_windows=[5, 10]).tail(3).collect()
+
+        assert lazy.equals(eager)
+        assert PolarsBuffer().get_features_lazy().collect().is_empty()
+
 
 class TestPolarsBufferMethods:
     """Test additional buffer methods."""
 
     def test_get_latest(self):
         """Test getting latest N records."""
-        from utils.polars_buffer import PolarsBuffer
-
         buffer = PolarsBuffer(window_size=100)
         buffer.append_batch([{"value": float(i)} for i in range(50)])
 
         latest = buffer.get_latest(n=5)
         assert len(latest) == 5
-        assert latest["value"].to_list() == [45.0, 46.0, 47.0, 48.0, 49.0]
+        assert_series_equal(
+            latest["value"], pl.Series("value", range(45, 50), pl.Float64)
+        )
 
     def test_get_latest_with_features(self):
         """Test getting latest records with features."""
-        from utils.polars_buffer import PolarsBuffer
-
         buffer = PolarsBuffer(window_size=100)
         buffer.append_batch([{"value": float(i)} for i in range(50)])
 
@@ -232,8 +287,6 @@ class TestPolarsBufferMethods:
 
     def test_get_numpy(self):
         """Test getting numpy array of numeric data."""
-        from utils.polars_buffer import PolarsBuffer
-
         buffer = PolarsBuffer(window_size=100)
         buffer.append_batch([{"x": float(i), "y": float(i * 2)} for i in range(10)])
 
@@ -242,8 +295,6 @@ class TestPolarsBufferMethods:
 
     def test_clear(self):
         """Test clearing the buffer."""
-        from utils.polars_buffer import PolarsBuffer
-
         buffer = PolarsBuffer(window_size=100)
         buffer.append_batch([{"value": float(i)} for i in range(50)])
         assert buffer.size == 50
@@ -254,8 +305,6 @@ class TestPolarsBufferMethods:
 
     def test_to_list(self):
         """Test converting to list of dicts."""
-        from utils.polars_buffer import PolarsBuffer
-
         buffer = PolarsBuffer(window_size=100)
         buffer.append_batch([{"value": float(i)} for i in range(5)])
 
@@ -266,8 +315,6 @@ class TestPolarsBufferMethods:
 
     def test_get_stats(self):
         """Test getting buffer statistics."""
-        from utils.polars_buffer import PolarsBuffer
-
         buffer = PolarsBuffer(window_size=100)
         buffer.append_batch([{"value": float(i), "category": f"c{i}"} for i in range(50)])
 
@@ -281,14 +328,26 @@ class TestPolarsBufferMethods:
         assert stats.memory_bytes > 0
         assert stats.append_count == 50
 
+    def test_get_stats_cached_until_change(self):
+        """Test stats are reused between polls and rebuilt after appends."""
+        buffer = PolarsBuffer(window_size=100)
+        buffer.append({"value": 1.0})
+
+        stats = buffer.get_stats()
+        assert buffer.get_stats() is stats
+
+        buffer.append({"value": 2.0})
+        assert buffer.get_stats().size == 2
+
+        buffer.clear()
+        assert buffer.get_stats().size == 0
+
 
 class TestRollingFeatures:
     """Test the rolling_features module."""
 
     def test_compute_features_default(self):
         """Test compute_features with default config."""
-        from utils.rolling_features import compute_features
-
         df = pl.DataFrame({"value": list(range(50))})
         result = compute_features(df)
 
@@ -298,8 +357,6 @@ class TestRollingFeatures:
 
     def test_compute_features_custom_config(self):
         """Test compute_features with custom config."""
-        from utils.rolling_features import RollingFeatureConfig, compute_features
-
         config = RollingFeatureConfig(
             rolling_windows=[3, 7],
             include_stats=["mean", "max"],
@@ -319,8 +376,6 @@ class TestRollingFeatures:
 
     def test_compute_anomaly_features(self):
         """Test compute_anomaly_features function."""
-        from utils.rolling_features import compute_anomaly_features
-
         df = pl.DataFrame({"value": list(range(100))})
         result = compute_anomaly_features(df, windows=[10, 20])
 
@@ -330,8 +385,6 @@ class TestRollingFeatures:
 
     def test_get_feature_names(self):
         """Test get_feature_names function."""
-        from utils.rolling_features import RollingFeatureConfig, get_feature_names
-
         config = RollingFeatureConfig(
             rolling_windows=[5],
             include_stats=["mean", "std"],
@@ -345,80 +398,158 @@ class TestRollingFeatures:
         assert "value_rolling_std_5" in names
         assert "value_lag_1" in names
 
+    def test_incremental_state_matches_get_features(self):
+        """IncrementalRollingState reproduces the last row of get_features."""
+        kwargs = {"rolling_windows": [1, 3, 8], "include_lags": True, "lag_periods": [1, 4]}
+        buffer = PolarsBuffer(window_size=6)
+        state = IncrementalRollingState(**kwargs, max_rows=6)
+        rng = np.random.default_rng(0)
+
+        for i in range(40):
+            record = {"a": float(rng.normal()), "b": int(rng.integers(0, 10))}
+            if i % 7 == 3:
+                record["a"] = None
+            if i >= 10:
+                record["c"] = float(rng.normal())
+            buffer.append(record)
+            state.push(record)
+
+            df = buffer.get_features(**kwargs)
+            columns = [c for c in df.columns if df[c].dtype.is_numeric()]
+            expected = df.tail(1).with_columns([pl.col(c).fill_null(0.0) for c in columns])
+            np.testing.assert_allclose(
+                state.vector(columns), expected.select(columns).to_numpy(), atol=1e-9
+            )
+
+        assert state.vector(["missing"]) is None
+
+
+@pytest.fixture(scope="module")
+def records_1k():
+    """1000 two-column records, built once so timed loops measure only appends."""
+    return [{"value": float(i), "x": float(i * 2)} for i in range(1000)]
+
+
+@pytest.fixture(scope="module")
+def records_5k_abc():
+    """5000 three-column records for feature computation timing."""
+    return [
+        {"a": float(i), "b": float(i * 2), "c": float(i * 3)} for i in range(5000)
+    ]
+
+
+@pytest.fixture(scope="module")
+def warm_polars():
+    """Pay Polars' one-time setup (allocator, kernel dispatch) before timing."""
+    pl.DataFrame({"x": [1.0, 2.0]}).with_columns(pl.col("x").rolling_mean(2))
+    buffer = PolarsBuffer(window_size=10)
+    buffer.append_batch([{"value": float(i), "x": float(i * 2)} for i in range(10)])
+    buffer.get_features(rolling_windows=[2])
+    buffer.get_stats()
+
+
+def _best_of(run, rounds: int = 5) -> float:
+    """Fastest of several timed calls, in seconds.
+
+    A single timing is mostly scheduler and allocator noise on shared CI
+    runners; the minimum over a few rounds is the stable measurement.
+    """
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
 
 @pytest.mark.slow
+@pytest.mark.usefixtures("warm_polars")
 class TestPolarsBufferPerformance:
     """Test performance characteristics.
 
     These tests have timing thresholds and may be flaky in CI.
+    Each timed block runs several rounds and is judged on the fastest.
     Run with: pytest -m slow
     Skip with: pytest -m "not slow"
     """
 
-    def test_append_performance(self):
+    def test_append_performance(self, records_1k):
         """Test that append is fast (<1ms average)."""
-        from utils.polars_buffer import PolarsBuffer
-
-        buffer = PolarsBuffer(window_size=1000)
-
-        # Warm up
-        for i in range(10):
-            buffer.append({"value": float(i), "x": float(i * 2)})
+        buffers = []
 
-        buffer.clear()
+        def append_all():
+            buffer = PolarsBuffer(window_size=1000)
+            for record in records_1k:
+                buffer.append(record)
+            buffers.append(buffer)
 
         # Time 1000 appends
-        start = time.perf_counter()
-        for i in range(1000):
-            buffer.append({"value": float(i), "x": float(i * 2)})
-        elapsed_ms = (time.perf_counter() - start) * 1000
-
-        avg_ms = elapsed_ms / 1000
-        stats = buffer.get_stats()
+        avg_ms = _best_of(append_all) * 1000 / len(records_1k)
+        stats = buffers[-1].get_stats()
 
         # Assert average is under 1ms per append
         # Note: This is a soft test - CI environments may be slower
         assert avg_ms < 5.0, f"Average append time {avg_ms:.3f}ms exceeds 5ms"
         assert stats.avg_append_ms < 5.0
+        assert stats.size == len(records_1k)
 
-    def test_batch_append_faster_than_individual(self):
+    def test_batch_append_faster_than_individual(self, records_1k):
         """Test that batch append is faster than individual appends."""
-        from utils.polars_buffer import PolarsBuffer
-
-        # Individual appends
-        buffer1 = PolarsBuffer(window_size=2000)
-        start1 = time.perf_counter()
-        for i in range(1000):
-            buffer1.append({"value": float(i)})
-        time_individual = time.perf_counter() - start1
-
-        # Batch append
-        buffer2 = PolarsBuffer(window_size=2000)
-        records = [{"value": float(i)} for i in range(1000)]
-        start2 = time.perf_counter()
-        buffer2.append_batch(records)
-        time_batch = time.perf_counter() - start2
+
+        def append_individually():
+            buffer = PolarsBuffer(window_size=2000)
+            for record in records_1k:
+                buffer.append(record)
+
+        def append_as_batch():
+            PolarsBuffer(window_size=2000).append_batch(records_1k)
+
+        time_individual = _best_of(append_individually)
+        time_batch = _best_of(append_as_batch)
 
         # Batch should be faster (at least 2x typically)
         assert time_batch < time_individual, "Batch append should be faster than individual"
 
-    def test_feature_computation_reasonable(self):
+    def test_feature_computation_reasonable(self, records_5k_abc):
         """Test that feature computation completes in reasonable time."""
-        from utils.polars_buffer import PolarsBuffer
-
         buffer = PolarsBuffer(window_size=10000)
-        buffer.append_batch([
-            {"a": float(i), "b": float(i * 2), "c": float(i * 3)}
-            for i in range(5000)
-        ])
+        buffer.append_batch(records_5k_abc)
 
-        start = time.perf_counter()
-        df = buffer.get_features(rolling_windows=[5, 10, 20, 50, 100])
-        elapsed_ms = (time.perf_counter() - start) * 1000
+        results = []
+
+        def compute():
+            results.append(buffer.get_features(rolling_windows=[5, 10, 20, 50, 100]))
+
+        elapsed_ms = _best_of(compute, rounds=3) * 1000
 
         # Should complete in under 500ms for 5000 records with 5 windows
         assert elapsed_ms < 500, f"Feature computation took {elapsed_ms:.1f}ms"
-        assert len(df) == 5000
+        assert len(results[-1]) == 5000
+
+    def test_lazy_projection_skips_unused_features(self, records_5k_abc):
+        """Test that selecting from the lazy query only computes what is kept."""
+        buffer = PolarsBuffer(window_size=10000)
+        buffer.append_batch(records_5k_abc)
+        windows = [5, 10, 20, 50, 100]
+
+        def collect_all():
+            buffer.get_features_lazy(rolling_windows=windows).collect()
+
+        def collect_one():
+            buffer.get_features_lazy(rolling_windows=windows).select(
+                "a_rolling_mean_100"
+            ).collect()
+
+        time_all = _best_of(collect_all, rounds=3)
+        time_one = _best_of(collect_one, rounds=3)
+
+        df = (
+            buffer.get_features_lazy(rolling_windows=windows)
+            .select("a_rolling_mean_100")
+            .collect()
+        )
+        assert df.shape == (5000, 1)
+        assert time_one < time_all, "Projection should prune unused feature columns"
 
 
 class TestFeatureEncoderIntegration:
@@ -426,8 +557,6 @@ class TestFeatureEncoderIntegration:
 
     def test_polars_buffer_with_numeric_features(self):
         """Test that PolarsBuffer works with numeric feature vectors."""
-        from utils.polars_buffer import PolarsBuffer
-
         # Simulate encoded features (numeric vectors)
         # This mimics what FeatureEncoder.fit_transform produces
         encoded_features = [
@@ -436,14 +565,19 @@ class TestFeatureEncoderIntegration:
             [150.0, 7.0, 0.0, 0.0, 1.0],
         ]
 
-        # Add to buffer as named features
+        # Add to buffer as named features, straight from the array
         buffer = PolarsBuffer(window_size=100)
-        for row in encoded_features:
-            buffer.append({f"f{i}": v for i, v in enumerate(row)})
+        buffer.append_numpy(np.asarray(encoded_features))
 
         assert buffer.size == 3
         assert len(buffer.numeric_columns) == 5
 
+        # Same frame as appending one f0..f4 dict per row
+        dict_buffer = PolarsBuffer(window_size=100)
+        for row in encoded_features:
+            dict_buffer.append({f"f{i}": v for i, v in enumerate(row)})
+        assert buffer.get_data().equals(dict_buffer.get_data())
+
         # Should be able to get numpy array for ML
         arr = buffer.get_numpy()
         assert arr.shape == (3, 5)
@@ -451,3 +585,18 @@ class TestFeatureEncoderIntegration:
         # Should be able to compute rolling features
         df = buffer.get_features(rolling_windows=[2])
         assert "f0_rolling_mean_2" in df.columns
+
+    def test_append_numpy_keeps_order_and_window(self):
+        """Test array rows land after staged records and respect the window."""
+        buffer = PolarsBuffer(window_size=5, schema={"x": pl.Float32, "y": pl.Float32})
+        buffer.append({"x": 0.0, "y": 0.0})
+        buffer.append_numpy(np.arange(1, 9, dtype=np.float64).reshape(4, 2), ["x", "y"])
+        buffer.append_numpy(np.array([9.0, 10.0]), ["x", "y"])
+
+        df = buffer.get_data()
+        assert df.schema == {"x": pl.Float32, "y": pl.Float32}
+        assert_series_equal(df["x"], pl.Series("x", [1, 3, 5, 7, 9], pl.Float32))
+        assert buffer.get_stats().append_count == 6
+
+        with pytest.raises(ValueError):
+            buffer.append_numpy(np.zeros((2, 3)), ["x", "y"])
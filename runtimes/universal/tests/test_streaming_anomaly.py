@@ -185,6 +185,106 @@ class TestStreamingAnomalyScoring:
         for r in more_result.results:
             assert r.score is not None
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("backend", ["ecod", "hbos"])
+    @pytest.mark.parametrize("rolling_windows", [None, [3, 5]])
+    async def test_batch_matches_point_by_point(self, backend, rolling_windows):
+        """Test a batch crossing cold start scores like single-point calls."""
+        from models.streaming_anomaly import StreamingAnomalyDetector
+
+        def make(model_id):
+            return StreamingAnomalyDetector(
+                model_id=model_id,
+                backend=backend,
+                min_samples=10,
+                retrain_interval=1000,
+                window_size=20,
+                rolling_windows=rolling_windows,
+            )
+
+        data = [{"value": float(i % 7), "other": float(i % 3)} for i in range(45)]
+
+        single = make("single")
+        expected = [
+            await single.process(point, index=i) for i, point in enumerate(data)
+        ]
+
+        batched = make("batched")
+        batch_result = await batched.process_batch(data)
+
+        assert len(batch_result.results) == len(expected)
+        for got, want in zip(batch_result.results, expected, strict=True):
+            assert got.index == want.index
+            assert got.samples_collected == want.samples_collected
+            if want.score is None:
+                assert got.score is None
+            else:
+                assert got.score == pytest.approx(want.score)
+                assert got.is_anomaly == want.is_anomaly
+
+
+    @pytest.mark.asyncio
+    async def test_numeric_vectors_score_like_dicts(self):
+        """Test list/array input takes the ring fast path with the same scores."""
+        import numpy as np
+
+        from models.streaming_anomaly import StreamingAnomalyDetector
+
+        points = [[float(i % 5), float(i % 3)] for i in range(30)]
+        results = {}
+        for kind in ("dict", "list", "array"):
+            detector = StreamingAnomalyDetector(model_id=kind, min_samples=10)
+            results[kind] = []
+            for point in points:
+                if kind == "dict":
+                    point = {"a": point[0], "b": point[1]}
+                elif kind == "array":
+                    point = np.array(point)
+                results[kind].append((await detector.process(point)).score)
+
+        assert results["list"] == results["dict"]
+        assert results["array"] == results["dict"]
+
+        # Non-numeric entries still go through the dict path and are dropped
+        assert detector._numeric_matrix([[1.0, "x", 2.0]]) is None
+        result = await detector.process([1.0, "x", 2.0])
+        assert result.score is not None
+
+    @pytest.mark.asyncio
+    async def test_dict_points_read_by_cached_keys(self):
+        """Test dict points are read in the first point's key order."""
+        from models.streaming_anomaly import StreamingAnomalyDetector
+
+        detector = StreamingAnomalyDetector(model_id="keys-test", min_samples=10)
+        for i in range(12):
+            await detector.process({"a": float(i % 4), "b": float(i % 3)})
+
+        assert detector._feature_keys == ("a", "b")
+        ordered = await detector.process({"a": 9.0, "b": 1.0})
+        reordered = await detector.process({"b": 1.0, "a": 9.0})
+        assert reordered.raw_score == pytest.approx(ordered.raw_score)
+
+        with pytest.raises(ValueError):
+            await detector.process({"a": 1.0, "b": 2.0, "c": 3.0})
+
+    def test_normalize_scores_vectorized(self):
+        """Test score normalization works on whole arrays without overflow."""
+        import numpy as np
+
+        from models.streaming_anomaly import StreamingAnomalyDetector
+
+        detector = StreamingAnomalyDetector(model_id="normalize-test")
+        detector._score_mean = 1.0
+        detector._score_std = 2.0
+
+        raw = np.array([1.0, 3.0, -1e6])
+        with np.errstate(over="raise"):
+            scores = detector._normalize_scores(raw)
+        assert scores == pytest.approx([0.5, 1 / (1 + np.exp(-1.0)), 0.0])
+
+        detector.normalization = "zscore"
+        assert detector._normalize_scores(raw[:2]) == pytest.approx([0.0, 1.0])
+
 
 class TestStreamingAnomalyRetraining:
     """Test auto-rolling retraining."""
@@ -220,6 +320,98 @@ class TestStreamingAnomalyRetraining:
         # Should have triggered retrain
         assert detector.model_version > initial_version
 
+    @pytest.mark.asyncio
+    async def test_fit_subsamples_large_windows(self):
+        """Test training uses at most max_fit_samples rows."""
+        from models.streaming_anomaly import StreamingAnomalyDetector
+
+        detector = StreamingAnomalyDetector(
+            model_id="subsample-test",
+            backend="ecod",
+            min_samples=50,
+            window_size=100,
+            max_fit_samples=30,
+        )
+        await detector.process_batch([[float(i)] for i in range(50)])
+
+        assert detector.is_ready
+        assert len(detector._detector.X_train) == 30
+
+    @pytest.mark.asyncio
+    async def test_refit_on_same_data_reuses_model(self):
+        """Test retraining on an unchanged window reuses the fitted detector."""
+        from models.streaming_anomaly import StreamingAnomalyDetector
+
+        detector = StreamingAnomalyDetector(
+            model_id="fit-cache-test", min_samples=10, window_size=10
+        )
+        for i in range(10):
+            await detector.process({"value": float(i % 4)})
+        first = detector._detector
+
+        await detector._fit_detector()
+        assert detector._detector is first
+
+        await detector.process({"value": 100.0})
+        await detector._fit_detector()
+        assert detector._detector is not first
+
+    @pytest.mark.asyncio
+    async def test_fit_runs_off_event_loop(self, monkeypatch):
+        """Test that fitting runs in the training pool, not on the loop thread."""
+        import threading
+
+        import models.streaming_anomaly as streaming_anomaly
+        from models.streaming_anomaly import StreamingAnomalyDetector
+
+        fit_threads = []
+        fit = streaming_anomaly._fit_new_detector
+
+        def recording_fit(*args):
+            fit_threads.append(threading.current_thread())
+            return fit(*args)
+
+        monkeypatch.setattr(streaming_anomaly, "_fit_new_detector", recording_fit)
+
+        detector = StreamingAnomalyDetector(model_id="executor-test", min_samples=10)
+        for i in range(10):
+            await detector.process({"value": float(i)})
+
+        assert detector.is_ready
+        assert fit_threads
+        assert threading.current_thread() not in fit_threads
+
+    @pytest.mark.asyncio
+    async def test_retrain_requests_coalesce(self, monkeypatch):
+        """Test ticks past the interval share one background retrain."""
+        from models.streaming_anomaly import StreamingAnomalyDetector
+
+        detector = StreamingAnomalyDetector(
+            model_id="coalesce-test",
+            min_samples=10,
+            retrain_interval=5,
+        )
+        for i in range(10):
+            await detector.process({"value": float(i)})
+
+        retrains = 0
+        retrain = detector._retrain_model
+
+        async def counting_retrain():
+            nonlocal retrains
+            retrains += 1
+            await retrain()
+
+        monkeypatch.setattr(detector, "_retrain_model", counting_retrain)
+
+        # The worker can't start until we yield, so all of these coalesce
+        for i in range(20):
+            await detector.process({"value": float(i)})
+        await detector._retrain_task
+
+        assert retrains == 1
+        assert detector.model_version == 2
+
     @pytest.mark.asyncio
     async def test_continues_scoring_during_retrain(self):
         """Test that scoring continues during background retraining."""
@@ -263,6 +455,70 @@ class TestStreamingAnomalySlidingWindow:
         # Window should be at most window_size
         assert detector.samples_collected <= 50
 
+    @pytest.mark.asyncio
+    async def test_ring_window_is_oldest_first(self):
+        """Test the raw ring buffer yields the last window_size rows in order."""
+        import numpy as np
+
+        from models.streaming_anomaly import StreamingAnomalyDetector
+
+        detector = StreamingAnomalyDetector(
+            model_id="ring-test",
+            min_samples=5,
+            retrain_interval=1000,
+            window_size=8,
+        )
+
+        await detector.process_batch([[float(i), float(-i)] for i in range(5)])
+        assert np.shares_memory(detector._window_matrix(), detector._ring)
+
+        await detector.process_batch([[float(i), float(-i)] for i in range(5, 19)])
+        window = detector._window_matrix()
+        assert detector.samples_collected == 8
+        assert window[:, 0].tolist() == [float(i) for i in range(11, 19)]
+        assert window[:, 1].tolist() == [float(-i) for i in range(11, 19)]
+
+    @pytest.mark.asyncio
+    async def test_retaining_backend_trains_on_copy(self):
+        """Test ECOD scores don't change when the ring is overwritten."""
+        from models.streaming_anomaly import StreamingAnomalyDetector
+
+        detector = StreamingAnomalyDetector(
+            model_id="ring-copy-test",
+            backend="ecod",
+            min_samples=10,
+            retrain_interval=1000,
+            window_size=20,
+        )
+        for i in range(10):
+            await detector.process({"value": float(i % 4)})
+
+        before = await detector.process({"value": 2.0})
+        detector._ring[:] = 100.0
+        after = await detector.process({"value": 2.0})
+
+        assert after.raw_score == pytest.approx(before.raw_score)
+
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("rolling_windows", [None, [3]])
+    async def test_detector_trains_on_float32(self, rolling_windows):
+        """Test training data reaches the detector as float32."""
+        import numpy as np
+
+        from models.streaming_anomaly import StreamingAnomalyDetector
+
+        detector = StreamingAnomalyDetector(
+            model_id="float32-test",
+            backend="ecod",
+            min_samples=10,
+            rolling_windows=rolling_windows,
+        )
+        for i in range(12):
+            await detector.process({"value": float(i)})
+
+        assert detector._detector.X_train.dtype == np.float32
+
 
 class TestStreamingAnomalyRollingFeatures:
     """Test optional rolling feature computation."""
@@ -407,6 +663,41 @@ class TestStreamingAnomalyReset:
         assert detector.samples_collected == 0
         assert not detector.is_ready
 
+    @pytest.mark.asyncio
+    async def test_reset_during_retrain(self):
+        """Test a reset mid-retrain leaves the detector in a usable cold start."""
+        from models.streaming_anomaly import DetectorStatus, StreamingAnomalyDetector
+
+        detector = StreamingAnomalyDetector(
+            model_id="reset-retrain-test",
+            min_samples=10,
+            retrain_interval=5,
+        )
+        for i in range(30):
+            await detector.process({"value": float(i)})
+
+        # Let the worker start its fit, then reset under it
+        retrain_task = detector._retrain_task
+        assert retrain_task is not None
+        await asyncio.sleep(0)
+        assert detector._retraining
+
+        detector.reset()
+        with pytest.raises(asyncio.CancelledError):
+            await retrain_task
+
+        assert detector.status == DetectorStatus.COLLECTING
+        assert not detector._retraining
+
+        # Cold start again: collect, then train and score normally
+        result = await detector.process({"value": 1.0})
+        assert result.status == DetectorStatus.COLLECTING
+        assert result.score is None
+        for i in range(20):
+            result = await detector.process({"value": float(i)})
+        assert detector.is_ready
+        assert result.score is not None
+
 
 class TestStreamingAnomalyStats:
     """Test detector statistics."""
@@ -12,6 +12,7 @@ from .feature_encoder import (
 from .file_utils import save_image_with_metadata
 from .polars_buffer import BufferStats, PolarsBuffer
 from .rolling_features import (
+    IncrementalRollingState,
     RollingFeatureConfig,
     compute_anomaly_features,
     compute_features,
@@ -34,4 +35,5 @@ __all__ = [
     "compute_features",
     "compute_anomaly_features",
     "get_feature_names",
+    "IncrementalRollingState",
 ]
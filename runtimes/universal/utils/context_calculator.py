@@ -22,6 +22,11 @@ logger = logging.getLogger(__name__)
 # Cache for config file
 _config_cache: dict | None = None
 
+# Context sizes are aligned to this many tokens (llama.cpp's default ubatch).
+# The KV cache is padded internally, so an unaligned n_ctx such as 3117 only
+# allocates rows that can never be used.
+CONTEXT_ALIGNMENT = 512
+
 
 def get_gguf_metadata(gguf_path: str) -> dict:
     """Read GGUF file metadata without loading the full model.
@@ -253,6 +258,7 @@ def get_default_context_size(
     gguf_path: str,
     device: str,
     config_n_ctx: int | None = None,
+    available_memory: int | None = None,
 ) -> tuple[int, list[str]]:
     """Determine context size with four-tier priority system.
 
@@ -270,6 +276,8 @@ def get_default_context_size(
         gguf_path: Path to GGUF file
         device: Target device ("cuda", "mps", "cpu")
         config_n_ctx: Optional explicit context size from config
+        available_memory: Optional device memory in bytes, if already probed
+            (e.g. concurrently with the model download). Probed here if None.
 
     Returns:
         tuple of (final_n_ctx, warnings_list)
@@ -295,7 +303,8 @@ def get_default_context_size(
 
         # Get model metadata and compute memory constraints
         metadata = get_gguf_metadata(gguf_path)
-        available_memory = get_available_memory(device)
+        if available_memory is None:
+            available_memory = get_available_memory(device)
         max_context_from_memory = compute_max_context(
             metadata["file_size_bytes"], available_memory, memory_factor
         )
@@ -370,6 +379,18 @@ def get_default_context_size(
                 )
                 warnings.append(warning_msg)
 
+        # Align to the KV cache granularity by rounding up. If that would exceed
+        # the memory limit or the model's training context, keep the size as is:
+        # rounding down would give less than the model or the user asked for.
+        limit = min(max_context_from_memory, n_ctx_train or max_context_from_memory)
+        aligned_n_ctx = -(-final_n_ctx // CONTEXT_ALIGNMENT) * CONTEXT_ALIGNMENT
+        if aligned_n_ctx != final_n_ctx and aligned_n_ctx <= limit:
+            logger.info(
+                f"Aligned context size {final_n_ctx} -> {aligned_n_ctx} "
+                f"(multiple of {CONTEXT_ALIGNMENT})"
+            )
+            final_n_ctx = aligned_n_ctx
+
         # Final sanity check - ensure we have at least 512 tokens
         if final_n_ctx < 512:
             warning_msg = (
@@ -0,0 +1,44 @@
+"""Per-key asyncio locks.
+
+Loading two unrelated models (or creating two unrelated buffers) should not
+serialize on a single global lock. KeyedLock hands out one asyncio.Lock per
+key so the double-checked load pattern only contends on the same key:
+
+    _load_locks = KeyedLock()
+
+    if cache_key not in cache:
+        async with _load_locks(cache_key):
+            if cache_key not in cache:
+                cache[cache_key] = await load(...)
+
+Locks are held in a WeakValueDictionary, so a key's lock disappears once no
+coroutine is holding or waiting on it and the registry does not grow with
+every key ever seen.
+"""
+
+import asyncio
+import weakref
+
+
+class KeyedLock:
+    """Registry of asyncio locks, one per key."""
+
+    def __init__(self) -> None:
+        self._locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+
+    def __call__(self, key: str) -> asyncio.Lock:
+        """Get the lock for a key, creating it if needed.
+
+        Runs synchronously on the event loop, so lookup and insertion cannot
+        interleave with another coroutine.
+        """
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            self._locks[key] = lock
+        return lock
+
+    def __len__(self) -> int:
+        return len(self._locks)
@@ -4,10 +4,12 @@ Provides a cache that:
 - Automatically tracks last access time
 - Refreshes TTL on access (not just on write)
 - Supports async cleanup callbacks before expiration
+- Tracks per-item memory footprints for budget-based eviction
 """
 
 import time
-from collections.abc import Iterator
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
 from typing import Generic, TypeVar
 
 from cachetools import TTLCache
@@ -54,9 +56,12 @@ class ModelCache(Generic[T]):
         # Internal TTLCache with very long TTL - we manage expiry ourselves
         # to support async callbacks before removal
         self._cache: TTLCache[str, T] = TTLCache(maxsize=maxsize, ttl=ttl * 10)
-        # Track access times ourselves for TTL-on-read behavior
+        # Track access times ourselves for TTL-on-read behavior. Kept in
+        # least-recently-used order so expiry scans stop at the first fresh key.
         self._timer = time.monotonic
-        self._access: dict[str, float] = {}
+        self._access: OrderedDict[str, float] = OrderedDict()
+        # Memory footprint per key (bytes), recorded by the loader
+        self._sizes: dict[str, int] = {}
 
     @property
     def ttl(self) -> float:
@@ -84,25 +89,31 @@ class ModelCache(Generic[T]):
         """
         if key not in self._cache:
             return default
-        self._access[key] = self._timer()
+        self._touch(key)
         return self._cache[key]
 
     def __getitem__(self, key: str) -> T:
         """Get item and refresh TTL. Raises KeyError if not found."""
         if key not in self._cache:
             raise KeyError(key)
-        self._access[key] = self._timer()
+        self._touch(key)
         return self._cache[key]
 
     def __setitem__(self, key: str, value: T) -> None:
         """Set item with fresh TTL."""
         self._cache[key] = value
+        self._touch(key)
+
+    def _touch(self, key: str) -> None:
+        """Record an access and move the key to the most-recent end."""
         self._access[key] = self._timer()
+        self._access.move_to_end(key)
 
     def __delitem__(self, key: str) -> None:
         """Remove item from cache."""
         del self._cache[key]
         self._access.pop(key, None)
+        self._sizes.pop(key, None)
 
     def pop(self, key: str, *args) -> T:
         """Remove and return item.
@@ -115,6 +126,7 @@ class ModelCache(Generic[T]):
             The removed item, or default if provided and key not found
         """
         self._access.pop(key, None)
+        self._sizes.pop(key, None)
         return self._cache.pop(key, *args)
 
     def keys(self):
@@ -133,6 +145,7 @@ class ModelCache(Generic[T]):
         """Clear all items from cache."""
         self._cache.clear()
         self._access.clear()
+        self._sizes.clear()
 
     def get_idle_time(self, key: str) -> float | None:
         """Get seconds since last access for a key.
@@ -165,9 +178,14 @@ class ModelCache(Generic[T]):
         Returns:
             List of expired cache keys
         """
-        now = self._timer()
-        cutoff = now - self._ttl
-        return [k for k, t in self._access.items() if t < cutoff]
+        cutoff = self._timer() - self._ttl
+        expired = []
+        # Access order is oldest first, so stop at the first fresh key
+        for k, t in self._access.items():
+            if t >= cutoff:
+                break
+            expired.append(k)
+        return expired
 
     def pop_expired(self) -> list[tuple[str, T]]:
         """Remove and return all expired items.
@@ -181,8 +199,45 @@ class ModelCache(Generic[T]):
         expired_keys = self.get_expired_keys()
         result = []
         for key in expired_keys:
+            self._access.pop(key, None)
+            self._sizes.pop(key, None)
             if key in self._cache:
-                value = self._cache.pop(key)
-                self._access.pop(key, None)
-                result.append((key, value))
+                result.append((key, self._cache.pop(key)))
         return result
+
+    def set_size(self, key: str, nbytes: int) -> None:
+        """Record the memory footprint of a cached item.
+
+        Args:
+            key: Cache key (must already be cached)
+            nbytes: Footprint in bytes
+        """
+        if key in self._cache:
+            self._sizes[key] = nbytes
+
+    @property
+    def total_size(self) -> int:
+        """Sum of recorded footprints, in bytes."""
+        return sum(self._sizes.values())
+
+    def pop_lru(
+        self,
+        exclude: str | None = None,
+        skip: Callable[[T], bool] | None = None,
+    ) -> tuple[str, T] | None:
+        """Remove and return the least recently used item.
+
+        Args:
+            exclude: Key that must not be evicted (e.g. the item just loaded)
+            skip: Predicate for items that must not be evicted (e.g. in use)
+
+        Returns:
+            (key, value) of the evicted item, or None if nothing is evictable
+        """
+        for key in self._access:
+            if key == exclude or key not in self._cache:
+                continue
+            if skip is not None and skip(self._cache[key]):
+                continue
+            return key, self.pop(key)
+        return None
@@ -111,14 +111,20 @@ def detect_model_format(model_id: str, token: str | None = None) -> str:
         >>> detect_model_format("google/gemma-3-1b-it")
         "transformers"
     """
+    # Exact ID seen before: skip parsing and logging, this runs on every load_* call
+    cached = _format_cache.get(model_id)
+    if cached is not None:
+        return cached
+
     # Parse model ID to remove quantization suffix if present
     base_model_id, _ = parse_model_with_quantization(model_id)
 
-    # Check memory cache first (fastest)
+    # Check memory cache for the base model (e.g. another quantization of it)
     if base_model_id in _format_cache:
         logger.debug(
             f"Using cached format for {base_model_id}: {_format_cache[base_model_id]}"
         )
+        _format_cache[model_id] = _format_cache[base_model_id]
         return _format_cache[base_model_id]
 
     logger.info(f"Detecting format for model: {base_model_id}")
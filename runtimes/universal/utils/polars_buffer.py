@@ -11,8 +11,9 @@ Polars solves this by being a columnar data store written in Rust with:
 
 Key Features:
 1. SLIDING WINDOW MECHANICS
-   - Ingest: Convert incoming dict to 1-row DataFrame
-   - Stack: Use pl.concat to append to history
+   - Ingest: Stage incoming dicts in a list (O(1), no DataFrame per record)
+   - Stack: On the next read, build one DataFrame from the staged records
+     and pl.concat it onto history as a single contiguous chunk
    - Truncate: tail(window_size) keeps memory bounded
 
 2. LAZY ROLLING FEATURES
@@ -46,16 +47,80 @@ Data Flow Example:
 """
 
 import logging
+import operator
 import threading
 import time
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
 import polars as pl
 
 logger = logging.getLogger(__name__)
 
 
+def _to_columns(records: list[dict[str, Any]]) -> dict[str, tuple | list] | None:
+    """Transpose same-keyed records into one sequence per column.
+
+    Building a DataFrame from columns is roughly twice as fast as letting
+    Polars walk the row dicts. Returns None when the records do not all share
+    the first record's keys, so the caller can fall back to row-wise
+    construction (which fills missing keys with nulls).
+    """
+    keys = tuple(records[0])
+    if any(len(record) != len(keys) for record in records):
+        return None
+    try:
+        if len(keys) == 1:
+            (key,) = keys
+            return {key: [record[key] for record in records]}
+        rows = map(operator.itemgetter(*keys), records)
+        return dict(zip(keys, zip(*rows, strict=True), strict=True))
+    except KeyError:
+        return None
+
+
+# Small float-only windows compute rolling stats with NumPy shifted-slice
+# loops (O(rows * window), no engine dispatch), ~3x faster than the Polars
+# rolling kernels at these sizes. Larger inputs go through Polars.
+_NUMPY_MAX_ROWS = 10_000
+_NUMPY_MAX_WINDOW = 64
+_FLOAT_DTYPES = (pl.Float32, pl.Float64)
+
+
+def _rolling_stats(
+    values: np.ndarray, window: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Rolling mean, std (ddof=1), min and max over every full window.
+
+    Args:
+        values: 1-D float64 array with no NaNs, at least ``window`` long
+        window: Window size (>= 2)
+
+    Returns:
+        Four arrays of length ``len(values) - window + 1``; element i covers
+        ``values[i:i + window]``
+    """
+    m = len(values) - window + 1
+    total = values[:m].copy()
+    low = values[:m].copy()
+    high = values[:m].copy()
+    for i in range(1, window):
+        shifted = values[i : i + m]
+        total += shifted
+        np.minimum(low, shifted, out=low)
+        np.maximum(high, shifted, out=high)
+    mean = total / window
+
+    # Two-pass variance for precision, matching Polars to ~1e-16
+    sq = np.zeros(m)
+    for i in range(window):
+        diff = values[i : i + m] - mean
+        sq += diff * diff
+    std = np.sqrt(sq / (window - 1))
+    return mean, std, low, high
+
+
 @dataclass
 class BufferStats:
     """Statistics about the buffer state."""
@@ -100,40 +165,93 @@ class PolarsBuffer:
 
         # Initialize empty DataFrame
         self._df: pl.DataFrame | None = None
+        # Records appended since the last read, materialized by _frame().
+        # Building one DataFrame per record and concatenating it left the
+        # buffer as thousands of 1-row chunks, slowing appends and every
+        # rolling computation over them.
+        self._pending: list[dict[str, Any]] = []
 
         # Performance tracking
         self._append_count = 0
         self._total_append_time_ms = 0.0
 
+        # get_stats() result, rebuilt only after the buffer changes
+        self._cached_stats: BufferStats | None = None
+
     @property
     def size(self) -> int:
         """Current number of records in buffer."""
         with self._lock:
-            return 0 if self._df is None else len(self._df)
+            stored = 0 if self._df is None else len(self._df)
+            return min(stored + len(self._pending), self._window_size)
 
     @property
     def window_size(self) -> int:
         """Maximum buffer size."""
         return self._window_size
 
+    @property
+    def avg_append_ms(self) -> float:
+        """Average time per appended record, without materializing the window."""
+        with self._lock:
+            if self._append_count == 0:
+                return 0.0
+            return self._total_append_time_ms / self._append_count
+
     @property
     def columns(self) -> list[str]:
         """List of column names."""
         with self._lock:
-            return [] if self._df is None else self._df.columns
+            df = self._frame()
+            return [] if df is None else df.columns
 
     @property
     def numeric_columns(self) -> list[str]:
         """List of numeric column names."""
         with self._lock:
-            if self._df is None:
+            df = self._frame()
+            if df is None:
                 return []
             return [
                 col
-                for col, dtype in self._df.schema.items()
+                for col, dtype in df.schema.items()
                 if dtype.is_numeric()
             ]
 
+    def _frame(self) -> pl.DataFrame | None:
+        """Materialize staged records into the window. Caller must hold the lock.
+
+        Returns:
+            The current window DataFrame, or None if nothing was appended
+        """
+        if self._pending:
+            # Take the staged records first so a batch that fails to convert
+            # raises once instead of on every later read
+            records, self._pending = self._pending, []
+            columns = None if self._schema is not None else _to_columns(records)
+            if columns is not None:
+                new_rows = pl.DataFrame(columns, strict=False)
+            else:
+                new_rows = pl.DataFrame(
+                    records, schema=self._schema, infer_schema_length=None
+                )
+
+            self._push(new_rows)
+        return self._df
+
+    def _push(self, new_rows: pl.DataFrame) -> None:
+        """Concatenate rows onto the window and truncate. Caller must hold the lock."""
+        if self._df is None:
+            self._df = new_rows
+        else:
+            self._df = pl.concat([self._df, new_rows], how="diagonal_relaxed")
+
+        # Truncate if over window size, then keep a single chunk so
+        # rolling kernels run over contiguous memory
+        if len(self._df) > self._window_size:
+            self._df = self._df.tail(self._window_size)
+        self._df = self._df.rechunk()
+
     def append(self, record: dict[str, Any]) -> None:
         """Append a single record to the buffer.
 
@@ -143,21 +261,17 @@ class PolarsBuffer:
         start_time = time.perf_counter()
 
         with self._lock:
-            new_row = pl.DataFrame([record], schema=self._schema)
+            self._pending.append(record)
 
-            if self._df is None:
-                self._df = new_row
-            else:
-                self._df = pl.concat([self._df, new_row], how="diagonal_relaxed")
-
-            # Truncate if over window size
-            if len(self._df) > self._window_size:
-                self._df = self._df.tail(self._window_size)
+            # Bound staged records when nothing reads the buffer
+            if len(self._pending) >= self._window_size:
+                self._frame()
 
             # Update counters inside lock for thread safety
             elapsed_ms = (time.perf_counter() - start_time) * 1000
             self._append_count += 1
             self._total_append_time_ms += elapsed_ms
+            self._cached_stats = None
 
     def append_batch(self, records: list[dict[str, Any]]) -> None:
         """Append multiple records at once (more efficient than individual appends).
@@ -171,21 +285,62 @@ class PolarsBuffer:
         start_time = time.perf_counter()
 
         with self._lock:
-            new_rows = pl.DataFrame(records, schema=self._schema)
+            self._pending.extend(records)
 
-            if self._df is None:
-                self._df = new_rows
-            else:
-                self._df = pl.concat([self._df, new_rows], how="diagonal_relaxed")
-
-            # Truncate if over window size
-            if len(self._df) > self._window_size:
-                self._df = self._df.tail(self._window_size)
+            # Bound staged records when nothing reads the buffer
+            if len(self._pending) >= self._window_size:
+                self._frame()
 
             # Update counters inside lock for thread safety
             elapsed_ms = (time.perf_counter() - start_time) * 1000
             self._append_count += len(records)
             self._total_append_time_ms += elapsed_ms
+            self._cached_stats = None
+
+    def append_numpy(self, arr: np.ndarray, columns: list[str] | None = None) -> None:
+        """Append rows of a numeric array without building a dict per row.
+
+        Args:
+            arr: 2-D array of shape (rows, features), or a single 1-D row
+            columns: Column names, defaulting to f0, f1, ... (the names the
+                streaming detector gives unnamed feature vectors)
+
+        Raises:
+            ValueError: If arr is not 1-D or 2-D, or columns does not match its width
+        """
+        arr = np.asarray(arr)
+        if arr.ndim == 1:
+            arr = arr.reshape(1, -1)
+        if arr.ndim != 2:
+            raise ValueError(f"Expected a 1-D or 2-D array, got {arr.ndim} dimensions")
+        if columns is None:
+            columns = [f"f{i}" for i in range(arr.shape[1])]
+        elif len(columns) != arr.shape[1]:
+            raise ValueError(
+                f"Got {len(columns)} column names for {arr.shape[1]} array columns"
+            )
+        if len(arr) == 0:
+            return
+
+        start_time = time.perf_counter()
+
+        # Only the rows that can survive truncation need converting
+        new_rows = pl.from_numpy(arr[-self._window_size :], schema=columns, orient="row")
+        if self._schema is not None:
+            new_rows = new_rows.cast(
+                {col: dtype for col, dtype in self._schema.items() if col in columns}
+            )
+
+        with self._lock:
+            # Materialize staged records first so rows keep their append order
+            self._frame()
+            self._push(new_rows)
+
+            # Update counters inside lock for thread safety
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            self._append_count += len(arr)
+            self._total_append_time_ms += elapsed_ms
+            self._cached_stats = None
 
     def get_data(self) -> pl.DataFrame:
         """Get the raw buffer data as a DataFrame.
@@ -194,9 +349,10 @@ class PolarsBuffer:
             Copy of the internal DataFrame
         """
         with self._lock:
-            if self._df is None:
+            df = self._frame()
+            if df is None:
                 return pl.DataFrame()
-            return self._df.clone()
+            return df.clone()
 
     def get_numpy(self) -> Any:
         """Get the numeric data as a numpy array.
@@ -205,21 +361,22 @@ class PolarsBuffer:
             Numpy array of numeric columns only
         """
         with self._lock:
-            if self._df is None:
+            df = self._frame()
+            if df is None:
                 import numpy as np
                 return np.array([])
 
             # Get numeric columns directly (avoid calling self.numeric_columns which locks again)
             numeric_cols = [
                 col
-                for col, dtype in self._df.schema.items()
+                for col, dtype in df.schema.items()
                 if dtype.is_numeric()
             ]
             if not numeric_cols:
                 import numpy as np
                 return np.array([])
 
-            return self._df.select(numeric_cols).to_numpy()
+            return df.select(numeric_cols).to_numpy()
 
     def get_features(
         self,
@@ -227,6 +384,7 @@ class PolarsBuffer:
         include_lags: bool = True,
         lag_periods: list[int] | None = None,
         fill_null_value: float = 0.0,
+        fill_base_nulls: bool = False,
     ) -> pl.DataFrame:
         """Compute rolling features for the buffer data using lazy evaluation.
 
@@ -240,6 +398,8 @@ class PolarsBuffer:
             include_lags: Whether to include lag features
             lag_periods: Lag periods to compute (default: [1, 2, 3])
             fill_null_value: Value to use for nulls during cold start (default: 0.0)
+            fill_base_nulls: Also fill nulls in the original numeric columns, in
+                the same lazy pass (rolling features still see the raw nulls)
 
         Returns:
             DataFrame with original columns plus computed features
@@ -250,46 +410,150 @@ class PolarsBuffer:
             lag_periods = [1, 2, 3]
 
         with self._lock:
-            if self._df is None or len(self._df) == 0:
-                return pl.DataFrame()
+            df = self._frame()
 
-            # Use lazy API for optimal performance (SIMD + parallel execution)
-            lazy_df = self._df.lazy()
+        if df is not None:
+            features = self._numpy_features(
+                df, rolling_windows, include_lags, lag_periods, fill_null_value
+            )
+            if features is not None:
+                return features
+
+        # Collect triggers parallel execution
+        return self.get_features_lazy(
+            rolling_windows=rolling_windows,
+            include_lags=include_lags,
+            lag_periods=lag_periods,
+            fill_null_value=fill_null_value,
+            fill_base_nulls=fill_base_nulls,
+        ).collect()
+
+    @staticmethod
+    def _numpy_features(
+        df: pl.DataFrame,
+        rolling_windows: list[int],
+        include_lags: bool,
+        lag_periods: list[int],
+        fill_null_value: float,
+    ) -> pl.DataFrame | None:
+        """Compute get_features() output with NumPy for small float-only frames.
+
+        Returns:
+            The feature DataFrame, or None when the frame is not eligible
+            (non-float numeric columns, nulls or NaNs, large frames or windows)
+            and the Polars path should be used instead
+        """
+        numeric = [(col, dtype) for col, dtype in df.schema.items() if dtype.is_numeric()]
+        if (
+            not numeric
+            or len(df) > _NUMPY_MAX_ROWS
+            or not rolling_windows
+            or min(rolling_windows) < 2
+            or max(rolling_windows) > _NUMPY_MAX_WINDOW
+            or any(dtype not in _FLOAT_DTYPES for _, dtype in numeric)
+            or (include_lags and min(lag_periods, default=0) < 0)
+        ):
+            return None
+
+        n = len(df)
+        arrays = {}
+        for col, _ in numeric:
+            values = df[col].to_numpy().astype(np.float64, copy=False)
+            # Nulls come back as NaN; both need Polars' null/NaN semantics
+            if np.isnan(values).any():
+                return None
+            arrays[col] = values
+
+        series = []
+        for col, dtype in numeric:
+            values = arrays[col]
+            for window in rolling_windows:
+                outputs = [np.full(n, fill_null_value) for _ in range(4)]
+                if n >= window:
+                    for out, stat in zip(outputs, _rolling_stats(values, window), strict=True):
+                        out[window - 1 :] = stat
+                for name, out in zip(("mean", "std", "min", "max"), outputs, strict=True):
+                    series.append(pl.Series(f"{col}_rolling_{name}_{window}", out, dtype=dtype))
+
+            if include_lags:
+                for lag in lag_periods:
+                    out = np.full(n, fill_null_value)
+                    if lag < n:
+                        out[lag:] = values[: n - lag]
+                    series.append(pl.Series(f"{col}_lag_{lag}", out, dtype=dtype))
+
+        return df.with_columns(series)
+
+    def get_features_lazy(
+        self,
+        rolling_windows: list[int] | None = None,
+        include_lags: bool = True,
+        lag_periods: list[int] | None = None,
+        fill_null_value: float = 0.0,
+        fill_base_nulls: bool = False,
+    ) -> pl.LazyFrame:
+        """Build the rolling feature query without executing it.
+
+        Callers can compose further operations (tail, select, filter) before
+        collecting, so Polars' optimizer can push slices and projections down
+        and skip work on rows or columns that would be discarded.
+
+        Args:
+            Same as get_features().
+
+        Returns:
+            LazyFrame over a snapshot of the buffer with feature expressions applied
+        """
+        if rolling_windows is None:
+            rolling_windows = [5, 10, 20]
+        if lag_periods is None:
+            lag_periods = [1, 2, 3]
+
+        with self._lock:
+            df = self._frame()
+            if df is None or len(df) == 0:
+                return pl.LazyFrame()
+
+            # Appends replace self._df rather than mutating it, so the lazy
+            # plan stays valid after the lock is released
+            lazy_df = df.lazy()
 
             numeric_cols = [
-                col for col, dtype in self._df.schema.items() if dtype.is_numeric()
+                col for col, dtype in df.schema.items() if dtype.is_numeric()
             ]
 
-            if not numeric_cols:
-                return self._df.clone()
-
-            # Build expressions for lazy evaluation
-            # Polars will execute these in parallel across CPU cores
-            feature_exprs = []
-
-            for col in numeric_cols:
-                # Rolling statistics with SIMD vectorization
-                for window in rolling_windows:
-                    # Always compute, fill_null handles cold start
-                    feature_exprs.extend([
-                        pl.col(col).rolling_mean(window).fill_null(fill_null_value).alias(f"{col}_rolling_mean_{window}"),
-                        pl.col(col).rolling_std(window).fill_null(fill_null_value).alias(f"{col}_rolling_std_{window}"),
-                        pl.col(col).rolling_min(window).fill_null(fill_null_value).alias(f"{col}_rolling_min_{window}"),
-                        pl.col(col).rolling_max(window).fill_null(fill_null_value).alias(f"{col}_rolling_max_{window}"),
-                    ])
-
-                # Lag features
-                if include_lags:
-                    for lag in lag_periods:
-                        feature_exprs.append(
-                            pl.col(col).shift(lag).fill_null(fill_null_value).alias(f"{col}_lag_{lag}")
-                        )
-
-            if feature_exprs:
-                lazy_df = lazy_df.with_columns(feature_exprs)
-
-            # Collect triggers parallel execution
-            return lazy_df.collect()
+        if not numeric_cols:
+            return lazy_df
+
+        # Build expressions for lazy evaluation
+        # Polars will execute these in parallel across CPU cores
+        feature_exprs = []
+
+        for col in numeric_cols:
+            if fill_base_nulls:
+                feature_exprs.append(pl.col(col).fill_null(fill_null_value))
+
+            # Rolling statistics with SIMD vectorization
+            for window in rolling_windows:
+                # Always compute, fill_null handles cold start
+                feature_exprs.extend([
+                    pl.col(col).rolling_mean(window).fill_null(fill_null_value).alias(f"{col}_rolling_mean_{window}"),
+                    pl.col(col).rolling_std(window).fill_null(fill_null_value).alias(f"{col}_rolling_std_{window}"),
+                    pl.col(col).rolling_min(window).fill_null(fill_null_value).alias(f"{col}_rolling_min_{window}"),
+                    pl.col(col).rolling_max(window).fill_null(fill_null_value).alias(f"{col}_rolling_max_{window}"),
+                ])
+
+            # Lag features
+            if include_lags:
+                for lag in lag_periods:
+                    feature_exprs.append(
+                        pl.col(col).shift(lag).fill_null(fill_null_value).alias(f"{col}_lag_{lag}")
+                    )
+
+        if feature_exprs:
+            lazy_df = lazy_df.with_columns(feature_exprs)
+
+        return lazy_df
 
     def get_latest(
         self,
@@ -308,55 +572,67 @@ class PolarsBuffer:
             DataFrame with latest records
         """
         if with_features:
-            df = self.get_features(rolling_windows=rolling_windows)
-            return df.tail(n)
+            return self.get_features_lazy(rolling_windows=rolling_windows).tail(n).collect()
         else:
             with self._lock:
-                if self._df is None:
+                df = self._frame()
+                if df is None:
                     return pl.DataFrame()
-                return self._df.tail(n).clone()
+                return df.tail(n).clone()
 
     def clear(self) -> None:
         """Clear all data from the buffer."""
         with self._lock:
             self._df = None
+            self._pending = []
             self._append_count = 0
             self._total_append_time_ms = 0.0
+            self._cached_stats = None
 
     def get_stats(self) -> BufferStats:
         """Get buffer statistics.
 
+        The result is cached until the next append or clear, so frequent
+        polling does not re-walk the schema or re-estimate memory usage.
+
         Returns:
-            BufferStats object with current state
+            BufferStats object with current state (shared, do not mutate)
         """
         with self._lock:
-            if self._df is None:
-                return BufferStats(
-                    size=0,
-                    window_size=self._window_size,
-                    columns=[],
-                    numeric_columns=[],
-                    memory_bytes=0,
-                    append_count=self._append_count,
-                    avg_append_ms=0.0,
-                )
-
+            if self._cached_stats is None:
+                self._frame()
+                self._cached_stats = self._build_stats()
+            return self._cached_stats
+
+    def _build_stats(self) -> BufferStats:
+        """Compute buffer statistics. Caller must hold the lock."""
+        if self._df is None:
             return BufferStats(
-                size=len(self._df),
+                size=0,
                 window_size=self._window_size,
-                columns=self._df.columns,
-                numeric_columns=[
-                    col for col, dtype in self._df.schema.items()
-                    if dtype.is_numeric()
-                ],
-                memory_bytes=self._df.estimated_size("b"),
+                columns=[],
+                numeric_columns=[],
+                memory_bytes=0,
                 append_count=self._append_count,
-                avg_append_ms=(
-                    self._total_append_time_ms / self._append_count
-                    if self._append_count > 0 else 0.0
-                ),
+                avg_append_ms=0.0,
             )
 
+        return BufferStats(
+            size=len(self._df),
+            window_size=self._window_size,
+            columns=self._df.columns,
+            numeric_columns=[
+                col for col, dtype in self._df.schema.items()
+                if dtype.is_numeric()
+            ],
+            memory_bytes=self._df.estimated_size("b"),
+            append_count=self._append_count,
+            avg_append_ms=(
+                self._total_append_time_ms / self._append_count
+                if self._append_count > 0 else 0.0
+            ),
+        )
+
     def to_list(self) -> list[dict[str, Any]]:
         """Convert buffer to list of dictionaries.
 
@@ -364,9 +640,10 @@ class PolarsBuffer:
             List of record dictionaries
         """
         with self._lock:
-            if self._df is None:
+            df = self._frame()
+            if df is None:
                 return []
-            return self._df.to_dicts()
+            return df.to_dicts()
 
     def __len__(self) -> int:
         """Return current buffer size."""
@@ -17,12 +17,21 @@ Usage:
     )
 
     df_with_features = compute_features(df, config)
+
+    # Streaming: latest feature row in O(features) per point
+    state = IncrementalRollingState(rolling_windows=[5, 10, 20], max_rows=1000)
+    state.push({"value": 1.5})
+    X = state.vector(["value", "value_rolling_mean_5"])
 """
 
 import logging
+from collections import deque
 from dataclasses import dataclass, field
+from typing import Any
 
+import numpy as np
 import polars as pl
+from numpy.typing import DTypeLike
 
 logger = logging.getLogger(__name__)
 
@@ -296,3 +305,148 @@ def get_feature_names(
                 feature_names.append(f"{col}_ewm_mean_{span}")
 
     return feature_names
+
+
+class _WindowStats:
+    """Sliding-window mean/variance (Welford) and min/max (monotonic deques)."""
+
+    __slots__ = ("window", "n", "mean", "m2", "nulls", "mins", "maxs")
+
+    def __init__(self, window: int):
+        self.window = window
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.nulls = 0
+        self.mins: deque[tuple[int, float]] = deque()
+        self.maxs: deque[tuple[int, float]] = deque()
+
+    def push(self, t: int, value: float | None, expired: float | None, has_expired: bool) -> None:
+        if has_expired:
+            if expired is None:
+                self.nulls -= 1
+            else:
+                self.n -= 1
+                if self.n == 0:
+                    self.mean = self.m2 = 0.0
+                else:
+                    delta = expired - self.mean
+                    self.mean -= delta / self.n
+                    self.m2 -= delta * (expired - self.mean)
+        if value is None:
+            self.nulls += 1
+        else:
+            self.n += 1
+            delta = value - self.mean
+            self.mean += delta / self.n
+            self.m2 += delta * (value - self.mean)
+            while self.mins and self.mins[-1][1] >= value:
+                self.mins.pop()
+            self.mins.append((t, value))
+            while self.maxs and self.maxs[-1][1] <= value:
+                self.maxs.pop()
+            self.maxs.append((t, value))
+        oldest = t - self.window
+        while self.mins and self.mins[0][0] <= oldest:
+            self.mins.popleft()
+        while self.maxs and self.maxs[0][0] <= oldest:
+            self.maxs.popleft()
+
+
+class IncrementalRollingState:
+    """Online rolling/lag features for the most recent row of a stream.
+
+    Produces the same values as the last row of ``PolarsBuffer.get_features``
+    (a window holding a null, or not yet full, yields ``fill_null_value``)
+    without recomputing the whole buffer, so the per-point cost depends on
+    the number of features rather than on the buffer size.
+
+    Args:
+        rolling_windows: Window sizes for rolling stats (default: [5, 10, 20])
+        include_lags: Whether to include lag features
+        lag_periods: Lag periods to compute (default: [1, 2, 3])
+        max_rows: Rows the matching buffer keeps (None = unbounded)
+        fill_null_value: Value for features that are null in Polars
+    """
+
+    def __init__(
+        self,
+        rolling_windows: list[int] | None = None,
+        include_lags: bool = True,
+        lag_periods: list[int] | None = None,
+        max_rows: int | None = None,
+        fill_null_value: float = 0.0,
+    ):
+        self.rolling_windows = rolling_windows if rolling_windows is not None else [5, 10, 20]
+        self.lag_periods = (lag_periods if lag_periods is not None else [1, 2, 3]) if include_lags else []
+        self.max_rows = max_rows
+        self.fill_null_value = fill_null_value
+        self._lookback = max([*self.rolling_windows, *(lag + 1 for lag in self.lag_periods), 1])
+        self._rows = 0
+        self._values: dict[str, deque[float | None]] = {}
+        self._stats: dict[str, list[_WindowStats]] = {}
+
+    def push(self, record: dict[str, Any]) -> None:
+        """Advance the state by one record."""
+        t = self._rows
+        for col, value in record.items():
+            if col not in self._values and isinstance(value, (int, float)) and not isinstance(value, bool):
+                # Column first seen now: earlier rows are null, as in diagonal concat
+                self._values[col] = deque([None] * min(t, self._lookback), maxlen=self._lookback)
+                self._stats[col] = [_WindowStats(w) for w in self.rolling_windows]
+                for stats in self._stats[col]:
+                    stats.nulls = min(t, stats.window)
+
+        for col, values in self._values.items():
+            value = record.get(col)
+            value = float(value) if isinstance(value, (int, float)) else None
+            for stats in self._stats[col]:
+                has_expired = len(values) >= stats.window
+                stats.push(t, value, values[-stats.window] if has_expired else None, has_expired)
+            values.append(value)
+        self._rows += 1
+
+    def features(self) -> dict[str, float]:
+        """Feature values for the latest row, keyed like ``get_features`` columns."""
+        fill = self.fill_null_value
+        available = self._rows if self.max_rows is None else min(self._rows, self.max_rows)
+        out: dict[str, float] = {}
+        for col, values in self._values.items():
+            latest = values[-1] if values else None
+            out[col] = fill if latest is None else latest
+            for stats in self._stats[col]:
+                w = stats.window
+                if available >= w and stats.nulls == 0:
+                    mean = stats.mean
+                    std = float(np.sqrt(max(stats.m2, 0.0) / (w - 1))) if w > 1 else fill
+                    low, high = stats.mins[0][1], stats.maxs[0][1]
+                else:
+                    mean = std = low = high = fill
+                out[f"{col}_rolling_mean_{w}"] = mean
+                out[f"{col}_rolling_std_{w}"] = std
+                out[f"{col}_rolling_min_{w}"] = low
+                out[f"{col}_rolling_max_{w}"] = high
+            for lag in self.lag_periods:
+                lagged = values[-1 - lag] if available > lag else None
+                out[f"{col}_lag_{lag}"] = fill if lagged is None else lagged
+        return out
+
+    def vector(
+        self, columns: list[str], dtype: DTypeLike = np.float64
+    ) -> np.ndarray | None:
+        """Latest feature row as a ``(1, len(columns))`` array.
+
+        Returns None if a column is not tracked, so the caller can fall back
+        to the batch computation.
+        """
+        feats = self.features()
+        try:
+            return np.array([[feats[c] for c in columns]], dtype=dtype)
+        except KeyError:
+            return None
+
+    def clear(self) -> None:
+        """Forget all history."""
+        self._rows = 0
+        self._values.clear()
+        self._stats.clear()